@@ -0,0 +1,70 @@
+"""
+Compare the per-frame canvas matrix rain with the persistent engine.
+
+``legacy_matrix_rain`` reproduces the earlier generator: it builds a fresh
+``width x height`` canvas every frame and relies on ``FrameRenderer`` to
+diff whole rows. ``MatrixRain.payloads`` keeps its state between frames
+and emits updates for the dirty cells only. Both are timed including the
+terminal payload, at growing terminal sizes, with the engine drawing its
+much longer trails, plain and colored.
+
+Run with ``python benchmarks/bench_matrix_rain.py``.
+"""
+
+import random
+import timeit
+from typing import Callable, Iterator, List
+
+from starpatterns.patterns.rain import MatrixRain
+from starpatterns.utils.renderer import FrameRenderer
+
+FRAMES = 200
+SIZES = ((80, 24), (200, 60), (400, 120))
+_GLYPHS = bytes(b"0123456789ABCDEF"[value & 15] for value in range(256))
+
+
+def legacy_matrix_rain(width: int, height: int, frames: int, seed: int = 0) -> Iterator[List[str]]:
+    rng = random.Random(seed)
+    heads = [rng.randint(-height, 0) for _ in range(width)]
+    blank = b" " * (width * height)
+    for _ in range(frames):
+        glyphs = rng.getrandbits(8 * width).to_bytes(width, "little").translate(_GLYPHS)
+        canvas = bytearray(blank)
+        for col, head in enumerate(heads):
+            if 0 <= head < height:
+                canvas[head * width + col] = glyphs[col]
+            if 0 < head <= height:
+                canvas[(head - 1) * width + col] = 46
+            head += 1
+            if head > height + 2 and head > height + rng.randint(2, 6):
+                head = rng.randint(-height, 0)
+            heads[col] = head
+        text = canvas.decode("ascii")
+        yield [text[row : row + width] for row in range(0, width * height, width)]
+
+
+def _legacy(width: int, height: int) -> int:
+    renderer = FrameRenderer()
+    return sum(len(renderer.render(lines)) for lines in legacy_matrix_rain(width, height, FRAMES))
+
+
+def _engine(width: int, height: int, color: bool) -> int:
+    rain = MatrixRain(width, height, color=color, seed=0)
+    return sum(len(payload) for payload in rain.payloads(FRAMES))
+
+
+def _time(func: Callable[[], object], repeat: int = 3) -> float:
+    return min(timeit.repeat(func, repeat=repeat, number=1)) / FRAMES * 1000
+
+
+def main() -> None:
+    print(f"{'grid':>8} {'canvas ms':>10} {'engine ms':>10} {'color ms':>9} {'speedup':>8}")
+    for width, height in SIZES:
+        old = _time(lambda: _legacy(width, height))
+        new = _time(lambda: _engine(width, height, False))
+        colored = _time(lambda: _engine(width, height, True))
+        print(f"{f'{width}x{height}':>8} {old:>10.3f} {new:>10.3f} {colored:>9.3f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
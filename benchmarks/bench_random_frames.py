@@ -0,0 +1,83 @@
+"""
+Compare per-cell random draws with the batched frame generators.
+
+The ``legacy_*`` functions reproduce the earlier generators, which called
+the module-level ``random`` once per cell or bar. They are timed against
+``matrix_rain_frames``, ``equalizer_frames`` and ``falling_sand_frames``,
+which draw a whole frame's randomness in one call, at growing grid sizes.
+
+Run with ``python benchmarks/bench_random_frames.py``.
+"""
+
+import random
+import timeit
+from typing import Callable, Iterator, List
+
+from starpatterns.patterns.frames import equalizer_frames, falling_sand_frames, matrix_rain_frames
+
+FRAMES = 50
+SIZES = ((40, 12), (200, 60), (400, 120))
+
+
+def legacy_matrix_rain(width: int, height: int, frames: int) -> Iterator[List[str]]:
+    heads = [random.randint(-height, 0) for _ in range(width)]
+    chars = "0123456789ABCDEF"
+    for _ in range(frames):
+        grid = [[" "] * width for _ in range(height)]
+        for col in range(width):
+            head = heads[col]
+            if 0 <= head < height:
+                grid[head][col] = random.choice(chars)
+            if 0 <= head - 1 < height:
+                grid[head - 1][col] = "."
+            heads[col] += 1
+            if heads[col] > height + random.randint(2, 6):
+                heads[col] = random.randint(-height, 0)
+        yield ["".join(row) for row in grid]
+
+
+def legacy_equalizer(bars: int, height: int, frames: int) -> Iterator[List[str]]:
+    for _ in range(frames):
+        bar_heights = [random.randint(1, height) for _ in range(bars)]
+        yield [" ".join("#" if h >= row else " " for h in bar_heights) for row in range(height, 0, -1)]
+
+
+def legacy_falling_sand(width: int, height: int, frames: int, density: float = 0.2) -> Iterator[List[str]]:
+    grid = [[" "] * width for _ in range(height)]
+    for _ in range(frames):
+        for col in range(width):
+            if random.random() < density:
+                grid[0][col] = "."
+        for row in range(height - 2, -1, -1):
+            above, below = grid[row], grid[row + 1]
+            for col in range(width):
+                if above[col] != " " and below[col] == " ":
+                    below[col] = above[col]
+                    above[col] = " "
+        yield ["".join(line) for line in grid]
+
+
+def _time(func: Callable[[], object], repeat: int = 3) -> float:
+    return min(timeit.repeat(func, repeat=repeat, number=1)) / FRAMES * 1000
+
+
+def main() -> None:
+    random.seed(0)
+    scenarios = (
+        ("matrix_rain", legacy_matrix_rain, lambda w, h: matrix_rain_frames(w, h, FRAMES, seed=0)),
+        ("equalizer", legacy_equalizer, lambda w, h: equalizer_frames(w // 2, h, FRAMES, seed=0)),
+        ("falling_sand", legacy_falling_sand, lambda w, h: falling_sand_frames(w, h, FRAMES, seed=0)),
+    )
+    print(f"{'animation':<13} {'grid':>8} {'per-cell ms':>12} {'batched ms':>11} {'speedup':>8}")
+    for name, legacy, batched in scenarios:
+        for width, height in SIZES:
+            if name == "equalizer":
+                old = _time(lambda: sum(1 for _ in legacy(width // 2, height, FRAMES)))
+            else:
+                old = _time(lambda: sum(1 for _ in legacy(width, height, FRAMES)))
+            new = _time(lambda: sum(1 for _ in batched(width, height)))
+            print(f"{name:<13} {f'{width}x{height}':>8} {old:>12.3f} {new:>11.3f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Check that recording a 10,000-frame animation takes well under a second.
+
+Each animation is recorded with its default size into ``os.devnull``, in
+both the ``asciicast`` and the ``delta`` format, and the best of a few
+runs is compared with ``TARGET`` seconds. Randomised animations are
+seeded. The script exits with status 1 if any recording misses the
+target, so it can gate a change.
+
+Run with ``python benchmarks/bench_record.py [--frames N] [--target S]``.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from typing import Any, Callable, Dict, Tuple
+
+from starpatterns.patterns import animation
+from starpatterns.record import record
+
+TARGET = 1.0
+
+
+def scenarios(frames: int) -> Dict[str, Tuple[Callable[..., Any], Dict[str, Any]]]:
+    """Arguments that make each animation run for ``frames`` frames."""
+    return {
+        "spinner": (animation.spinner, {"duration": frames * 0.1, "interval": 0.1}),
+        "snake_line": (animation.snake_line, {"frames": frames}),
+        "dna_helix": (animation.dna_helix, {"frames": frames}),
+        "fireworks": (animation.fireworks, {"bursts": frames // 10, "size": 20}),
+        "orbit": (animation.orbit, {"frames": frames}),
+        "equalizer": (animation.equalizer, {"frames": frames, "seed": 0}),
+        "twinkle_stars": (animation.twinkle_stars, {"frames": frames, "seed": 0}),
+        "matrix_rain": (animation.matrix_rain, {"frames": frames, "seed": 0}),
+        "matrix_rain color": (animation.matrix_rain, {"frames": frames, "seed": 0, "color": True}),
+        "falling_sand": (animation.falling_sand, {"frames": frames, "seed": 0}),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=10_000)
+    parser.add_argument("--target", type=float, default=TARGET)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(f"{args.frames:,} frames; target {args.target:.2f} s")
+    print(f"{'animation':<18} {'events':>7} {'asciicast s':>12} {'delta s':>9}")
+    missed = []
+    for name, (func, kwargs) in scenarios(args.frames).items():
+        events = record(func, os.devnull, **kwargs).events
+        row = []
+        for format in ("asciicast", "delta"):
+            seconds = min(
+                timeit.repeat(lambda: record(func, os.devnull, format=format, **kwargs), repeat=args.repeat, number=1)
+            )
+            row.append(seconds)
+            if seconds > args.target:
+                missed.append(f"{name} ({format})")
+        print(f"{name:<18} {events:>7,} {row[0]:>12.3f} {row[1]:>9.3f}")
+    if missed:
+        print("over target: " + ", ".join(missed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
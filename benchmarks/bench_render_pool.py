@@ -0,0 +1,89 @@
+"""
+Time offline rendering with one process against a process pool.
+
+Four scenes are rendered to ``os.devnull`` in the ``raw`` format:
+
+* a seeded ``matrix_rain_frames`` at 300 columns,
+* an indexed scene that pans a viewport across a large Sierpinski
+  triangle, computed directly from the frame index, and
+* the library's indexed ``fireworks_frame`` and ``orbit_frame``.
+
+Before timing, each indexed scene is rendered in small chunks with one
+worker and with a pool, and the two recordings must be byte-for-byte
+equal.
+
+Each runs with ``workers=1`` (in process) and with a pool of
+``os.cpu_count()`` workers (or ``--workers``). Rendering is CPU bound and
+chunks are independent, so the speedup should approach the worker count.
+
+Run with ``python benchmarks/bench_render_pool.py [--frames N] [--workers N]``.
+"""
+
+import argparse
+import io
+import os
+import time
+from functools import lru_cache
+from typing import List
+
+from starpatterns.patterns.fractal import sierpinski
+from starpatterns.patterns.frames import fireworks_frame, matrix_rain_frames, orbit_frame
+from starpatterns.render import IndexedScene, SeededScene, render
+
+VIEW_WIDTH = 200
+VIEW_HEIGHT = 60
+
+
+@lru_cache(maxsize=None)
+def _art(order: int) -> List[str]:
+    lines = sierpinski(order).splitlines()
+    width = max(len(line) for line in lines)
+    return [line.ljust(width) for line in lines]
+
+
+def sierpinski_pan(index: int, order: int) -> List[str]:
+    art = _art(order)
+    top = index % (len(art) - VIEW_HEIGHT)
+    left = (index * 2) % (len(art[0]) - VIEW_WIDTH)
+    return [line[left : left + VIEW_WIDTH] for line in art[top : top + VIEW_HEIGHT]]
+
+
+def _check(scene: IndexedScene, workers: int) -> None:
+    """Assert that a pool renders ``scene`` exactly as one worker does."""
+    outputs = []
+    for count in (1, max(workers, 2)):
+        buffer = io.StringIO()
+        render(scene, buffer, delay=0.05, chunk_size=37, workers=count)
+        outputs.append(buffer.getvalue())
+    assert outputs[0] == outputs[1], f"{scene.frame.__name__}: pooled output differs"
+
+
+def _time(scene, workers: int) -> float:
+    start = time.perf_counter()
+    render(scene, os.devnull, format="raw", chunk_size=250, workers=workers, seed=0)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=4000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    scenes = (
+        ("matrix_rain 300x80", SeededScene(matrix_rain_frames, args.frames, width=300, height=80, warmup=80)),
+        ("sierpinski pan", IndexedScene(sierpinski_pan, args.frames, 9)),
+        ("fireworks 121x121", IndexedScene(fireworks_frame, args.frames, size=121)),
+        ("orbit r=40", IndexedScene(orbit_frame, args.frames, 40, 360)),
+    )
+    for _, scene in scenes:
+        if isinstance(scene, IndexedScene):
+            _check(IndexedScene(scene.frame, 300, *scene.args, **scene.kwargs), args.workers)
+    print(f"{'scene':<20} {'1 worker s':>11} {f'{args.workers} workers s':>12} {'speedup':>8}")
+    for name, scene in scenes:
+        serial = _time(scene, 1)
+        pooled = _time(scene, args.workers)
+        print(f"{name:<20} {serial:>11.2f} {pooled:>12.2f} {serial / pooled:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compare per-cell row building with the span engine for round shapes.
+
+The per-cell builder tests every cell of a row against the shape and
+appends one character at a time, as the patterns used to. The span
+engine solves each row's edges once and assembles it from a few
+``char * run`` slices. Both draw the same ellipse and ring at a fixed
+height and growing widths; the per-cell cost grows with the width, the
+span cost per row stays flat apart from copying the characters.
+
+Run with ``python benchmarks/bench_shapes.py``.
+"""
+
+import timeit
+from typing import Callable, Iterator, List
+
+from starpatterns.patterns.shapes import Shape, ellipse_shape, ring_shape
+
+HEIGHT = 21
+WIDTHS = (100, 1_000, 10_000, 100_000)
+THICKNESS = 3
+
+
+def per_cell(shape: Shape) -> Iterator[str]:
+    """Rebuild ``shape`` by testing and appending every cell."""
+    width = shape.width
+    for row in range(shape.height):
+        spans = shape.spans(row)
+        cells: List[str] = []
+        for col in range(width):
+            cells.append("*" if any(start <= col < end for start, end in spans) else " ")
+        yield "".join(cells)
+
+
+def _time(func: Callable[[], object], repeat: int = 3) -> float:
+    return min(timeit.repeat(func, repeat=repeat, number=1)) / HEIGHT * 1e6
+
+
+def main() -> None:
+    print(f"{HEIGHT} rows; microseconds per row")
+    print(f"{'shape':<8} {'width':>8} {'per cell':>12} {'spans':>10} {'speedup':>9}")
+    for name, make in (
+        ("ellipse", lambda width: ellipse_shape(width, HEIGHT)),
+        ("ring", lambda width: ring_shape(width, HEIGHT, THICKNESS)),
+    ):
+        for width in WIDTHS:
+            shape = make(width)
+            assert list(per_cell(shape)) == list(shape.lines())
+            slow = _time(lambda: list(per_cell(shape)), repeat=1 if width >= 100_000 else 3)
+            fast = _time(lambda: list(shape.lines()))
+            print(f"{name:<8} {width:>8,} {slow:>12.1f} {fast:>10.2f} {slow / fast:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare per-character ``rgb()`` wrapping with run-length SGR coalescing.
+
+Builds a 200x60 frame three ways (one color per column, 16-color bands,
+and a matrix-rain-like two-style screen) and reports bytes per frame and
+build time for the naive approach and for ``styled_line``.
+
+Output is pinned to 24-bit color so numbers do not depend on ``TERM``.
+Run with ``python benchmarks/bench_styled_line.py``.
+"""
+
+import colorsys
+import random
+import timeit
+from typing import Callable, List, Optional, Tuple
+
+from starpatterns.utils.colors import Style, rgb, set_color_depth, style, styled_line
+
+WIDTH, HEIGHT = 200, 60
+
+Cell = Tuple[str, Optional[Tuple[int, int, int]]]
+
+
+def _hue(fraction: float) -> Tuple[int, int, int]:
+    r, g, b = colorsys.hsv_to_rgb(fraction, 1.0, 1.0)
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
+def gradient() -> List[List[Cell]]:
+    colors = [_hue(col / WIDTH) for col in range(WIDTH)]
+    return [[("#", colors[col]) for col in range(WIDTH)] for _ in range(HEIGHT)]
+
+
+def bands() -> List[List[Cell]]:
+    colors = [_hue((col * 16 // WIDTH) / 16) for col in range(WIDTH)]
+    return [[("#", colors[col]) for col in range(WIDTH)] for _ in range(HEIGHT)]
+
+
+def matrix() -> List[List[Cell]]:
+    rng = random.Random(7)
+    rows: List[List[Cell]] = []
+    for _ in range(HEIGHT):
+        row: List[Cell] = []
+        for _ in range(WIDTH):
+            roll = rng.random()
+            if roll < 0.55:
+                row.append((" ", None))
+            elif roll < 0.97:
+                row.append((chr(rng.randint(33, 126)), (0, 160, 0)))
+            else:
+                row.append((chr(rng.randint(33, 126)), (200, 255, 200)))
+        rows.append(row)
+    return rows
+
+
+def naive(frame: List[List[Cell]]) -> List[str]:
+    return ["".join(rgb(ch, *color) if color else ch for ch, color in row) for row in frame]
+
+
+def coalesced(frame: List[List[Cell]]) -> List[str]:
+    styled = [[(ch, style(fg=color) if color else None) for ch, color in row] for row in frame]
+    return [styled_line(row) for row in styled]
+
+
+def coalesced_prestyled(frame: List[List[Tuple[str, Optional[Style]]]]) -> List[str]:
+    return [styled_line(row) for row in frame]
+
+
+def _time(func: Callable[[], object], repeat: int = 5, number: int = 5) -> float:
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1000
+
+
+def main() -> None:
+    set_color_depth("truecolor")
+    print(f"{WIDTH}x{HEIGHT} frame")
+    print(f"{'scenario':<10} {'method':<22} {'bytes/frame':>12} {'ms/frame':>9}")
+    for name, build in (("gradient", gradient), ("bands", bands), ("matrix", matrix)):
+        frame = build()
+        visible = WIDTH * HEIGHT
+        prestyled = [[(ch, style(fg=color) if color else None) for ch, color in row] for row in frame]
+        for method, func, arg in (
+            ("rgb() per char", naive, frame),
+            ("styled_line", coalesced, frame),
+            ("styled_line (styled)", coalesced_prestyled, prestyled),
+        ):
+            size = sum(len(line.encode()) for line in func(arg))  # type: ignore[arg-type]
+            elapsed = _time(lambda: func(arg))  # type: ignore[arg-type]
+            print(f"{name:<10} {method:<22} {size:>12,} {elapsed:>9.2f}")
+        print(f"{name:<10} {'visible characters':<22} {visible:>12,}")
+
+
+if __name__ == "__main__":
+    main()
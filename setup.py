@@ -14,6 +14,7 @@ setup(
     license="MIT",
     packages=find_packages(exclude=("tests",)),
     python_requires=">=3.8",
+    extras_require={"numpy": ["numpy>=1.17"]},
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python",
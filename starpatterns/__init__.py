@@ -2,46 +2,102 @@
 starpatterns package entrypoint.
 
 Provides convenient imports for patterns, fractals, animations, and utilities.
+Exports are resolved lazily on first access.
 """
 
-from importlib.metadata import version, PackageNotFoundError
+from __future__ import annotations
 
-from .patterns.basic import triangle, square, diamond
-from .patterns.advanced import hollow_square, cross, hourglass
-from .patterns.fractal import sierpinski
-from .patterns.animation import (
-    bar_wave,
-    bouncing_ball,
-    bouncing_text,
-    carousel,
-    blinking_text,
-    countdown,
-    dna_helix,
-    equalizer,
-    falling_sand,
-    fireworks,
-    loading_bar,
-    marquee,
-    matrix_rain,
-    orbit,
-    progress_dots,
-    pulse_text,
-    rising_bar,
-    ripple_line,
-    shooting_star,
-    snake_line,
-    spinner,
-    twinkle_stars,
-    typing_text,
-    wave_text,
-)
-from .utils.colors import colorize, rgb
-from .utils.terminal import clear_terminal
+from typing import TYPE_CHECKING, Any
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .patterns.basic import triangle, square, diamond
+    from .patterns.advanced import hollow_square, cross, hourglass
+    from .patterns.shapes import circle, ellipse, ring, star, polygon
+    from .patterns.fractal import sierpinski
+    from .patterns.animation import (
+        bar_wave,
+        bouncing_ball,
+        bouncing_text,
+        carousel,
+        blinking_text,
+        countdown,
+        dna_helix,
+        equalizer,
+        falling_sand,
+        fireworks,
+        loading_bar,
+        marquee,
+        matrix_rain,
+        orbit,
+        progress_dots,
+        pulse_text,
+        rising_bar,
+        ripple_line,
+        shooting_star,
+        snake_line,
+        spinner,
+        twinkle_stars,
+        typing_text,
+        wave_text,
+    )
+    from .utils.colors import colorize, rgb
+    from .utils.terminal import clear_terminal
+
+# Submodule providing each public name; nothing below is imported until
+# first use, so ``from starpatterns import colorize`` stays cheap.
+_EXPORTS = {
+    ".patterns.basic": ("triangle", "square", "diamond"),
+    ".patterns.advanced": ("hollow_square", "cross", "hourglass"),
+    ".patterns.shapes": ("circle", "ellipse", "ring", "star", "polygon"),
+    ".patterns.fractal": ("sierpinski",),
+    ".patterns.animation": (
+        "bar_wave",
+        "bouncing_ball",
+        "bouncing_text",
+        "carousel",
+        "blinking_text",
+        "countdown",
+        "dna_helix",
+        "equalizer",
+        "falling_sand",
+        "fireworks",
+        "loading_bar",
+        "marquee",
+        "matrix_rain",
+        "orbit",
+        "progress_dots",
+        "pulse_text",
+        "rising_bar",
+        "ripple_line",
+        "shooting_star",
+        "snake_line",
+        "spinner",
+        "twinkle_stars",
+        "typing_text",
+        "wave_text",
+    ),
+    ".utils.colors": ("colorize", "rgb"),
+    ".utils.terminal": ("clear_terminal",),
+}
+
+_lazy_getattr, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # importlib.metadata scans installed distributions; only pay for it on request.
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("starpatterns")
+        except PackageNotFoundError:  # Local, editable installs
+            value = "0.0.0"
+        globals()["__version__"] = value
+        return value
+    return _lazy_getattr(name)
 
-try:
-    __version__ = version("starpatterns")
-except PackageNotFoundError:  # Local, editable installs
-    __version__ = "0.0.0"
 
 __all__ = [
     "triangle",
@@ -50,6 +106,11 @@ __all__ = [
     "hollow_square",
     "cross",
     "hourglass",
+    "circle",
+    "ellipse",
+    "ring",
+    "star",
+    "polygon",
     "sierpinski",
     "wave_text",
     "bouncing_ball",
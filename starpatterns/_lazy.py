@@ -0,0 +1,48 @@
+"""
+Lazy re-exports for package ``__init__`` modules.
+
+A package lists which submodule defines each public name; the submodule
+is imported the first time one of its names is looked up (PEP 562), and
+the value is then stored in the package namespace so later lookups are
+plain attribute reads.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(
+    package: str,
+    namespace: Dict[str, Any],
+    exports: Dict[str, Sequence[str]],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for ``package``.
+
+    Args:
+        package: The package's ``__name__``.
+        namespace: The package's ``globals()``; resolved names are cached here.
+        exports: Relative submodule name (e.g. ``".basic"``) mapped to the
+            names it provides. A submodule listed with no names is itself
+            exported under its own name.
+    """
+    origin: Dict[str, str] = {}
+    for module, names in exports.items():
+        for name in names or (module.lstrip("."),):
+            origin[name] = module
+
+    def __getattr__(name: str) -> Any:
+        module = origin.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        imported = import_module(module, package)
+        value = imported if module.lstrip(".") == name else getattr(imported, name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(origin))
+
+    return __getattr__, __dir__
@@ -0,0 +1,527 @@
+"""
+asyncio versions of the terminal animations.
+
+Every coroutine mirrors the function of the same name in
+:mod:`starpatterns.patterns.animation` but waits with ``asyncio.sleep`` and
+hands each frame write to the default executor, so the event loop keeps
+serving other tasks. Cancelling the task stops the animation immediately
+and still prints its closing line.
+
+Example::
+
+    async with spinning("Fetching"):
+        await fetch_everything()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .patterns import cycles as _cycles
+from .patterns import frames as _frames
+from .patterns import rain as _rain
+from .patterns.animation import _check_delay
+from .utils.renderer import FrameRenderer
+from .utils.scheduler import FrameScheduler
+from .utils.sink import Sink, StreamSink
+
+
+class _Writer:
+    """
+    Hand writes to the default executor one at a time.
+
+    The write in flight is shielded, so cancelling the task does not let a
+    closing payload overtake it; :meth:`close` waits for it first.
+    """
+
+    def __init__(self, sink: Sink) -> None:
+        self.sink = sink
+        self.pending: Optional[asyncio.Future] = None
+
+    async def write(self, data: str) -> None:
+        """Write ``data`` to the sink off the event loop thread."""
+        await self._send(self.sink.write, data)
+
+    async def write_bytes(self, payload: bytes) -> None:
+        """Write an encoded ``payload`` to the sink off the event loop thread."""
+        await self._send(self.sink.write_bytes, payload)
+
+    async def close(self, end: str) -> None:
+        """Let the write in flight land, then write ``end`` the same way."""
+        if self.pending is not None and not self.pending.done():
+            await asyncio.wait((self.pending,))
+        await self._send(self.sink.write, end)
+
+    async def _send(self, write: Callable[[Any], None], data: Any) -> None:
+        self.pending = asyncio.get_running_loop().run_in_executor(None, write, data)
+        await asyncio.shield(self.pending)
+
+
+async def _play_lines(
+    frames: Iterable[str],
+    delay: float,
+    end: str,
+    scheduler: Optional[FrameScheduler],
+    sink: Optional[Sink] = None,
+    duration: Optional[float] = None,
+) -> None:
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    sink = sink if sink is not None else StreamSink()
+    writer = _Writer(sink)
+    try:
+        async for frame in scheduler.apace(frames, delay, duration, sink):
+            await writer.write("\r" + frame)
+    finally:
+        await writer.close(end)
+
+
+async def _play_grid(
+    frames: Iterable[List[str]],
+    height: int,
+    delay: float,
+    renderer: Optional[FrameRenderer],
+    scheduler: Optional[FrameScheduler],
+    sink: Optional[Sink] = None,
+) -> None:
+    renderer = renderer if renderer is not None else FrameRenderer()
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    sink = sink if sink is not None else StreamSink()
+    renderer.reset()
+    writer = _Writer(sink)
+    if not sink.fullscreen:
+        await writer.write("\n" * height)
+    try:
+        async for lines in scheduler.apace(frames, delay, sink=sink):
+            await writer.write(renderer.render(lines))
+    finally:
+        await writer.close(renderer.finish() + "\n")
+
+
+async def _play_cycle(
+    cycle: _cycles.FrameCycle,
+    count: int,
+    delay: float,
+    scheduler: Optional[FrameScheduler],
+    sink: Optional[Sink],
+) -> None:
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    sink = sink if sink is not None else StreamSink()
+    writer = _Writer(sink)
+    if cycle.start and not sink.fullscreen:
+        await writer.write_bytes(cycle.start)
+    try:
+        async for payload in scheduler.apace(cycle.payloads(count), delay, sink=sink):
+            await writer.write_bytes(payload)
+    finally:
+        await writer.close(cycle.end.decode("utf-8"))
+
+
+async def _play_rain(
+    rain: _rain.MatrixRain,
+    frames: int,
+    delay: float,
+    scheduler: Optional[FrameScheduler],
+    sink: Optional[Sink],
+) -> None:
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    sink = sink if sink is not None else StreamSink()
+    writer = _Writer(sink)
+    if not sink.fullscreen:
+        await writer.write("\n" * rain.height)
+    try:
+        async for payload in scheduler.apace(rain.payloads(frames), delay, sink=sink):
+            await writer.write(payload)
+    finally:
+        await writer.close(rain.finish() + "\n")
+
+
+async def wave_text(
+    text: str,
+    amplitude: int = 2,
+    speed: float = 0.08,
+    cycles: int = 2,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.wave_text`."""
+    source = _frames.wave_text_frames(text, amplitude, cycles)
+    _check_delay(speed, "speed")
+    await _play_lines(source, speed, "\r" + text + "\n", scheduler, sink)
+
+
+async def bouncing_ball(
+    width: int = 20,
+    height: int = 5,
+    frames: int = 80,
+    delay: float = 0.05,
+    char: str = "o",
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.bouncing_ball`."""
+    source = _frames.bouncing_ball_frames(width, height, frames, char)
+    await _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+async def spinner(
+    text: str = "Loading",
+    duration: Optional[float] = None,
+    interval: float = 0.1,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """
+    Awaitable spinner that runs until cancelled or for ``duration`` seconds.
+
+    Args:
+        text: Text to render beside the spinner.
+        duration: Total time to animate in seconds; ``None`` spins until the
+            task is cancelled.
+        interval: Delay between frames in seconds.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
+    """
+    if duration is not None and duration <= 0:
+        raise ValueError("duration must be positive")
+    _check_delay(interval, "interval")
+    end = "\r[done] " + text + " " * 3 + "\n"
+    await _play_lines(_frames.spinner_frames(text), interval, end, scheduler, sink, duration)
+
+
+async def loading_bar(
+    width: int = 30,
+    duration: float = 2.0,
+    char: str = "#",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.loading_bar`."""
+    source = _frames.loading_bar_frames(width, char)
+    if duration <= 0:
+        raise ValueError("duration must be positive")
+    await _play_lines(source, duration / width, "\n", scheduler, sink)
+
+
+async def typing_text(
+    text: str,
+    interval: float = 0.05,
+    cursor: str = "|",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.typing_text`."""
+    _check_delay(interval, "interval")
+    await _play_lines(_frames.typing_text_frames(text, cursor), interval, "\r" + text + "\n", scheduler, sink)
+
+
+async def blinking_text(
+    text: str,
+    blinks: int = 6,
+    interval: float = 0.3,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.blinking_text`."""
+    source = _frames.blinking_text_frames(text, blinks)
+    _check_delay(interval, "interval")
+    await _play_lines(source, interval, "\r" + text + "\n", scheduler, sink)
+
+
+async def marquee(
+    text: str,
+    width: int = 30,
+    cycles: int = 3,
+    speed: float = 0.05,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.marquee`."""
+    source = _frames.marquee_frames(text, width, cycles)
+    _check_delay(speed, "speed")
+    await _play_lines(source, speed, "\r" + " " * width + "\r", scheduler, sink)
+
+
+async def bouncing_text(
+    text: str,
+    width: int = 30,
+    frames: int = 60,
+    delay: float = 0.05,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.bouncing_text`."""
+    source = _frames.bouncing_text_frames(text, width, frames)
+    _check_delay(delay)
+    await _play_lines(source, delay, "\r" + text + "\n", scheduler, sink)
+
+
+async def pulse_text(
+    text: str,
+    min_spaces: int = 0,
+    max_spaces: int = 6,
+    cycles: int = 6,
+    delay: float = 0.06,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.pulse_text`."""
+    source = _frames.pulse_text_frames(text, min_spaces, max_spaces, cycles)
+    _check_delay(delay)
+    await _play_lines(source, delay, "\r" + text + "\n", scheduler, sink)
+
+
+async def snake_line(
+    width: int = 30,
+    length: int = 8,
+    frames: int = 100,
+    delay: float = 0.04,
+    head: str = "O",
+    body: str = "o",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.snake_line`."""
+    source = _frames.snake_line_frames(width, length, frames, head, body)
+    await _play_lines(source, delay, "\n", scheduler, sink)
+
+
+async def progress_dots(
+    text: str = "Loading",
+    dots: int = 3,
+    cycles: int = 5,
+    delay: float = 0.3,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.progress_dots`."""
+    source = _frames.progress_dots_frames(text, dots, cycles)
+    _check_delay(delay)
+    await _play_lines(source, delay, "\r" + text + "." * dots + "\n", scheduler, sink)
+
+
+async def countdown(seconds: int = 5, scheduler: Optional[FrameScheduler] = None, sink: Optional[Sink] = None) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.countdown`."""
+    await _play_lines(_frames.countdown_frames(seconds), 1, "\rGo!        \n", scheduler, sink)
+
+
+async def ripple_line(
+    width: int = 40,
+    frames: int = 80,
+    delay: float = 0.04,
+    char: str = "*",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.ripple_line`."""
+    source = _frames.ripple_line_frames(width, frames, char)
+    _check_delay(delay)
+    await _play_lines(source, delay, "\n", scheduler, sink)
+
+
+async def bar_wave(
+    width: int = 30,
+    frames: int = 80,
+    delay: float = 0.05,
+    char: str = "|",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.bar_wave`."""
+    source = _frames.bar_wave_frames(width, frames, char)
+    _check_delay(delay)
+    await _play_lines(source, delay, "\n", scheduler, sink)
+
+
+async def matrix_rain(
+    width: int = 40,
+    height: int = 12,
+    frames: int = 80,
+    delay: float = 0.05,
+    seed: Optional[Union[int, random.Random]] = None,
+    trail: Tuple[int, int] = (4, 16),
+    speed: Tuple[float, float] = (0.35, 1.0),
+    color: bool = False,
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.matrix_rain`."""
+    if renderer is not None:
+        if color:
+            raise ValueError("renderer cannot diff colored frames; omit it when color=True")
+        source = _frames.matrix_rain_frames(width, height, frames, seed, trail, speed)
+        _check_delay(delay)
+        await _play_grid(source, height, delay, renderer, scheduler, sink)
+        return
+    if width <= 0 or height <= 0 or frames <= 0:
+        raise ValueError("width, height, and frames must be positive")
+    rain = _rain.MatrixRain(width, height, trail, speed, color=color, seed=seed)
+    _check_delay(delay)
+    await _play_rain(rain, frames, delay, scheduler, sink)
+
+
+async def equalizer(
+    bars: int = 16,
+    height: int = 8,
+    frames: int = 80,
+    delay: float = 0.05,
+    char: str = "#",
+    seed: Optional[Union[int, random.Random]] = None,
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.equalizer`."""
+    source = _frames.equalizer_frames(bars, height, frames, char, seed)
+    _check_delay(delay)
+    await _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+async def fireworks(
+    bursts: int = 4,
+    size: int = 12,
+    delay: float = 0.12,
+    char: str = "*",
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.fireworks`."""
+    source = _frames.fireworks_frames(bursts, size, char)
+    _check_delay(delay)
+    await _play_grid(source, size, delay, renderer, scheduler, sink)
+
+
+async def twinkle_stars(
+    width: int = 40,
+    height: int = 8,
+    frames: int = 80,
+    delay: float = 0.07,
+    density: float = 0.15,
+    seed: Optional[Union[int, random.Random]] = None,
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.twinkle_stars`."""
+    source = _frames.twinkle_stars_frames(width, height, frames, density, seed)
+    _check_delay(delay)
+    await _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+async def dna_helix(
+    frames: int = 80,
+    delay: float = 0.06,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.dna_helix`."""
+    _frames._validate_frames(frames)
+    _check_delay(delay)
+    await _play_cycle(_cycles.dna_helix_cycle(), frames, delay, scheduler, sink)
+
+
+async def shooting_star(
+    width: int = 40,
+    height: int = 10,
+    frames: int = 60,
+    delay: float = 0.05,
+    char: str = "*",
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.shooting_star`."""
+    source = _frames.shooting_star_frames(width, height, frames, char)
+    _check_delay(delay)
+    await _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+async def rising_bar(
+    width: int = 20,
+    height: int = 8,
+    frames: int = 60,
+    delay: float = 0.05,
+    char: str = "#",
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.rising_bar`."""
+    source = _frames.rising_bar_frames(width, height, frames, char)
+    _check_delay(delay)
+    await _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+async def orbit(
+    radius: int = 6,
+    frames: int = 100,
+    delay: float = 0.05,
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.orbit`."""
+    source = _frames.orbit_frames(radius, frames)
+    _check_delay(delay)
+    await _play_grid(source, radius * 2 + 1, delay, renderer, scheduler, sink)
+
+
+async def falling_sand(
+    width: int = 30,
+    height: int = 10,
+    frames: int = 80,
+    delay: float = 0.05,
+    density: float = 0.2,
+    seed: Optional[Union[int, random.Random]] = None,
+    materials: Sequence[str] = ("sand",),
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.falling_sand`."""
+    source = _frames.falling_sand_frames(width, height, frames, density, seed, materials)
+    _check_delay(delay)
+    await _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+async def carousel(
+    text: str = "Loading",
+    frames: int = 80,
+    delay: float = 0.08,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
+    """Awaitable :func:`~starpatterns.patterns.animation.carousel`."""
+    source = _frames.carousel_frames(text, frames)
+    _check_delay(delay)
+    await _play_lines(source, delay, "\r" + "[done] " + text + "   \n", scheduler, sink)
+
+
+@asynccontextmanager
+async def spinning(
+    text: str = "Loading",
+    interval: float = 0.1,
+    sink: Optional[Sink] = None,
+) -> AsyncIterator["asyncio.Task[None]"]:
+    """
+    Show a spinner while the ``async with`` body runs.
+
+    The spinner task is cancelled as soon as the body finishes (or raises),
+    which prints its ``[done]`` line.
+
+    Args:
+        text: Text to render beside the spinner.
+        interval: Delay between frames in seconds.
+        sink: Output destination; each frame is one write and flush (stdout by default).
+    """
+    task = asyncio.ensure_future(spinner(text, interval=interval, sink=sink))
+    try:
+        yield task
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
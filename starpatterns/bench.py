@@ -0,0 +1,402 @@
+"""
+Benchmark suite for patterns, animations and import time.
+
+Run it with ``python -m starpatterns.bench``. It times every static
+pattern over a sweep of sizes and every animation's frame loop with a
+:class:`~starpatterns.utils.scheduler.VirtualClock` and a
+:class:`~starpatterns.utils.sink.NullSink`, so nothing sleeps or reaches
+the terminal. It also records output bytes per frame, peak traced memory
+and the cold import time of the package.
+
+Results can be written as JSON and compared against a stored baseline;
+the command exits with status 1 when any metric regresses by more than
+the threshold::
+
+    python -m starpatterns.bench --output baseline.json
+    python -m starpatterns.bench --baseline baseline.json --threshold 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .patterns import advanced, animation, basic, fractal, shapes
+from .utils.scheduler import FrameScheduler, VirtualClock
+from .utils.sink import NullSink
+
+FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 10.0
+# Metrics compared against a baseline; lower is better for all of them.
+METRICS = ("seconds", "peak_bytes", "bytes_per_frame")
+
+_SIZES = (11, 101, 1001)
+_QUICK_SIZES = (11, 101)
+# Round shapes are sized by radius; these give the same heights as the sizes above.
+_RADII = (5, 50, 500)
+_QUICK_RADII = (5, 50)
+
+
+def _polygon(size: int) -> str:
+    """Concave polygon filling a ``size`` x ``size`` box, notched to the center."""
+    return shapes.polygon([(0, 0), (size, 0), (size, size), (size // 2, size // 2), (0, size)])
+
+
+STATIC: Tuple[Tuple[str, Callable[[int], str], Sequence[int], Sequence[int]], ...] = (
+    ("triangle", basic.triangle, _SIZES, _QUICK_SIZES),
+    ("square", basic.square, _SIZES, _QUICK_SIZES),
+    ("diamond", basic.diamond, _SIZES, _QUICK_SIZES),
+    ("hollow_square", advanced.hollow_square, _SIZES, _QUICK_SIZES),
+    ("cross", advanced.cross, _SIZES, _QUICK_SIZES),
+    ("hourglass", advanced.hourglass, _SIZES, _QUICK_SIZES),
+    ("sierpinski", fractal.sierpinski, (3, 6, 9), (3, 6)),
+    ("circle", shapes.circle, _RADII, _QUICK_RADII),
+    ("ellipse", shapes.ellipse, _SIZES, _QUICK_SIZES),
+    ("ring", shapes.ring, _RADII, _QUICK_RADII),
+    ("star", shapes.star, _RADII, _QUICK_RADII),
+    ("polygon", _polygon, _SIZES, _QUICK_SIZES),
+)
+
+_LARGE = {"width": 200, "height": 60}
+# (label, animation, args, kwargs, quick); random animations are seeded so
+# bytes per frame is reproducible.
+ANIMATIONS: Tuple[Tuple[str, Callable[..., Any], Tuple[Any, ...], Dict[str, Any], bool], ...] = (
+    ("wave_text", animation.wave_text, ("starpatterns",), {"cycles": 4}, True),
+    ("bouncing_ball", animation.bouncing_ball, (), {"frames": 200}, True),
+    ("spinner", animation.spinner, (), {"duration": 20.0}, True),
+    ("loading_bar", animation.loading_bar, (), {"width": 200, "duration": 10.0}, True),
+    ("typing_text", animation.typing_text, ("starpatterns " * 16,), {}, True),
+    ("blinking_text", animation.blinking_text, ("starpatterns",), {"blinks": 100}, True),
+    ("marquee", animation.marquee, ("starpatterns",), {"width": 60, "cycles": 5}, True),
+    ("bouncing_text", animation.bouncing_text, ("starpatterns",), {"width": 60, "frames": 200}, True),
+    ("pulse_text", animation.pulse_text, ("starpatterns",), {"max_spaces": 10, "cycles": 10}, True),
+    ("snake_line", animation.snake_line, (), {"width": 60, "frames": 200}, True),
+    ("progress_dots", animation.progress_dots, (), {"cycles": 50}, True),
+    ("countdown", animation.countdown, (200,), {}, True),
+    ("ripple_line", animation.ripple_line, (), {"width": 80, "frames": 200}, True),
+    ("bar_wave", animation.bar_wave, (), {"width": 80, "frames": 200}, True),
+    ("matrix_rain", animation.matrix_rain, (), {"frames": 200, "seed": 0}, True),
+    ("matrix_rain[200x60]", animation.matrix_rain, (), dict(_LARGE, frames=200, seed=0), False),
+    ("matrix_rain[200x60,color]", animation.matrix_rain, (), dict(_LARGE, frames=200, seed=0, color=True), False),
+    ("equalizer", animation.equalizer, (), {"frames": 200, "seed": 0}, True),
+    ("equalizer[100x60]", animation.equalizer, (), {"bars": 100, "height": 60, "frames": 200, "seed": 0}, False),
+    ("fireworks", animation.fireworks, (), {"bursts": 20}, True),
+    ("fireworks[61]", animation.fireworks, (), {"bursts": 10, "size": 61}, False),
+    ("twinkle_stars", animation.twinkle_stars, (), {"frames": 200, "seed": 0}, True),
+    ("twinkle_stars[200x60]", animation.twinkle_stars, (), dict(_LARGE, frames=200, seed=0), False),
+    ("dna_helix", animation.dna_helix, (), {"frames": 200}, True),
+    ("shooting_star", animation.shooting_star, (), {"frames": 200}, True),
+    ("shooting_star[200x60]", animation.shooting_star, (), dict(_LARGE, frames=200), False),
+    ("rising_bar", animation.rising_bar, (), {"frames": 200}, True),
+    ("rising_bar[200x60]", animation.rising_bar, (), dict(_LARGE, frames=200), False),
+    ("orbit", animation.orbit, (), {"frames": 200}, True),
+    ("orbit[r30]", animation.orbit, (), {"radius": 30, "frames": 200}, False),
+    ("falling_sand", animation.falling_sand, (), {"frames": 200, "seed": 0}, True),
+    ("falling_sand[200x60]", animation.falling_sand, (), dict(_LARGE, frames=200, seed=0), False),
+    ("falling_sand[300x100]", animation.falling_sand, (), {"width": 300, "height": 100, "frames": 200, "seed": 0}, False),
+    ("carousel", animation.carousel, (), {"frames": 200}, True),
+)
+
+# Cold imports measured by the suite: the package alone, the light entry
+# points short-lived scripts use, and the animation stack.
+IMPORTS = (
+    ("starpatterns", "import starpatterns"),
+    ("colorize", "from starpatterns import colorize"),
+    ("triangle", "from starpatterns import triangle"),
+    ("matrix_rain", "from starpatterns import matrix_rain"),
+)
+
+
+class Regression(NamedTuple):
+    """A metric that got worse than the baseline by more than the threshold."""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+
+def _best_time(func: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """Best wall time of one ``func()`` call over ``repeat`` samples of at least ``min_time``."""
+    func()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def _peak_memory(func: Callable[[], Any]) -> Optional[int]:
+    """Peak traced allocation of one ``func()`` call, or ``None`` if already tracing."""
+    if tracemalloc.is_tracing():
+        return None
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _run_animation(func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[int, int]:
+    """Play an animation without sleeping; return ``(frames, bytes_written)``."""
+    scheduler = FrameScheduler(clock=VirtualClock())
+    sink = NullSink()
+    func(*args, scheduler=scheduler, sink=sink, **kwargs)
+    return scheduler.frames or sink.writes, sink.bytes_written
+
+
+def _imported(statement: str, env: Dict[str, str]) -> Dict[str, int]:
+    """Run ``statement`` under ``-X importtime``; map top-level imports to cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        # Nested imports are indented under the module that triggered them.
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith("  "):
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def import_time(statement: str = "import starpatterns", repeat: int = 5) -> float:
+    """
+    Measure what ``statement`` costs to import in fresh interpreters.
+
+    Each run uses ``python -X importtime`` and adds up the top-level imports
+    that an empty interpreter does not already perform, so lazily resolved
+    names (``from starpatterns import matrix_rain``) count in full. Returns
+    the best of ``repeat`` runs, in seconds.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (root, env.get("PYTHONPATH"))))
+    startup = set(_imported("pass", env))
+    best = float("inf")
+    for _ in range(repeat):
+        times = _imported(statement, env)
+        best = min(best, sum(micros for name, micros in times.items() if name not in startup) / 1_000_000)
+    return best
+
+
+def run(
+    quick: bool = False,
+    select: Optional[str] = None,
+    memory: bool = True,
+    imports: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark suite.
+
+    Args:
+        quick: Use smaller sizes and fewer repeats, for a fast smoke run.
+        select: Only run benchmarks whose name contains this substring.
+        memory: Also record peak traced memory (one extra traced run each).
+        imports: Also measure the import time of the statements in :data:`IMPORTS`.
+
+    Returns:
+        JSON-serializable results: environment details and a ``results``
+        mapping from benchmark name to its metrics.
+    """
+    repeat, min_time = (3, 0.02) if quick else (5, 0.1)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def wanted(name: str) -> bool:
+        return select is None or select in name
+
+    for pattern, builder, sizes, quick_sizes in STATIC:
+        for size in quick_sizes if quick else sizes:
+            name = f"static/{pattern}/{size}"
+            if not wanted(name):
+                continue
+
+            def call(builder: Callable[[int], str] = builder, size: int = size) -> str:
+                return builder(size)
+
+            entry: Dict[str, Any] = {"seconds": _best_time(call, repeat, min_time), "chars": len(call())}
+            if memory:
+                entry["peak_bytes"] = _peak_memory(call)
+            results[name] = entry
+
+    for label, func, args, kwargs, in_quick in ANIMATIONS:
+        name = f"animation/{label}"
+        if (quick and not in_quick) or not wanted(name):
+            continue
+
+        def play(
+            func: Callable[..., Any] = func,
+            args: Tuple[Any, ...] = args,
+            kwargs: Dict[str, Any] = kwargs,
+        ) -> Tuple[int, int]:
+            return _run_animation(func, args, kwargs)
+
+        frames, written = play()
+        per_run = _best_time(play, repeat, min_time)
+        entry = {
+            "frames": frames,
+            "seconds": per_run / frames,
+            "frames_per_second": frames / per_run if per_run > 0 else None,
+            "bytes_per_frame": written / frames,
+        }
+        if memory:
+            entry["peak_bytes"] = _peak_memory(play)
+        results[name] = entry
+
+    if imports:
+        for label, statement in IMPORTS:
+            name = f"import/{label}"
+            if wanted(name):
+                results[name] = {"seconds": import_time(statement, repeat=3 if quick else 7)}
+
+    return {
+        "version": FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """
+    List metrics that are worse than the baseline by more than ``threshold`` percent.
+
+    Benchmarks or metrics present in only one of the two runs are ignored.
+
+    Args:
+        results: Output of :func:`run`.
+        baseline: Earlier output of :func:`run`, e.g. loaded from JSON.
+        threshold: Allowed slowdown or growth, in percent.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    regressions = []
+    old_results = baseline.get("results", {})
+    for name, metrics in results.get("results", {}).items():
+        old = old_results.get(name)
+        if old is None:
+            continue
+        for metric in METRICS:
+            before, after = old.get(metric), metrics.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            if change > threshold:
+                regressions.append(Regression(name, metric, before, after, change))
+    return regressions
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def format_table(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """Render results as a text table, with the time change against ``baseline`` if given."""
+    old_results = baseline.get("results", {}) if baseline else {}
+    header = f"{'benchmark':<34} {'time':>10} {'peak mem':>11} {'bytes/frame':>12}"
+    if baseline:
+        header += f" {'vs base':>8}"
+    lines = [header, "-" * len(header)]
+    for name, metrics in results["results"].items():
+        peak = metrics.get("peak_bytes")
+        per_frame = metrics.get("bytes_per_frame")
+        line = (
+            f"{name:<34} {_format_seconds(metrics['seconds']):>10}"
+            f" {f'{peak / 1024:,.0f} KiB' if peak is not None else '-':>11}"
+            f" {f'{per_frame:,.1f}' if per_frame is not None else '-':>12}"
+        )
+        before = old_results.get(name, {}).get("seconds")
+        if before:
+            line += f" {(metrics['seconds'] - before) / before * 100:>+7.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(prog="python -m starpatterns.bench", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-o", "--output", help="write JSON results to this file ('-' for stdout)")
+    parser.add_argument("-b", "--baseline", help="compare against JSON results from an earlier run")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"regression threshold in percent (default {DEFAULT_THRESHOLD:g})",
+    )
+    parser.add_argument("-k", "--select", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="smaller sizes and fewer repeats")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory measurement")
+    parser.add_argument("--no-import", action="store_true", help="skip import time measurement")
+    options = parser.parse_args(argv)
+    if options.threshold < 0:
+        parser.error("--threshold must be non-negative")
+
+    baseline = None
+    if options.baseline:
+        with open(options.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+    # Keep stdout clean for JSON when it is the output target.
+    report = sys.stderr if options.output == "-" else sys.stdout
+    results = run(
+        quick=options.quick,
+        select=options.select,
+        memory=not options.no_memory,
+        imports=not options.no_import,
+    )
+    print(format_table(results, baseline), file=report)
+
+    if options.output == "-":
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    elif options.output:
+        with open(options.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+            handle.write("\n")
+
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, options.threshold)
+    for item in regressions:
+        print(
+            f"REGRESSION {item.name} {item.metric}: {item.baseline:.6g} -> {item.current:.6g} ({item.change:+.1f}%)",
+            file=report,
+        )
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {options.threshold:g}%", file=report)
+        return 1
+    print(f"no regressions above {options.threshold:g}%", file=report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Compose several animations into rectangular regions of one screen.
+
+Each region is fed by a frame generator from
+:mod:`starpatterns.patterns.frames` (or any iterable of ``str`` lines or
+``List[str]`` canvases). The layout is fixed when regions are added; every
+tick the compositor pulls one frame per region, blits the rows that
+changed into a shared buffer, and the whole screen is written as a single
+diffed frame. Regions may overlap: later regions are drawn on top, and a
+row that changes underneath one is redrawn by every region above it.
+
+Example::
+
+    comp = Compositor(width=80, height=13)
+    comp.add(equalizer_frames(bars=16, height=12, frames=200), 0, 0, 31, 12)
+    comp.add(matrix_rain_frames(width=48, height=12, frames=200), 32, 0, 48, 12)
+    comp.add(loading_bar_frames(width=60), 0, 12, 80, 1)
+    comp.run(delay=0.05)
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Union
+
+from .patterns.animation import _check_delay, _play_grid
+from .utils.renderer import FrameRenderer
+from .utils.scheduler import FrameScheduler
+from .utils.sink import Sink
+
+Frame = Union[str, Sequence[str]]
+
+_END = object()
+
+
+class Region(NamedTuple):
+    """Rectangle on the composite screen; ``x``/``y`` are zero-based."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+    def overlaps(self, other: Region) -> bool:
+        """Whether the two rectangles share at least one cell."""
+        return (
+            self.x < other.x + other.width
+            and other.x < self.x + self.width
+            and self.y < other.y + other.height
+            and other.y < self.y + self.height
+        )
+
+
+class _Slot:
+    __slots__ = ("frames", "region", "shown", "above", "stale")
+
+    def __init__(self, frames: Iterable[Frame], region: Region) -> None:
+        self.frames: Optional[Iterator[Frame]] = iter(frames)
+        self.region = region
+        self.shown: List[Optional[str]] = [None] * region.height
+        # Later slots drawn over this one, and rows of this slot that a
+        # slot underneath has painted over since it last drew them.
+        self.above: List[_Slot] = []
+        self.stale: Set[int] = set()
+
+
+class Compositor:
+    """
+    Run several animations at once, each clipped to its own region.
+
+    Args:
+        width: Width of the composite screen.
+        height: Height of the composite screen.
+        fill: Character used where no region draws.
+    """
+
+    def __init__(self, width: int, height: int, fill: str = " ") -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be positive")
+        if len(fill) != 1:
+            raise ValueError("fill must be a single character")
+        self.width = width
+        self.height = height
+        self.fill = fill
+        self._slots: List[_Slot] = []
+
+    @property
+    def regions(self) -> List[Region]:
+        """Regions in drawing order; later regions are drawn on top."""
+        return [slot.region for slot in self._slots]
+
+    def add(self, frames: Iterable[Frame], x: int, y: int, width: int, height: int) -> Region:
+        """
+        Attach a frame source to a region of the screen.
+
+        Single-line (``str``) frames are drawn on the region's first row;
+        canvases fill it top to bottom. Frames are clipped and padded to the
+        region. A source that runs out keeps showing its last frame. The
+        region is drawn on top of any earlier region it overlaps.
+
+        Args:
+            frames: Iterable of frames for this region.
+            x: Left column of the region.
+            y: Top row of the region.
+            width: Region width.
+            height: Region height.
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("region width and height must be positive")
+        if x < 0 or y < 0 or x + width > self.width or y + height > self.height:
+            raise ValueError("region must lie inside the compositor")
+        region = Region(x, y, width, height)
+        slot = _Slot(frames, region)
+        for below in self._slots:
+            if below.region.overlaps(region):
+                below.above.append(slot)
+        self._slots.append(slot)
+        return region
+
+    def frames(self, count: Optional[int] = None) -> Iterator[List[str]]:
+        """
+        Yield composite canvases until every source is exhausted.
+
+        Args:
+            count: Maximum number of composite frames; required when a source
+                is endless (for example ``spinner_frames``).
+        """
+        if count is not None and count < 0:
+            raise ValueError("count must be non-negative")
+
+        def generate() -> Iterator[List[str]]:
+            buffer = [[self.fill] * self.width for _ in range(self.height)]
+            rows = ["".join(row) for row in buffer]
+            produced = 0
+            while count is None or produced < count:
+                dirty = set()
+                active = False
+                for slot in self._slots:
+                    frame = _END if slot.frames is None else next(slot.frames, _END)
+                    if frame is _END:
+                        slot.frames = None
+                        if slot.stale:
+                            self._blit(slot, slot.shown, buffer, dirty)  # type: ignore[arg-type]
+                        continue
+                    active = True
+                    self._blit(slot, frame, buffer, dirty)  # type: ignore[arg-type]
+                if not active:
+                    return
+                for index in dirty:
+                    rows[index] = "".join(buffer[index])
+                produced += 1
+                yield list(rows)
+
+        return generate()
+
+    def run(
+        self,
+        delay: float = 0.05,
+        frames: Optional[int] = None,
+        renderer: Optional[FrameRenderer] = None,
+        scheduler: Optional[FrameScheduler] = None,
+        sink: Optional[Sink] = None,
+    ) -> None:
+        """
+        Play the composite animation with one write per frame.
+
+        Args:
+            delay: Delay between frames in seconds.
+            frames: Maximum number of composite frames.
+            renderer: Renderer used to diff frames; exposes bytes saved per frame.
+            scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+            sink: Output destination; each frame is one write and flush (stdout by default).
+        """
+        _check_delay(delay)
+        _play_grid(self.frames(frames), self.height, delay, renderer, scheduler, sink)
+
+    @staticmethod
+    def _blit(slot: _Slot, frame: Frame, buffer: List[List[str]], dirty: set) -> None:
+        region = slot.region
+        lines = [frame] if isinstance(frame, str) else frame
+        width = region.width
+        for offset in range(region.height):
+            line = lines[offset] if offset < len(lines) else ""
+            if line is None:  # never drawn by a source that has run out
+                continue
+            if len(line) != width:
+                line = line[:width].ljust(width)
+            if line == slot.shown[offset] and offset not in slot.stale:
+                continue
+            slot.shown[offset] = line
+            row = region.y + offset
+            buffer[row][region.x : region.x + width] = line
+            dirty.add(row)
+            for upper in slot.above:
+                if upper.region.y <= row < upper.region.y + upper.region.height:
+                    upper.stale.add(row - upper.region.y)
+        slot.stale.clear()
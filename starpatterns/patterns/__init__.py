@@ -1,34 +1,180 @@
-"""Collection of text patterns and animations."""
+"""
+Collection of text patterns and animations.
 
-from .basic import triangle, square, diamond
-from .advanced import hollow_square, cross, hourglass
-from .fractal import sierpinski
-from .animation import (
-    bar_wave,
-    bouncing_ball,
-    bouncing_text,
-    carousel,
-    blinking_text,
-    countdown,
-    dna_helix,
-    equalizer,
-    falling_sand,
-    fireworks,
-    loading_bar,
-    marquee,
-    matrix_rain,
-    orbit,
-    progress_dots,
-    pulse_text,
-    rising_bar,
-    ripple_line,
-    shooting_star,
-    snake_line,
-    spinner,
-    twinkle_stars,
-    typing_text,
-    wave_text,
-)
+Exports are resolved lazily on first access, so importing one pattern
+does not load the animation machinery.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .basic import diamond, iter_diamond, iter_square, iter_triangle, square, triangle
+    from .advanced import cross, hollow_square, hourglass, iter_cross, iter_hollow_square, iter_hourglass
+    from .shapes import (
+        Shape,
+        circle,
+        ellipse,
+        from_bands,
+        from_inside,
+        from_runs,
+        iter_circle,
+        iter_ellipse,
+        iter_polygon,
+        iter_ring,
+        iter_star,
+        polygon,
+        ring,
+        star,
+    )
+    from .stream import write_pattern, write_rows
+    from .fractal import iter_sierpinski, sierpinski, write_sierpinski
+    from .animation import (
+        bar_wave,
+        bouncing_ball,
+        bouncing_text,
+        carousel,
+        blinking_text,
+        countdown,
+        dna_helix,
+        equalizer,
+        falling_sand,
+        fireworks,
+        loading_bar,
+        marquee,
+        matrix_rain,
+        orbit,
+        progress_dots,
+        pulse_text,
+        rising_bar,
+        ripple_line,
+        shooting_star,
+        snake_line,
+        spinner,
+        twinkle_stars,
+        typing_text,
+        wave_text,
+    )
+    from .frames import (
+        bar_wave_frames,
+        blinking_text_frames,
+        bouncing_ball_frames,
+        bouncing_text_frames,
+        carousel_frames,
+        countdown_frames,
+        dna_helix_frames,
+        equalizer_frames,
+        falling_sand_frames,
+        fireworks_frame,
+        fireworks_frames,
+        loading_bar_frames,
+        marquee_frames,
+        matrix_rain_frames,
+        orbit_frame,
+        orbit_frames,
+        progress_dots_frames,
+        pulse_text_frames,
+        ripple_line_frames,
+        rising_bar_frames,
+        shooting_star_frames,
+        snake_line_frames,
+        spinner_frames,
+        twinkle_stars_frames,
+        typing_text_frames,
+        wave_text_frames,
+    )
+    from .progress import ProgressBar, Spinner
+    from .rain import MatrixRain
+    from .sand import Material, SandBox
+    from . import cache
+
+# Submodule providing each public name; a submodule with no names is
+# exported itself.
+_EXPORTS = {
+    ".basic": ("diamond", "iter_diamond", "iter_square", "iter_triangle", "square", "triangle"),
+    ".advanced": ("cross", "hollow_square", "hourglass", "iter_cross", "iter_hollow_square", "iter_hourglass"),
+    ".shapes": (
+        "Shape",
+        "circle",
+        "ellipse",
+        "from_bands",
+        "from_inside",
+        "from_runs",
+        "iter_circle",
+        "iter_ellipse",
+        "iter_polygon",
+        "iter_ring",
+        "iter_star",
+        "polygon",
+        "ring",
+        "star",
+    ),
+    ".stream": ("write_pattern", "write_rows"),
+    ".fractal": ("iter_sierpinski", "sierpinski", "write_sierpinski"),
+    ".animation": (
+        "bar_wave",
+        "bouncing_ball",
+        "bouncing_text",
+        "carousel",
+        "blinking_text",
+        "countdown",
+        "dna_helix",
+        "equalizer",
+        "falling_sand",
+        "fireworks",
+        "loading_bar",
+        "marquee",
+        "matrix_rain",
+        "orbit",
+        "progress_dots",
+        "pulse_text",
+        "rising_bar",
+        "ripple_line",
+        "shooting_star",
+        "snake_line",
+        "spinner",
+        "twinkle_stars",
+        "typing_text",
+        "wave_text",
+    ),
+    ".frames": (
+        "bar_wave_frames",
+        "blinking_text_frames",
+        "bouncing_ball_frames",
+        "bouncing_text_frames",
+        "carousel_frames",
+        "countdown_frames",
+        "dna_helix_frames",
+        "equalizer_frames",
+        "falling_sand_frames",
+        "fireworks_frame",
+        "fireworks_frames",
+        "loading_bar_frames",
+        "marquee_frames",
+        "matrix_rain_frames",
+        "orbit_frame",
+        "orbit_frames",
+        "progress_dots_frames",
+        "pulse_text_frames",
+        "ripple_line_frames",
+        "rising_bar_frames",
+        "shooting_star_frames",
+        "snake_line_frames",
+        "spinner_frames",
+        "twinkle_stars_frames",
+        "typing_text_frames",
+        "wave_text_frames",
+    ),
+    ".progress": ("ProgressBar", "Spinner"),
+    ".rain": ("MatrixRain",),
+    ".sand": ("Material", "SandBox"),
+    ".cache": (),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
 __all__ = [
     "triangle",
@@ -37,7 +183,31 @@ __all__ = [
     "hollow_square",
     "cross",
     "hourglass",
+    "iter_triangle",
+    "iter_square",
+    "iter_diamond",
+    "iter_hollow_square",
+    "iter_cross",
+    "iter_hourglass",
+    "circle",
+    "ellipse",
+    "ring",
+    "star",
+    "polygon",
+    "iter_circle",
+    "iter_ellipse",
+    "iter_ring",
+    "iter_star",
+    "iter_polygon",
+    "Shape",
+    "from_runs",
+    "from_bands",
+    "from_inside",
+    "write_pattern",
+    "write_rows",
     "sierpinski",
+    "iter_sierpinski",
+    "write_sierpinski",
     "wave_text",
     "bouncing_ball",
     "spinner",
@@ -62,4 +232,36 @@ __all__ = [
     "orbit",
     "falling_sand",
     "carousel",
+    "ProgressBar",
+    "Spinner",
+    "MatrixRain",
+    "SandBox",
+    "Material",
+    "cache",
+    "wave_text_frames",
+    "bouncing_ball_frames",
+    "spinner_frames",
+    "loading_bar_frames",
+    "typing_text_frames",
+    "blinking_text_frames",
+    "marquee_frames",
+    "bouncing_text_frames",
+    "pulse_text_frames",
+    "snake_line_frames",
+    "progress_dots_frames",
+    "countdown_frames",
+    "ripple_line_frames",
+    "bar_wave_frames",
+    "matrix_rain_frames",
+    "equalizer_frames",
+    "fireworks_frames",
+    "twinkle_stars_frames",
+    "dna_helix_frames",
+    "shooting_star_frames",
+    "rising_bar_frames",
+    "orbit_frames",
+    "falling_sand_frames",
+    "carousel_frames",
+    "fireworks_frame",
+    "orbit_frame",
 ]
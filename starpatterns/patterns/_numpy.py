@@ -0,0 +1,95 @@
+"""
+Optional NumPy kernels for the cell-heavy frame generators.
+
+NumPy is imported lazily the first time a vectorized backend is requested,
+so importing :mod:`starpatterns` never pays for it. Every kernel produces
+exactly the same frames as the pure-Python path in
+:mod:`starpatterns.patterns.frames`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, List, Optional
+
+# Below this many cells per frame the NumPy call overhead outweighs the win.
+AUTO_MIN_CELLS = 2048
+
+_BACKENDS = ("auto", "python", "numpy")
+_numpy: Any = None
+_checked = False
+
+
+def numpy_module() -> Optional[Any]:
+    """Return the ``numpy`` module, or ``None`` when it is not installed."""
+    global _numpy, _checked
+    if not _checked:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+        _checked = True
+    return _numpy
+
+
+def use_numpy(backend: str, cells: int) -> bool:
+    """
+    Decide whether a generator should take the NumPy path.
+
+    Args:
+        backend: ``"auto"``, ``"python"`` or ``"numpy"``.
+        cells: Number of cells (or values) computed per frame.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(_BACKENDS)}")
+    if backend == "python":
+        return False
+    if backend == "numpy":
+        if numpy_module() is None:
+            raise ImportError("the numpy backend requires numpy; install starpatterns[numpy]")
+        return True
+    return cells >= AUTO_MIN_CELLS and numpy_module() is not None
+
+
+def _rows(codes: Any, palette: str) -> List[str]:
+    """Map a 2-D array of palette indices to row strings."""
+    np = numpy_module()
+    height, width = codes.shape
+    if palette.isascii():
+        lut = np.frombuffer(palette.encode("ascii"), dtype=np.uint8)
+        data = lut[codes].tobytes().decode("ascii")
+    else:
+        data = "".join(np.array(list(palette))[codes].ravel().tolist())
+    return [data[row * width : (row + 1) * width] for row in range(height)]
+
+
+def fireworks_frames(bursts: int, size: int, char: str) -> Iterator[List[str]]:
+    """Fireworks rings computed from a precomputed Manhattan distance field."""
+    np = numpy_module()
+    center = size // 2
+    axis = np.abs(np.arange(size) - center)
+    dist = axis[:, None] + axis[None, :]
+    rings = []
+    for radius in range(1, center + 1):
+        codes = np.zeros((size, size), dtype=np.intp)
+        codes[dist == radius - 1] = 1
+        codes[dist == radius] = 2
+        rings.append(_rows(codes, " ." + char))
+    for _ in range(bursts):
+        for lines in rings:
+            yield list(lines)
+
+
+def lookup_rows(raw: bytes, table: bytes, width: int, height: int) -> List[str]:
+    """Translate one byte per cell through ``table`` and split into rows."""
+    np = numpy_module()
+    lut = np.frombuffer(table, dtype=np.uint8)
+    data = lut[np.frombuffer(raw, dtype=np.uint8)].tobytes().decode("ascii")
+    return [data[row * width : (row + 1) * width] for row in range(height)]
+
+
+def sine_levels(count: int, divisor: float, scale: float, offset: int = 0) -> List[int]:
+    """Return ``int((sin(k / divisor) + 1) * scale) + offset`` for ``k < count``."""
+    np = numpy_module()
+    values = (np.sin(np.arange(count) / divisor) + 1) * scale
+    return (values.astype(np.int64) + offset).tolist()
@@ -1,13 +1,16 @@
-"""Advanced ASCII patterns."""
+"""Advanced ASCII patterns, drawn with the span engine in :mod:`.shapes`."""
 
-from typing import List
+from __future__ import annotations
+
+from typing import Iterator
 
 from .basic import _validate_size
+from .shapes import _band_lines, _run_lines
 
 
-def hollow_square(size: int, border_char: str = "*") -> str:
+def iter_hollow_square(size: int, border_char: str = "*") -> Iterator[str]:
     """
-    Build a hollow square with a solid border.
+    Yield the rows of a hollow square one at a time.
 
     Args:
         size: Width/height of the square.
@@ -16,20 +19,31 @@ def hollow_square(size: int, border_char: str = "*") -> str:
     _validate_size(size)
     if len(border_char) != 1:
         raise ValueError("border_char must be a single character")
+
+    full = ((0, size),)
     if size == 1:
-        return border_char
-    top_bottom = border_char * size
-    middle = border_char + " " * (size - 2) + border_char
-    lines = [top_bottom] + [middle for _ in range(size - 2)] + [top_bottom]
-    return "\n".join(lines)
+        return _band_lines(size, [full], [1], border_char)
+    sides = ((0, 1), (size - 1, size))
+    return _band_lines(size, [full, sides, full], [1, size - 2, 1], border_char)
 
 
-def cross(size: int, char: str = "*", fill: str = " ") -> str:
+def hollow_square(size: int, border_char: str = "*") -> str:
     """
-    Build a centered cross. Size should be an odd integer for symmetry.
+    Build a hollow square with a solid border.
 
     Args:
-        size: Width/height of the cross.
+        size: Width/height of the square.
+        border_char: Character used for the border.
+    """
+    return "\n".join(iter_hollow_square(size, border_char))
+
+
+def iter_cross(size: int, char: str = "*", fill: str = " ") -> Iterator[str]:
+    """
+    Yield the rows of a centered cross one at a time.
+
+    Args:
+        size: Width/height of the cross (must be odd).
         char: Character used for the cross arms.
         fill: Background fill character.
     """
@@ -38,22 +52,27 @@ def cross(size: int, char: str = "*", fill: str = " ") -> str:
         raise ValueError("size must be odd for a symmetric cross")
     if len(char) != 1 or len(fill) != 1:
         raise ValueError("char and fill must be single characters")
+
     mid = size // 2
-    lines: List[str] = []
-    for row in range(size):
-        line_chars: List[str] = []
-        for col in range(size):
-            if row == mid or col == mid:
-                line_chars.append(char)
-            else:
-                line_chars.append(fill)
-        lines.append("".join(line_chars))
-    return "\n".join(lines)
+    arm = ((mid, mid + 1),)
+    return _band_lines(size, [arm, ((0, size),), arm], [mid, 1, mid], char, fill=fill)
 
 
-def hourglass(size: int, char: str = "*") -> str:
+def cross(size: int, char: str = "*", fill: str = " ") -> str:
     """
-    Build an hourglass pattern.
+    Build a centered cross. Size should be an odd integer for symmetry.
+
+    Args:
+        size: Width/height of the cross.
+        char: Character used for the cross arms.
+        fill: Background fill character.
+    """
+    return "\n".join(iter_cross(size, char, fill))
+
+
+def iter_hourglass(size: int, char: str = "*") -> Iterator[str]:
+    """
+    Yield the rows of an hourglass one at a time.
 
     Args:
         size: Height/width of the hourglass (must be odd).
@@ -64,10 +83,18 @@ def hourglass(size: int, char: str = "*") -> str:
         raise ValueError("size must be odd for a symmetric hourglass")
     if len(char) != 1:
         raise ValueError("char must be a single character")
-    mid = size // 2
-    lines: List[str] = []
-    for i in range(size):
-        offset = i if i <= mid else size - i - 1
-        inner = char * (size - 2 * offset)
-        lines.append(" " * offset + inner + " " * offset)
-    return "\n".join(lines)
+
+    # Runs shrink by two down to the middle row, then grow.
+    lengths = [*range(size, 0, -2), *range(3, size + 1, 2)]
+    return _run_lines(size, lengths, char, centered=True)
+
+
+def hourglass(size: int, char: str = "*") -> str:
+    """
+    Build an hourglass pattern.
+
+    Args:
+        size: Height/width of the hourglass (must be odd).
+        char: Character used to draw the hourglass.
+    """
+    return "\n".join(iter_hourglass(size, char))
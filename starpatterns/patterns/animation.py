@@ -2,16 +2,109 @@
 
 from __future__ import annotations
 
-import math
 import random
-import sys
-import time
-from itertools import cycle
-
-from ..utils.terminal import move_cursor_home
-
+from typing import Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from ..utils.renderer import FrameRenderer
+from ..utils.scheduler import FrameScheduler
+from ..utils.sink import Sink, StreamSink
+from . import cycles as _cycles
+from . import frames as _frames
+from . import rain as _rain
+from .progress import ProgressBar, Spinner
+
+T = TypeVar("T")
+
+
+def _check_delay(delay: float, name: str = "delay") -> None:
+    if delay <= 0:
+        raise ValueError(f"{name} must be positive")
+
+
+def _play_lines(
+    frames: Iterable[str],
+    delay: float,
+    end: str,
+    scheduler: Optional[FrameScheduler],
+    sink: Optional[Sink] = None,
+) -> None:
+    """Redraw single-line frames in place with ``\\r`` and finish with ``end``."""
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    sink = sink if sink is not None else StreamSink()
+    for frame in scheduler.pace(frames, delay, sink=sink):
+        sink.write("\r" + frame)
+    sink.write(end)
+
+
+def _play_grid(
+    frames: Iterable[List[str]],
+    height: int,
+    delay: float,
+    renderer: Optional[FrameRenderer],
+    scheduler: Optional[FrameScheduler],
+    sink: Optional[Sink] = None,
+) -> None:
+    """Draw multi-line frames through a diffing renderer below reserved rows."""
+    renderer = renderer if renderer is not None else FrameRenderer()
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    sink = sink if sink is not None else StreamSink()
+    renderer.reset()
+    if not sink.fullscreen:
+        sink.write("\n" * height)
+    for lines in scheduler.pace(frames, delay, sink=sink):
+        sink.write(renderer.render(lines))
+    sink.write(renderer.finish() + "\n")
+
+
+def _play_cycle(
+    cycle: _cycles.FrameCycle,
+    count: Optional[int],
+    delay: float,
+    scheduler: Optional[FrameScheduler],
+    sink: Optional[Sink],
+    duration: Optional[float] = None,
+    order: Optional[Iterable[int]] = None,
+) -> None:
+    """
+    Replay ``count`` frames of a pre-rendered cycle, one buffer write each.
 
-def wave_text(text: str, amplitude: int = 2, speed: float = 0.08, cycles: int = 2) -> None:
+    With ``order``, play those indices into ``cycle.period`` instead.
+    """
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    sink = sink if sink is not None else StreamSink()
+    if cycle.start and not sink.fullscreen:
+        sink.write_bytes(cycle.start)
+    payloads = cycle.payloads(count) if order is None else map(cycle.period.__getitem__, order)
+    for payload in scheduler.pace(payloads, delay, duration, sink):
+        sink.write_bytes(payload)
+    sink.write_bytes(cycle.end)
+
+
+def _play_rain(
+    rain: _rain.MatrixRain,
+    frames: int,
+    delay: float,
+    scheduler: Optional[FrameScheduler],
+    sink: Optional[Sink],
+) -> None:
+    """Draw ``frames`` frames of a matrix rain from its own dirty-cell updates."""
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    sink = sink if sink is not None else StreamSink()
+    if not sink.fullscreen:
+        sink.write("\n" * rain.height)
+    for payload in scheduler.pace(rain.payloads(frames), delay, sink=sink):
+        sink.write(payload)
+    sink.write(rain.finish() + "\n")
+
+
+def wave_text(
+    text: str,
+    amplitude: int = 2,
+    speed: float = 0.08,
+    cycles: int = 2,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Animate text moving in a horizontal sine wave.
 
@@ -20,22 +113,27 @@ def wave_text(text: str, amplitude: int = 2, speed: float = 0.08, cycles: int =
         amplitude: Maximum indentation in spaces.
         speed: Delay between frames in seconds.
         cycles: Number of full sine cycles to render.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if amplitude < 0:
-        raise ValueError("amplitude must be non-negative")
-    if speed <= 0:
-        raise ValueError("speed must be positive")
-    frames = int(cycles * 2 * math.pi * 4) or 1
-    for i in range(frames):
-        offset = int(amplitude * (1 + math.sin(i / 4.0)))
-        sys.stdout.write("\r" + " " * offset + text)
-        sys.stdout.flush()
-        time.sleep(speed)
-    sys.stdout.write("\r" + text + "\n")
-    sys.stdout.flush()
-
-
-def bouncing_ball(width: int = 20, height: int = 5, frames: int = 80, delay: float = 0.05, char: str = "o") -> None:
+    offsets = _frames.wave_text_offsets(amplitude, cycles)
+    _check_delay(speed, "speed")
+    if not _cycles.fits(2 * amplitude + 1, 2 * amplitude + len(text)):
+        _play_lines((" " * offset + text for offset in offsets), speed, "\r" + text + "\n", scheduler, sink)
+        return
+    _play_cycle(_cycles.wave_text_cycle(text, amplitude), None, speed, scheduler, sink, order=offsets)
+
+
+def bouncing_ball(
+    width: int = 20,
+    height: int = 5,
+    frames: int = 80,
+    delay: float = 0.05,
+    char: str = "o",
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Animate a single bouncing ball within a rectangular field.
 
@@ -45,89 +143,90 @@ def bouncing_ball(width: int = 20, height: int = 5, frames: int = 80, delay: flo
         frames: Number of frames to render.
         delay: Delay between frames in seconds.
         char: Character used for the ball.
+        renderer: Renderer used to diff frames; exposes bytes saved per frame.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if width < 2 or height < 2:
-        raise ValueError("width and height must be at least 2")
-    if len(char) != 1:
-        raise ValueError("char must be a single character")
-    x, y = 0, 0
-    dx, dy = 1, 1
-    print("\n" * (height - 1))
-    for _ in range(frames):
-        grid_lines = []
-        for row in range(height):
-            line_chars = []
-            for col in range(width):
-                line_chars.append(char if (col, row) == (x, y) else " ")
-            grid_lines.append("".join(line_chars))
-        move_cursor_home()
-        sys.stdout.write("\n".join(grid_lines))
-        sys.stdout.flush()
-        time.sleep(delay)
-
-        x += dx
-        y += dy
-        if x <= 0 or x >= width - 1:
-            dx *= -1
-        if y <= 0 or y >= height - 1:
-            dy *= -1
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def spinner(text: str = "Loading", duration: float = 2.0, interval: float = 0.1) -> None:
+    source = _frames.bouncing_ball_frames(width, height, frames, char)
+    _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+def spinner(
+    text: str = "Loading",
+    duration: Optional[float] = 2.0,
+    interval: float = 0.1,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> Optional[Spinner]:
     """
     Animate a classic command-line spinner.
 
+    The spinner animates for ``duration`` seconds and returns ``None``.
+    With ``duration=None`` it returns a :class:`Spinner` to use as a
+    context manager (``with spinner("Working", duration=None):``) that
+    animates on a background thread until the block exits.
+
     Args:
         text: Text to render beside the spinner.
-        duration: Total time to animate in seconds.
+        duration: Total time to animate in seconds, or ``None`` to track work.
         interval: Delay between frames in seconds.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
+    if duration is None:
+        return Spinner(text, interval, sink)
     if duration <= 0:
         raise ValueError("duration must be positive")
-    if interval <= 0:
-        raise ValueError("interval must be positive")
-    spin_frames = cycle("|/-\\")
-    end_time = time.time() + duration
-    while time.time() < end_time:
-        frame = next(spin_frames)
-        sys.stdout.write(f"\r{frame} {text}")
-        sys.stdout.flush()
-        time.sleep(interval)
-    sys.stdout.write("\r[done] " + text + " " * 3 + "\n")
-    sys.stdout.flush()
-
-
-def loading_bar(width: int = 30, duration: float = 2.0, char: str = "#") -> None:
+    _check_delay(interval, "interval")
+    scheduler = scheduler if scheduler is not None else FrameScheduler()
+    _play_cycle(_cycles.spinner_cycle(text), None, interval, scheduler, sink, duration)
+    return None
+
+
+def loading_bar(
+    width: Union[int, Iterable[T]] = 30,
+    duration: float = 2.0,
+    char: str = "#",
+    scheduler: Optional[FrameScheduler] = None,
+    total: Optional[int] = None,
+    max_fps: float = 10.0,
+    sink: Optional[Sink] = None,
+) -> Optional[ProgressBar[T]]:
     """
     Animate a horizontal progress bar.
 
+    Passing an iterable instead of a width, or a ``total``, returns a
+    :class:`ProgressBar` that tracks real work instead of animating for
+    ``duration``: ``for item in loading_bar(items, total=n)`` or
+    ``with loading_bar(total=n) as bar: bar.update()``.
+
     Args:
-        width: Number of bar cells.
+        width: Number of bar cells, or an iterable to wrap.
         duration: Total animation duration in seconds.
         char: Fill character for the bar.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        total: Number of work steps; switches to work-driven mode.
+        max_fps: Maximum redraws per second in work-driven mode.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if width <= 0:
-        raise ValueError("width must be positive")
+    if not isinstance(width, int):
+        return ProgressBar(width, total, char=char, max_fps=max_fps, sink=sink)
+    if total is not None:
+        return ProgressBar(None, total, width, char, max_fps, sink)
+    source = _frames.loading_bar_frames(width, char)
     if duration <= 0:
         raise ValueError("duration must be positive")
-    if len(char) != 1:
-        raise ValueError("char must be a single character")
-    steps = width
-    delay = duration / steps
-    for i in range(steps + 1):
-        filled = char * i
-        empty = " " * (steps - i)
-        percent = int((i / steps) * 100)
-        sys.stdout.write(f"\r[{filled}{empty}] {percent:3d}%")
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def typing_text(text: str, interval: float = 0.05, cursor: str = "|") -> None:
+    _play_lines(source, duration / width, "\n", scheduler, sink)
+    return None
+
+
+def typing_text(
+    text: str,
+    interval: float = 0.05,
+    cursor: str = "|",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Type out text character-by-character.
 
@@ -135,20 +234,20 @@ def typing_text(text: str, interval: float = 0.05, cursor: str = "|") -> None:
         text: Text to render.
         interval: Delay per character.
         cursor: Cursor indicator appended while typing.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if interval <= 0:
-        raise ValueError("interval must be positive")
-    for i in range(len(text) + 1):
-        snippet = text[:i]
-        trail = cursor if i < len(text) else " "
-        sys.stdout.write("\r" + snippet + trail)
-        sys.stdout.flush()
-        time.sleep(interval)
-    sys.stdout.write("\r" + text + "\n")
-    sys.stdout.flush()
-
-
-def blinking_text(text: str, blinks: int = 6, interval: float = 0.3) -> None:
+    _check_delay(interval, "interval")
+    _play_lines(_frames.typing_text_frames(text, cursor), interval, "\r" + text + "\n", scheduler, sink)
+
+
+def blinking_text(
+    text: str,
+    blinks: int = 6,
+    interval: float = 0.3,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Blink text on and off.
 
@@ -156,24 +255,22 @@ def blinking_text(text: str, blinks: int = 6, interval: float = 0.3) -> None:
         text: Text to blink.
         blinks: Number of on/off cycles.
         interval: Delay between states.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if blinks <= 0:
-        raise ValueError("blinks must be positive")
-    if interval <= 0:
-        raise ValueError("interval must be positive")
-    blank = " " * len(text)
-    for _ in range(blinks):
-        sys.stdout.write("\r" + text)
-        sys.stdout.flush()
-        time.sleep(interval)
-        sys.stdout.write("\r" + blank)
-        sys.stdout.flush()
-        time.sleep(interval)
-    sys.stdout.write("\r" + text + "\n")
-    sys.stdout.flush()
-
-
-def marquee(text: str, width: int = 30, cycles: int = 3, speed: float = 0.05) -> None:
+    source = _frames.blinking_text_frames(text, blinks)
+    _check_delay(interval, "interval")
+    _play_lines(source, interval, "\r" + text + "\n", scheduler, sink)
+
+
+def marquee(
+    text: str,
+    width: int = 30,
+    cycles: int = 3,
+    speed: float = 0.05,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Scroll text horizontally inside a window.
 
@@ -182,23 +279,27 @@ def marquee(text: str, width: int = 30, cycles: int = 3, speed: float = 0.05) ->
         width: Visible window width.
         cycles: Number of full scroll cycles.
         speed: Delay between frames.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if width <= 0:
-        raise ValueError("width must be positive")
-    if speed <= 0:
-        raise ValueError("speed must be positive")
-    padded = " " * width + text + " " * width
-    steps = len(text) + width
-    for _ in range(cycles):
-        for i in range(steps):
-            sys.stdout.write("\r" + padded[i : i + width])
-            sys.stdout.flush()
-            time.sleep(speed)
-    sys.stdout.write("\r" + " " * width + "\r")
-    sys.stdout.flush()
-
-
-def bouncing_text(text: str, width: int = 30, frames: int = 60, delay: float = 0.05) -> None:
+    _frames._validate_marquee(width)
+    _check_delay(speed, "speed")
+    if not _cycles.fits(len(text) + width, width):
+        source = _frames.marquee_frames(text, width, max(cycles, 0))
+        _play_lines(source, speed, "\r" + " " * width + "\r", scheduler, sink)
+        return
+    cycle = _cycles.marquee_cycle(text, width)
+    _play_cycle(cycle, len(cycle.period) * max(cycles, 0), speed, scheduler, sink)
+
+
+def bouncing_text(
+    text: str,
+    width: int = 30,
+    frames: int = 60,
+    delay: float = 0.05,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Bounce a piece of text left and right.
 
@@ -207,26 +308,26 @@ def bouncing_text(text: str, width: int = 30, frames: int = 60, delay: float = 0
         width: Total line width.
         frames: Number of frames.
         delay: Delay between frames.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if width <= len(text):
-        raise ValueError("width must be greater than text length")
-    if frames <= 0 or delay <= 0:
-        raise ValueError("frames and delay must be positive")
-    pos = 0
-    direction = 1
-    max_pos = width - len(text)
-    for _ in range(frames):
-        sys.stdout.write("\r" + " " * pos + text + " " * (max_pos - pos))
-        sys.stdout.flush()
-        time.sleep(delay)
-        pos += direction
-        if pos <= 0 or pos >= max_pos:
-            direction *= -1
-    sys.stdout.write("\r" + text + "\n")
-    sys.stdout.flush()
-
-
-def pulse_text(text: str, min_spaces: int = 0, max_spaces: int = 6, cycles: int = 6, delay: float = 0.06) -> None:
+    _frames._validate_bouncing_text(text, width, frames)
+    _check_delay(delay)
+    if not _cycles.fits(2 * (width - len(text)), width):
+        _play_lines(_frames.bouncing_text_frames(text, width, frames), delay, "\r" + text + "\n", scheduler, sink)
+        return
+    _play_cycle(_cycles.bouncing_text_cycle(text, width), frames, delay, scheduler, sink)
+
+
+def pulse_text(
+    text: str,
+    min_spaces: int = 0,
+    max_spaces: int = 6,
+    cycles: int = 6,
+    delay: float = 0.06,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Pulse text in and out by adding indentation.
 
@@ -236,22 +337,29 @@ def pulse_text(text: str, min_spaces: int = 0, max_spaces: int = 6, cycles: int
         max_spaces: Maximum indentation.
         cycles: Number of expand/contract cycles.
         delay: Delay between frames.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if min_spaces < 0 or max_spaces < min_spaces:
-        raise ValueError("spaces must be non-negative and max >= min")
-    if cycles <= 0 or delay <= 0:
-        raise ValueError("cycles and delay must be positive")
-    offsets = list(range(min_spaces, max_spaces + 1)) + list(range(max_spaces - 1, min_spaces, -1))
-    for _ in range(cycles):
-        for offset in offsets:
-            sys.stdout.write("\r" + " " * offset + text)
-            sys.stdout.flush()
-            time.sleep(delay)
-    sys.stdout.write("\r" + text + "\n")
-    sys.stdout.flush()
-
-
-def snake_line(width: int = 30, length: int = 8, frames: int = 100, delay: float = 0.04, head: str = "O", body: str = "o") -> None:
+    _frames._validate_pulse_text(min_spaces, max_spaces, cycles)
+    _check_delay(delay)
+    if not _cycles.fits(2 * (max_spaces - min_spaces), max_spaces + len(text)):
+        source = _frames.pulse_text_frames(text, min_spaces, max_spaces, cycles)
+        _play_lines(source, delay, "\r" + text + "\n", scheduler, sink)
+        return
+    cycle = _cycles.pulse_text_cycle(text, min_spaces, max_spaces)
+    _play_cycle(cycle, len(cycle.period) * cycles, delay, scheduler, sink)
+
+
+def snake_line(
+    width: int = 30,
+    length: int = 8,
+    frames: int = 100,
+    delay: float = 0.04,
+    head: str = "O",
+    body: str = "o",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Draw a one-line snake that slithers horizontally.
 
@@ -262,56 +370,43 @@ def snake_line(width: int = 30, length: int = 8, frames: int = 100, delay: float
         delay: Delay between frames.
         head: Head character.
         body: Body character.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if width <= length:
-        raise ValueError("width must be greater than length")
-    if len(head) != 1 or len(body) != 1:
-        raise ValueError("head and body must be single characters")
-    positions = list(range(length))
-    direction = 1
-    for _ in range(frames):
-        line = [" "] * width
-        for idx, pos in enumerate(positions):
-            line[pos] = head if idx == length - 1 else body
-        sys.stdout.write("\r" + "".join(line))
-        sys.stdout.flush()
-        time.sleep(delay)
-        # advance
-        if positions[-1] >= width - 1:
-            direction = -1
-        elif positions[0] <= 0:
-            direction = 1
-        positions = [p + direction for p in positions]
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def progress_dots(text: str = "Loading", dots: int = 3, cycles: int = 5, delay: float = 0.3) -> None:
+    _frames._validate_snake_line(width, length, head, body)
+    if not _cycles.fits(2 * (width - length), width):
+        _play_lines(_frames.snake_line_frames(width, length, max(frames, 0), head, body), delay, "\n", scheduler, sink)
+        return
+    _play_cycle(_cycles.snake_line_cycle(width, length, head, body), max(frames, 0), delay, scheduler, sink)
+
+
+def progress_dots(
+    text: str = "Loading",
+    dots: int = 3,
+    cycles: int = 5,
+    delay: float = 0.3,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Animate trailing dots after a message."""
-    if dots <= 0 or cycles <= 0 or delay <= 0:
-        raise ValueError("dots, cycles, and delay must be positive")
-    for _ in range(cycles):
-        for i in range(dots + 1):
-            sys.stdout.write("\r" + text + "." * i + " " * (dots - i))
-            sys.stdout.flush()
-            time.sleep(delay)
-    sys.stdout.write("\r" + text + "." * dots + "\n")
-    sys.stdout.flush()
-
-
-def countdown(seconds: int = 5) -> None:
+    source = _frames.progress_dots_frames(text, dots, cycles)
+    _check_delay(delay)
+    _play_lines(source, delay, "\r" + text + "." * dots + "\n", scheduler, sink)
+
+
+def countdown(seconds: int = 5, scheduler: Optional[FrameScheduler] = None, sink: Optional[Sink] = None) -> None:
     """Simple countdown timer."""
-    if seconds < 0:
-        raise ValueError("seconds must be non-negative")
-    for remaining in range(seconds, -1, -1):
-        sys.stdout.write(f"\r{remaining:2d} seconds")
-        sys.stdout.flush()
-        time.sleep(1)
-    sys.stdout.write("\rGo!        \n")
-    sys.stdout.flush()
+    _play_lines(_frames.countdown_frames(seconds), 1, "\rGo!        \n", scheduler, sink)
 
 
-def ripple_line(width: int = 40, frames: int = 80, delay: float = 0.04, char: str = "*") -> None:
+def ripple_line(
+    width: int = 40,
+    frames: int = 80,
+    delay: float = 0.04,
+    char: str = "*",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Create a horizontal ripple using a sine wave.
 
@@ -320,90 +415,101 @@ def ripple_line(width: int = 40, frames: int = 80, delay: float = 0.04, char: st
         frames: Number of frames.
         delay: Delay between frames.
         char: Character used for the wave.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if width <= 0 or frames <= 0 or delay <= 0:
-        raise ValueError("width, frames, and delay must be positive")
-    for i in range(frames):
-        offset = int((math.sin(i / 4.0) + 1) * (width / 4))
-        sys.stdout.write("\r" + " " * offset + char)
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def bar_wave(width: int = 30, frames: int = 80, delay: float = 0.05, char: str = "|") -> None:
+    source = _frames.ripple_line_frames(width, frames, char)
+    _check_delay(delay)
+    _play_lines(source, delay, "\n", scheduler, sink)
+
+
+def bar_wave(
+    width: int = 30,
+    frames: int = 80,
+    delay: float = 0.05,
+    char: str = "|",
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Animate multiple bars moving like an equalizer."""
-    if width <= 0 or frames <= 0 or delay <= 0:
-        raise ValueError("width, frames, and delay must be positive")
-    for i in range(frames):
-        bars = []
-        for x in range(width):
-            height = int((math.sin((i + x) / 6.0) + 1) * 3) + 1
-            bars.append(char * height)
-        sys.stdout.write("\r" + " ".join(bars))
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def matrix_rain(width: int = 40, height: int = 12, frames: int = 80, delay: float = 0.05) -> None:
+    source = _frames.bar_wave_frames(width, frames, char)
+    _check_delay(delay)
+    _play_lines(source, delay, "\n", scheduler, sink)
+
+
+def matrix_rain(
+    width: int = 40,
+    height: int = 12,
+    frames: int = 80,
+    delay: float = 0.05,
+    seed: Optional[Union[int, random.Random]] = None,
+    trail: Tuple[int, int] = (4, 16),
+    speed: Tuple[float, float] = (0.35, 1.0),
+    color: bool = False,
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Simulate a matrix rain effect.
 
+    Without a ``renderer`` the rain writes only the cells it changed each
+    frame, so the cost follows the number of falling drops rather than
+    the screen size.
+
     Args:
         width: Number of columns.
         height: Number of rows.
         frames: Number of frames.
         delay: Delay between frames.
+        seed: Seed or ``random.Random`` instance, for reproducible runs.
+        trail: Inclusive ``(min, max)`` trail length of each drop.
+        speed: ``(min, max)`` rows per frame of each drop.
+        color: Fade the trails from white through green with ANSI colors.
+        renderer: Renderer used to diff plain frames; exposes bytes saved per frame.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if width <= 0 or height <= 0 or frames <= 0 or delay <= 0:
-        raise ValueError("width, height, frames, and delay must be positive")
-    heads = [random.randint(-height, 0) for _ in range(width)]
-    chars = "0123456789ABCDEF"
-    print("\n" * (height - 1))
-    for _ in range(frames):
-        grid = [[" " for _ in range(width)] for _ in range(height)]
-        for col in range(width):
-            head = heads[col]
-            if 0 <= head < height:
-                grid[head][col] = random.choice(chars)
-            if 0 <= head - 1 < height:
-                grid[head - 1][col] = "."
-            heads[col] += 1
-            if heads[col] > height + random.randint(2, 6):
-                heads[col] = random.randint(-height, 0)
-        move_cursor_home()
-        sys.stdout.write("\n".join("".join(row) for row in grid))
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def equalizer(bars: int = 16, height: int = 8, frames: int = 80, delay: float = 0.05, char: str = "#") -> None:
+    if renderer is not None:
+        if color:
+            raise ValueError("renderer cannot diff colored frames; omit it when color=True")
+        source = _frames.matrix_rain_frames(width, height, frames, seed, trail, speed)
+        _check_delay(delay)
+        _play_grid(source, height, delay, renderer, scheduler, sink)
+        return
+    if width <= 0 or height <= 0 or frames <= 0:
+        raise ValueError("width, height, and frames must be positive")
+    rain = _rain.MatrixRain(width, height, trail, speed, color=color, seed=seed)
+    _check_delay(delay)
+    _play_rain(rain, frames, delay, scheduler, sink)
+
+
+def equalizer(
+    bars: int = 16,
+    height: int = 8,
+    frames: int = 80,
+    delay: float = 0.05,
+    char: str = "#",
+    seed: Optional[Union[int, random.Random]] = None,
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Random bar equalizer animation."""
-    if bars <= 0 or height <= 0 or frames <= 0 or delay <= 0:
-        raise ValueError("bars, height, frames, and delay must be positive")
-    print("\n" * (height - 1))
-    for _ in range(frames):
-        bar_heights = [random.randint(1, height) for _ in range(bars)]
-        lines = []
-        for row in range(height, 0, -1):
-            line = []
-            for h in bar_heights:
-                line.append(char if h >= row else " ")
-            lines.append(" ".join(line))
-        move_cursor_home()
-        sys.stdout.write("\n".join(lines))
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def fireworks(bursts: int = 4, size: int = 12, delay: float = 0.12, char: str = "*") -> None:
+    source = _frames.equalizer_frames(bars, height, frames, char, seed)
+    _check_delay(delay)
+    _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+def fireworks(
+    bursts: int = 4,
+    size: int = 12,
+    delay: float = 0.12,
+    char: str = "*",
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """
     Radial fireworks bursts.
 
@@ -412,196 +518,119 @@ def fireworks(bursts: int = 4, size: int = 12, delay: float = 0.12, char: str =
         size: Canvas size (square).
         delay: Delay between frames.
         char: Character used for sparkles.
+        renderer: Renderer used to diff frames; exposes bytes saved per frame.
+        scheduler: Frame pacer; exposes achieved FPS, jitter and dropped frames.
+        sink: Output destination; each frame is one write and flush (stdout by default).
     """
-    if bursts <= 0 or size <= 2 or delay <= 0:
-        raise ValueError("bursts must be positive, size > 2, delay positive")
-    if len(char) != 1:
-        raise ValueError("char must be a single character")
-    center = size // 2
-    print("\n" * (size - 1))
-    for _ in range(bursts):
-        for radius in range(1, center + 1):
-            lines = []
-            for row in range(size):
-                line_chars = []
-                for col in range(size):
-                    dist = abs(row - center) + abs(col - center)
-                    if dist == radius:
-                        line_chars.append(char)
-                    elif dist == radius - 1:
-                        line_chars.append(".")
-                    else:
-                        line_chars.append(" ")
-                lines.append("".join(line_chars))
-            move_cursor_home()
-            sys.stdout.write("\n".join(lines))
-            sys.stdout.flush()
-            time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def twinkle_stars(width: int = 40, height: int = 8, frames: int = 80, delay: float = 0.07, density: float = 0.15) -> None:
+    _frames._validate_fireworks(bursts, size, char)
+    _check_delay(delay)
+    if renderer is None:
+        _play_cycle(_cycles.fireworks_cycle(size, char), bursts * (size // 2), delay, scheduler, sink)
+    else:
+        _play_grid(_frames.fireworks_frames(bursts, size, char), size, delay, renderer, scheduler, sink)
+
+
+def twinkle_stars(
+    width: int = 40,
+    height: int = 8,
+    frames: int = 80,
+    delay: float = 0.07,
+    density: float = 0.15,
+    seed: Optional[Union[int, random.Random]] = None,
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Starfield twinkling effect."""
-    if width <= 0 or height <= 0 or frames <= 0 or delay <= 0:
-        raise ValueError("width, height, frames, and delay must be positive")
-    if not (0 <= density <= 1):
-        raise ValueError("density must be between 0 and 1")
-    print("\n" * (height - 1))
-    for _ in range(frames):
-        lines = []
-        for _ in range(height):
-            line_chars = []
-            for _ in range(width):
-                if random.random() < density:
-                    line_chars.append(random.choice([".", "*", "+"]))
-                else:
-                    line_chars.append(" ")
-            lines.append("".join(line_chars))
-        move_cursor_home()
-        sys.stdout.write("\n".join(lines))
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def dna_helix(frames: int = 80, delay: float = 0.06) -> None:
+    source = _frames.twinkle_stars_frames(width, height, frames, density, seed)
+    _check_delay(delay)
+    _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+def dna_helix(
+    frames: int = 80,
+    delay: float = 0.06,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Animate a simple ASCII DNA helix."""
-    pattern = [
-        ("  A   T  ", " /     \\ "),
-        ("   A T   ", "  /   \\  "),
-        ("    X    ", "   / \\   "),
-        ("   T A   ", "  \\   /  "),
-        ("  T   A  ", " \\     / "),
-        ("   T A   ", "  \\   /  "),
-        ("    X    ", "   \\ /   "),
-        ("   A T   ", "  /   \\  "),
-    ]
-    if frames <= 0 or delay <= 0:
-        raise ValueError("frames and delay must be positive")
-    for i in range(frames):
-        top, bottom = pattern[i % len(pattern)]
-        sys.stdout.write("\r" + top + "\n" + bottom)
-        sys.stdout.flush()
-        time.sleep(delay)
-        move_cursor_home()
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def shooting_star(width: int = 40, height: int = 10, frames: int = 60, delay: float = 0.05, char: str = "*") -> None:
+    _frames._validate_frames(frames)
+    _check_delay(delay)
+    _play_cycle(_cycles.dna_helix_cycle(), frames, delay, scheduler, sink)
+
+
+def shooting_star(
+    width: int = 40,
+    height: int = 10,
+    frames: int = 60,
+    delay: float = 0.05,
+    char: str = "*",
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Diagonal shooting star animation."""
-    if width <= 0 or height <= 0 or frames <= 0 or delay <= 0:
-        raise ValueError("width, height, frames, and delay must be positive")
-    print("\n" * (height - 1))
-    for i in range(frames):
-        x = min(width - 1, i)
-        y = min(height - 1, i // 2)
-        lines = []
-        for row in range(height):
-            line_chars = []
-            for col in range(width):
-                if (col, row) == (x, y):
-                    line_chars.append(char)
-                elif (col, row) == (x - 1, y - 1):
-                    line_chars.append(".")
-                elif (col, row) == (x - 2, y - 2):
-                    line_chars.append(".")
-                else:
-                    line_chars.append(" ")
-            lines.append("".join(line_chars))
-        move_cursor_home()
-        sys.stdout.write("\n".join(lines))
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def rising_bar(width: int = 20, height: int = 8, frames: int = 60, delay: float = 0.05, char: str = "#") -> None:
+    source = _frames.shooting_star_frames(width, height, frames, char)
+    _check_delay(delay)
+    _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+def rising_bar(
+    width: int = 20,
+    height: int = 8,
+    frames: int = 60,
+    delay: float = 0.05,
+    char: str = "#",
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Bar that rises and falls inside a frame."""
-    if width <= 0 or height <= 0 or frames <= 0 or delay <= 0:
-        raise ValueError("width, height, frames, and delay must be positive")
-    print("\n" * (height - 1))
-    for i in range(frames):
-        level = int((math.sin(i / 6.0) + 1) * (height / 2))
-        lines = []
-        for row in range(height):
-            if height - row <= level:
-                lines.append(char * width)
-            else:
-                lines.append(" " * width)
-        move_cursor_home()
-        sys.stdout.write("\n".join(lines))
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def orbit(radius: int = 6, frames: int = 100, delay: float = 0.05) -> None:
+    source = _frames.rising_bar_frames(width, height, frames, char)
+    _check_delay(delay)
+    _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+def orbit(
+    radius: int = 6,
+    frames: int = 100,
+    delay: float = 0.05,
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Orbiting dot around a center point."""
-    diameter = radius * 2 + 1
-    print("\n" * (diameter - 1))
-    for i in range(frames):
-        angle = (i / frames) * 2 * math.pi
-        x = int(radius + radius * math.cos(angle))
-        y = int(radius + radius * math.sin(angle))
-        lines = []
-        for row in range(diameter):
-            line_chars = []
-            for col in range(diameter):
-                if (col, row) == (x, y):
-                    line_chars.append("o")
-                elif (col, row) == (radius, radius):
-                    line_chars.append("+")
-                else:
-                    line_chars.append(" ")
-            lines.append("".join(line_chars))
-        move_cursor_home()
-        sys.stdout.write("\n".join(lines))
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def falling_sand(width: int = 30, height: int = 10, frames: int = 80, delay: float = 0.05, density: float = 0.2) -> None:
+    source = _frames.orbit_frames(radius, frames)
+    _check_delay(delay)
+    _play_grid(source, radius * 2 + 1, delay, renderer, scheduler, sink)
+
+
+def falling_sand(
+    width: int = 30,
+    height: int = 10,
+    frames: int = 80,
+    delay: float = 0.05,
+    density: float = 0.2,
+    seed: Optional[Union[int, random.Random]] = None,
+    materials: Sequence[str] = ("sand",),
+    renderer: Optional[FrameRenderer] = None,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Simple falling sand simulation."""
-    if not (0 <= density <= 1):
-        raise ValueError("density must be between 0 and 1")
-    if width <= 0 or height <= 0 or frames <= 0 or delay <= 0:
-        raise ValueError("width, height, frames, and delay must be positive")
-    grid = [[" " for _ in range(width)] for _ in range(height)]
-    print("\n" * (height - 1))
-    for _ in range(frames):
-        # spawn new particles at the top row
-        for col in range(width):
-            if random.random() < density:
-                grid[0][col] = "."
-        # update falling
-        for row in range(height - 2, -1, -1):
-            for col in range(width):
-                if grid[row][col] != " " and grid[row + 1][col] == " ":
-                    grid[row + 1][col] = grid[row][col]
-                    grid[row][col] = " "
-        move_cursor_home()
-        sys.stdout.write("\n".join("".join(line) for line in grid))
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-
-
-def carousel(text: str = "Loading", frames: int = 80, delay: float = 0.08) -> None:
+    source = _frames.falling_sand_frames(width, height, frames, density, seed, materials)
+    _check_delay(delay)
+    _play_grid(source, height, delay, renderer, scheduler, sink)
+
+
+def carousel(
+    text: str = "Loading",
+    frames: int = 80,
+    delay: float = 0.08,
+    scheduler: Optional[FrameScheduler] = None,
+    sink: Optional[Sink] = None,
+) -> None:
     """Rotating line characters beside text."""
-    if frames <= 0 or delay <= 0:
-        raise ValueError("frames and delay must be positive")
-    frames_cycle = cycle(["-", "\\", "|", "/"])
-    for _ in range(frames):
-        sys.stdout.write("\r" + next(frames_cycle) + " " + text)
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write("\r" + "[done] " + text + "   \n")
-    sys.stdout.flush()
+    _frames._validate_frames(frames)
+    _check_delay(delay)
+    _play_cycle(_cycles.carousel_cycle(text), frames, delay, scheduler, sink)
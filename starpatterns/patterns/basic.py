@@ -1,6 +1,10 @@
-"""Basic ASCII patterns."""
+"""Basic ASCII patterns, drawn with the span engine in :mod:`.shapes`."""
 
-from typing import List
+from __future__ import annotations
+
+from typing import Iterator
+
+from .shapes import _band_lines, _run_lines
 
 
 def _validate_size(size: int) -> int:
@@ -11,9 +15,9 @@ def _validate_size(size: int) -> int:
     return size
 
 
-def triangle(height: int, char: str = "*") -> str:
+def iter_triangle(height: int, char: str = "*") -> Iterator[str]:
     """
-    Build a left-aligned triangle.
+    Yield the rows of a left-aligned triangle one at a time.
 
     Args:
         height: Number of rows in the triangle.
@@ -22,15 +26,24 @@ def triangle(height: int, char: str = "*") -> str:
     _validate_size(height)
     if len(char) != 1:
         raise ValueError("char must be a single character")
-    lines: List[str] = []
-    for i in range(1, height + 1):
-        lines.append(char * i)
-    return "\n".join(lines)
 
+    return _run_lines(height, range(1, height + 1), char, pad=False)
 
-def square(size: int, char: str = "*") -> str:
+
+def triangle(height: int, char: str = "*") -> str:
     """
-    Build a filled square.
+    Build a left-aligned triangle.
+
+    Args:
+        height: Number of rows in the triangle.
+        char: Single character used to draw the triangle.
+    """
+    return "\n".join(iter_triangle(height, char))
+
+
+def iter_square(size: int, char: str = "*") -> Iterator[str]:
+    """
+    Yield the rows of a filled square one at a time.
 
     Args:
         size: Width and height of the square.
@@ -39,13 +52,24 @@ def square(size: int, char: str = "*") -> str:
     _validate_size(size)
     if len(char) != 1:
         raise ValueError("char must be a single character")
-    line = char * size
-    return "\n".join(line for _ in range(size))
 
+    return _band_lines(size, [((0, size),)], [size], char)
 
-def diamond(size: int, char: str = "*") -> str:
+
+def square(size: int, char: str = "*") -> str:
     """
-    Build a centered diamond. Size must be an odd integer.
+    Build a filled square.
+
+    Args:
+        size: Width and height of the square.
+        char: Single character used to draw the square.
+    """
+    return "\n".join(iter_square(size, char))
+
+
+def iter_diamond(size: int, char: str = "*") -> Iterator[str]:
+    """
+    Yield the rows of a centered diamond one at a time. Size must be odd.
 
     Args:
         size: Width/height of the diamond (must be odd).
@@ -57,10 +81,17 @@ def diamond(size: int, char: str = "*") -> str:
     if len(char) != 1:
         raise ValueError("char must be a single character")
 
-    mid = size // 2
-    lines: List[str] = []
-    for i in range(size):
-        distance = abs(mid - i)
-        fill = char * (size - 2 * distance)
-        lines.append(" " * distance + fill + " " * distance)
-    return "\n".join(lines)
+    # Runs grow by two up to the middle row, then shrink.
+    lengths = [*range(1, size + 1, 2), *range(size - 2, 0, -2)]
+    return _run_lines(size, lengths, char, centered=True)
+
+
+def diamond(size: int, char: str = "*") -> str:
+    """
+    Build a centered diamond. Size must be an odd integer.
+
+    Args:
+        size: Width/height of the diamond (must be odd).
+        char: Single character used to draw the diamond.
+    """
+    return "\n".join(iter_diamond(size, char))
@@ -0,0 +1,214 @@
+"""
+Opt-in LRU memoization for the static pattern builders.
+
+The builders in :mod:`~starpatterns.patterns.basic`,
+:mod:`~starpatterns.patterns.advanced` and
+:mod:`~starpatterns.patterns.fractal` are pure functions of their
+arguments. This module re-exports them wrapped in a shared
+:class:`PatternCache`, bounded both by entry count and by memory, so
+repeated calls return the stored string instead of rebuilding it::
+
+    from starpatterns.patterns import cache
+
+    banner = cache.diamond(9)
+    cache.cache_info()
+
+Entries are keyed on the arguments bound to the builder's signature with
+defaults filled in, so ``diamond(9)``, ``diamond(9, "*")`` and
+``diamond(size=9)`` share one entry.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from . import advanced, basic, fractal
+
+if TYPE_CHECKING:
+    import inspect
+
+
+class CacheInfo(NamedTuple):
+    """Counters and limits of a :class:`PatternCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    oversized: int
+    maxsize: int
+    max_bytes: int
+    currsize: int
+    nbytes: int
+
+
+class PatternCache:
+    """
+    Thread-safe LRU cache for pattern strings with an entry and byte budget.
+
+    Results larger than ``max_item_bytes`` are returned but never stored, so
+    a single huge pattern cannot flush every small one out of the cache.
+
+    Args:
+        maxsize: Maximum number of cached patterns.
+        max_bytes: Maximum total size of cached strings, in bytes.
+        max_item_bytes: Largest single string worth caching; defaults to a
+            sixteenth of ``max_bytes``.
+    """
+
+    def __init__(self, maxsize: int = 256, max_bytes: int = 16 << 20, max_item_bytes: Optional[int] = None) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[str, int]]" = OrderedDict()
+        self._nbytes = 0
+        self.hits = self.misses = self.evictions = self.oversized = 0
+        self.configure(maxsize, max_bytes, max_item_bytes)
+
+    def configure(self, maxsize: int, max_bytes: int, max_item_bytes: Optional[int] = None) -> None:
+        """Change the limits, evicting least recently used entries to fit."""
+        if maxsize < 0 or max_bytes < 0:
+            raise ValueError("maxsize and max_bytes must be non-negative")
+        if max_item_bytes is None:
+            max_item_bytes = max_bytes // 16
+        if max_item_bytes < 0:
+            raise ValueError("max_item_bytes must be non-negative")
+        with self._lock:
+            self.maxsize = maxsize
+            self.max_bytes = max_bytes
+            self.max_item_bytes = min(max_item_bytes, max_bytes)
+            self._evict()
+
+    def get(self, builder: Callable[..., str], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        """
+        Return ``builder(*args, **kwargs)``, from the cache when possible.
+
+        Calls that bind to the same parameters, once defaults are applied,
+        share an entry; arguments the builder does not accept raise
+        ``TypeError`` as the call itself would.
+        """
+        args, kwargs = _bind(builder, args, kwargs)
+        key: Hashable = (builder, args, tuple(sorted(kwargs.items()))) if kwargs else (builder, args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        return self._store(key, builder(*args, **kwargs))
+
+    def wrap(self, builder: Callable[..., str]) -> Callable[..., str]:
+        """Return a cached version of ``builder`` with ``cache_info``/``cache_clear``."""
+        get = self.get
+
+        @functools.wraps(builder)
+        def cached(*args: Any, **kwargs: Any) -> str:
+            return get(builder, args, kwargs)
+
+        cached.cache_info = self.cache_info  # type: ignore[attr-defined]
+        cached.cache_clear = self.cache_clear  # type: ignore[attr-defined]
+        return cached
+
+    def _store(self, key: Hashable, value: str) -> str:
+        if self.maxsize == 0:
+            # Caching is disabled; nothing is oversized.
+            return value
+        size = sys.getsizeof(value)
+        with self._lock:
+            if size > self.max_item_bytes:
+                self.oversized += 1
+            elif key not in self._entries:
+                self._entries[key] = (value, size)
+                self._nbytes += size
+                self._evict()
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss/eviction counters and current usage."""
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.oversized,
+                self.maxsize,
+                self.max_bytes,
+                len(self._entries),
+                self._nbytes,
+            )
+
+    def cache_clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = self.oversized = 0
+
+    def _evict(self) -> None:
+        entries = self._entries
+        while entries and (len(entries) > self.maxsize or self._nbytes > self.max_bytes):
+            _, (_, size) = entries.popitem(last=False)
+            self._nbytes -= size
+            self.evictions += 1
+
+
+@functools.lru_cache(maxsize=128)
+def _signature(builder: Callable[..., str]) -> Tuple["inspect.Signature", int, Optional[Tuple[Any, ...]]]:
+    """
+    Return ``builder``'s signature, its number of required parameters and,
+    when every parameter is positional-or-keyword, all their defaults.
+    """
+    # inspect is slow to import and only needed once a cached builder runs.
+    import inspect
+
+    signature = inspect.signature(builder)
+    parameters = signature.parameters.values()
+    required = sum(parameter.default is parameter.empty for parameter in parameters)
+    plain = all(parameter.kind is parameter.POSITIONAL_OR_KEYWORD for parameter in parameters)
+    return signature, required, tuple(parameter.default for parameter in parameters) if plain else None
+
+
+def _bind(
+    builder: Callable[..., str], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """Bind a call to ``builder``'s signature and fill in the defaults."""
+    signature, required, defaults = _signature(builder)
+    # Plain positional calls, the common case, skip Signature.bind.
+    if not kwargs and defaults is not None and required <= len(args) <= len(defaults):
+        return args + defaults[len(args) :], kwargs
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.args, bound.kwargs
+
+
+default_cache = PatternCache()
+
+triangle = default_cache.wrap(basic.triangle)
+square = default_cache.wrap(basic.square)
+diamond = default_cache.wrap(basic.diamond)
+hollow_square = default_cache.wrap(advanced.hollow_square)
+cross = default_cache.wrap(advanced.cross)
+hourglass = default_cache.wrap(advanced.hourglass)
+sierpinski = default_cache.wrap(fractal.sierpinski)
+
+cache_info = default_cache.cache_info
+cache_clear = default_cache.cache_clear
+configure = default_cache.configure
+
+__all__ = [
+    "CacheInfo",
+    "PatternCache",
+    "default_cache",
+    "triangle",
+    "square",
+    "diamond",
+    "hollow_square",
+    "cross",
+    "hourglass",
+    "sierpinski",
+    "cache_info",
+    "cache_clear",
+    "configure",
+]
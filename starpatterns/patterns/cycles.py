@@ -0,0 +1,168 @@
+"""
+Pre-rendered frame cycles for the deterministic, periodic animations.
+
+Animations such as ``marquee`` or ``fireworks`` repeat the same frames
+over and over. Their output for one period is rendered once, encoded to
+UTF-8 and kept in an LRU cache keyed on the parameters that shape the
+frames (not on how many frames are played), so later frames, cycles and
+calls only hand a ready-made buffer to the sink.
+
+A period grows with the line width (a marquee over a 10,000-column window
+is 10,000 frames of 10,000 bytes), so single-line cycles are only built
+when :func:`fits` allows it; the players stream wider ones frame by frame.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import chain, cycle, islice, repeat
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from ..utils.renderer import FrameRenderer
+from ..utils.terminal import CURSOR_HOME
+from . import frames as _frames
+
+# Cycles kept per animation; each holds at most two periods of payloads.
+CACHE_SIZE = 32
+# Largest single-line period pre-rendered, in bytes, so each cache stays
+# under CACHE_SIZE * MAX_CYCLE_BYTES (8 MiB).
+MAX_CYCLE_BYTES = 1 << 18
+
+
+class FrameCycle(NamedTuple):
+    """
+    Encoded output of a periodic animation.
+
+    Frame ``i`` is ``intro[i]`` for the first ``len(intro)`` frames and
+    ``period[(i - len(intro)) % len(period)]`` afterwards.
+
+    Attributes:
+        start: Written once before the first frame.
+        intro: Payloads that only appear at the beginning (a diffing
+            renderer's first pass, which starts from a blank screen).
+        period: Payloads repeated for the rest of the run.
+        end: Written once after the last frame.
+    """
+
+    start: bytes
+    intro: Tuple[bytes, ...]
+    period: Tuple[bytes, ...]
+    end: bytes
+
+    def payloads(self, count: Optional[int] = None) -> Iterator[bytes]:
+        """Yield the payloads of ``count`` frames, or endlessly when ``None``."""
+        if count is None:
+            return chain(self.intro, cycle(self.period))
+        head = self.intro[:count]
+        full, part = divmod(count - len(head), len(self.period))
+        return chain(head, chain.from_iterable(repeat(self.period, full)), self.period[:part])
+
+
+def fits(frames: int, width: int) -> bool:
+    """Whether a period of ``frames`` lines of ``width`` columns is small enough to cache."""
+    return frames * (width + 1) <= MAX_CYCLE_BYTES
+
+
+def _line_cycle(frames: Iterable[str], period: Optional[int], end: str) -> FrameCycle:
+    payloads = tuple(("\r" + frame).encode("utf-8") for frame in islice(frames, period))
+    return FrameCycle(b"", (), payloads, end.encode("utf-8"))
+
+
+def _grid_cycle(frames: Iterable[List[str]], period: int, height: int) -> FrameCycle:
+    renderer = FrameRenderer()
+    payloads = [renderer.render(lines).encode("utf-8") for lines in islice(frames, 2 * period)]
+    end = (renderer.finish() + "\n").encode("utf-8")
+    return FrameCycle(b"\n" * height, tuple(payloads[:period]), tuple(payloads[period:]), end)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def wave_text_cycle(text: str, amplitude: int) -> FrameCycle:
+    """
+    The ``2 * amplitude + 1`` distinct ``wave_text`` frames, one per indentation.
+
+    ``sin(i / 4)`` has no whole-frame period, so instead of a run of frames
+    the period holds one payload per offset; play it in the order given by
+    :func:`~starpatterns.patterns.frames.wave_text_offsets`.
+    """
+    frames = (" " * offset + text for offset in range(2 * amplitude + 1))
+    return _line_cycle(frames, None, "\r" + text + "\n")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def marquee_cycle(text: str, width: int) -> FrameCycle:
+    """One scroll of ``marquee``; play ``len(period) * cycles`` frames."""
+    return _line_cycle(_frames.marquee_frames(text, width, 1), None, "\r" + " " * width + "\r")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def pulse_text_cycle(text: str, min_spaces: int, max_spaces: int) -> FrameCycle:
+    """One expand/contract cycle of ``pulse_text``."""
+    return _line_cycle(_frames.pulse_text_frames(text, min_spaces, max_spaces, 1), None, "\r" + text + "\n")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def bouncing_text_cycle(text: str, width: int) -> FrameCycle:
+    """One left-right round trip of ``bouncing_text``."""
+    period = 2 * (width - len(text))
+    return _line_cycle(_frames.bouncing_text_frames(text, width, period), period, "\r" + text + "\n")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def snake_line_cycle(width: int, length: int, head: str, body: str) -> FrameCycle:
+    """One round trip of ``snake_line``."""
+    period = 2 * (width - length)
+    return _line_cycle(_frames.snake_line_frames(width, length, period, head, body), period, "\n")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def spinner_cycle(text: str) -> FrameCycle:
+    """The four spinner frames."""
+    return _line_cycle(_frames.spinner_frames(text), 4, "\r[done] " + text + " " * 3 + "\n")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def carousel_cycle(text: str) -> FrameCycle:
+    """The four carousel frames."""
+    return _line_cycle(_frames.carousel_frames(text, 4), 4, "\r" + "[done] " + text + "   \n")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def dna_helix_cycle() -> FrameCycle:
+    """One turn of ``dna_helix``, each frame ending with a cursor-home."""
+    period = len(_frames._DNA_PATTERN)
+    payloads = tuple(
+        ("\r" + top + "\n" + bottom + CURSOR_HOME).encode("utf-8")
+        for top, bottom in _frames.dna_helix_frames(period)
+    )
+    return FrameCycle(b"", (), payloads, b"\n")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fireworks_cycle(size: int, char: str) -> FrameCycle:
+    """One burst of ``fireworks`` as diffed updates; the first burst starts blank."""
+    period = size // 2
+    return _grid_cycle(_frames.fireworks_frames(2, size, char), period, size)
+
+
+_BUILDERS = (
+    wave_text_cycle,
+    marquee_cycle,
+    pulse_text_cycle,
+    bouncing_text_cycle,
+    snake_line_cycle,
+    spinner_cycle,
+    carousel_cycle,
+    dna_helix_cycle,
+    fireworks_cycle,
+)
+
+
+def cache_clear() -> None:
+    """Drop every cached frame cycle."""
+    for builder in _BUILDERS:
+        builder.cache_clear()
+
+
+def cache_size() -> int:
+    """Return the number of cached frame cycles."""
+    return sum(builder.cache_info().currsize for builder in _BUILDERS)
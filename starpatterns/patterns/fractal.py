@@ -1,16 +1,13 @@
 """Fractal patterns such as the Sierpinski triangle."""
 
-from typing import List
+from __future__ import annotations
 
+from typing import IO, Iterator
 
-def sierpinski(order: int, char: str = "*") -> str:
-    """
-    Generate a Sierpinski triangle using recursive expansion.
+from .stream import write_rows
 
-    Args:
-        order: Recursion depth (0 yields a single character).
-        char: Character used to render the triangle.
-    """
+
+def _validate_order(order: int, char: str) -> None:
     if not isinstance(order, int):
         raise TypeError("order must be an integer")
     if order < 0:
@@ -18,11 +15,58 @@ def sierpinski(order: int, char: str = "*") -> str:
     if len(char) != 1:
         raise ValueError("char must be a single character")
 
-    lines: List[str] = [char]
-    # Each iteration doubles the width and height while inserting spacing.
-    for level in range(order):
-        spacing = " " * (2 ** level)
-        top = [spacing + line + spacing for line in lines]
-        bottom = [line + " " + line for line in lines]
-        lines = top + bottom
-    return "\n".join(lines)
+
+def iter_sierpinski(order: int, char: str = "*") -> Iterator[str]:
+    """
+    Yield the rows of a Sierpinski triangle one at a time.
+
+    Row ``r`` has a mark at every ``k`` where ``C(r, k)`` is odd, i.e. row
+    ``r`` of Pascal's triangle mod 2. That row is kept as the bits of an
+    integer and advanced with ``row ^ (row << 1)``, so memory stays
+    proportional to one row instead of the whole triangle.
+
+    Args:
+        order: Recursion depth (0 yields a single character).
+        char: Character used to render the triangle.
+    """
+    _validate_order(order, char)
+
+    def generate() -> Iterator[str]:
+        height = 1 << order
+        bits = 1
+        for row in range(height):
+            pad = " " * (height - 1 - row)
+            cells = format(bits, "b").replace("0", " ").replace("1", char)
+            yield pad + " ".join(cells) + pad
+            bits ^= bits << 1
+
+    return generate()
+
+
+def sierpinski(order: int, char: str = "*") -> str:
+    """
+    Generate a Sierpinski triangle.
+
+    Args:
+        order: Recursion depth (0 yields a single character).
+        char: Character used to render the triangle.
+    """
+    return "\n".join(iter_sierpinski(order, char))
+
+
+def write_sierpinski(order: int, fileobj: IO, char: str = "*") -> int:
+    """
+    Stream a Sierpinski triangle to a text or binary file object.
+
+    The output is byte-identical to :func:`sierpinski` (UTF-8 for binary
+    files) while only one row is held in memory at a time.
+
+    Args:
+        order: Recursion depth (0 yields a single character).
+        fileobj: Destination with a ``write``/``writelines`` method.
+        char: Character used to render the triangle.
+
+    Returns:
+        Number of characters written.
+    """
+    return write_rows(iter_sierpinski(order, char), fileobj)
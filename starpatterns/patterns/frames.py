@@ -0,0 +1,651 @@
+"""
+Frame generators behind every animation.
+
+Each ``*_frames`` function validates its arguments and returns an iterator
+of frames without touching the terminal or sleeping. Single-line
+animations yield ``str`` frames; multi-line animations yield ``List[str]``
+canvases (one string per row). The players in
+:mod:`starpatterns.patterns.animation` are thin loops over these.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from itertools import cycle
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from . import _numpy
+from . import rain as _rain
+from . import sand as _sand
+from ._numpy import use_numpy
+
+_DNA_PATTERN = [
+    ("  A   T  ", " /     \\ "),
+    ("   A T   ", "  /   \\  "),
+    ("    X    ", "   / \\   "),
+    ("   T A   ", "  \\   /  "),
+    ("  T   A  ", " \\     / "),
+    ("   T A   ", "  \\   /  "),
+    ("    X    ", "   \\ /   "),
+    ("   A T   ", "  /   \\  "),
+]
+
+
+def _make_rng(seed: Optional[Union[int, random.Random]]) -> random.Random:
+    """Return ``seed`` itself when it is a generator, else a new one seeded with it."""
+    return seed if isinstance(seed, random.Random) else random.Random(seed)
+
+
+def wave_text_frames(text: str, amplitude: int = 2, cycles: int = 2) -> Iterator[str]:
+    """
+    Yield lines of text moving in a horizontal sine wave.
+
+    Args:
+        text: Text to animate.
+        amplitude: Maximum indentation in spaces.
+        cycles: Number of full sine cycles to render.
+    """
+    return (" " * offset + text for offset in wave_text_offsets(amplitude, cycles))
+
+
+def wave_text_offsets(amplitude: int = 2, cycles: int = 2) -> Iterator[int]:
+    """
+    Yield the indentation of every ``wave_text`` frame, from ``0`` to ``2 * amplitude``.
+
+    Args:
+        amplitude: Maximum indentation in spaces.
+        cycles: Number of full sine cycles to render.
+    """
+    if amplitude < 0:
+        raise ValueError("amplitude must be non-negative")
+    frames = int(cycles * 2 * math.pi * 4) or 1
+    return (int(amplitude * (1 + math.sin(i / 4.0))) for i in range(frames))
+
+
+def bouncing_ball_frames(width: int = 20, height: int = 5, frames: int = 80, char: str = "o") -> Iterator[List[str]]:
+    """
+    Yield canvases of a single ball bouncing within a rectangular field.
+
+    Args:
+        width: Width of the field.
+        height: Height of the field.
+        frames: Number of frames to render.
+        char: Character used for the ball.
+    """
+    if width < 2 or height < 2:
+        raise ValueError("width and height must be at least 2")
+    if len(char) != 1:
+        raise ValueError("char must be a single character")
+
+    def generate() -> Iterator[List[str]]:
+        blank = " " * width
+        x, y = 0, 0
+        dx, dy = 1, 1
+        for _ in range(frames):
+            lines = [blank] * height
+            lines[y] = " " * x + char + " " * (width - x - 1)
+            yield lines
+            x += dx
+            y += dy
+            if x <= 0 or x >= width - 1:
+                dx *= -1
+            if y <= 0 or y >= height - 1:
+                dy *= -1
+
+    return generate()
+
+
+def spinner_frames(text: str = "Loading") -> Iterator[str]:
+    """
+    Yield an endless classic command-line spinner.
+
+    Args:
+        text: Text to render beside the spinner.
+    """
+    return (f"{frame} {text}" for frame in cycle("|/-\\"))
+
+
+def loading_bar_frames(width: int = 30, char: str = "#") -> Iterator[str]:
+    """
+    Yield a horizontal progress bar filling from empty to full.
+
+    Args:
+        width: Number of bar cells.
+        char: Fill character for the bar.
+    """
+    if width <= 0:
+        raise ValueError("width must be positive")
+    if len(char) != 1:
+        raise ValueError("char must be a single character")
+    return (
+        f"[{char * i}{' ' * (width - i)}] {int((i / width) * 100):3d}%"
+        for i in range(width + 1)
+    )
+
+
+def typing_text_frames(text: str, cursor: str = "|") -> Iterator[str]:
+    """
+    Yield text typed out character-by-character.
+
+    Args:
+        text: Text to render.
+        cursor: Cursor indicator appended while typing.
+    """
+    return (text[:i] + (cursor if i < len(text) else " ") for i in range(len(text) + 1))
+
+
+def blinking_text_frames(text: str, blinks: int = 6) -> Iterator[str]:
+    """
+    Yield text alternately shown and blanked.
+
+    Args:
+        text: Text to blink.
+        blinks: Number of on/off cycles.
+    """
+    if blinks <= 0:
+        raise ValueError("blinks must be positive")
+    blank = " " * len(text)
+    return (text if i % 2 == 0 else blank for i in range(blinks * 2))
+
+
+def _validate_frames(frames: int) -> None:
+    if frames <= 0:
+        raise ValueError("frames must be positive")
+
+
+def _validate_marquee(width: int) -> None:
+    if width <= 0:
+        raise ValueError("width must be positive")
+
+
+def marquee_frames(text: str, width: int = 30, cycles: int = 3) -> Iterator[str]:
+    """
+    Yield a window scrolling horizontally across text.
+
+    Args:
+        text: Text to scroll.
+        width: Visible window width.
+        cycles: Number of full scroll cycles.
+    """
+    _validate_marquee(width)
+    padded = " " * width + text + " " * width
+    steps = len(text) + width
+    return (padded[i : i + width] for _ in range(cycles) for i in range(steps))
+
+
+def _validate_bouncing_text(text: str, width: int, frames: int) -> None:
+    if width <= len(text):
+        raise ValueError("width must be greater than text length")
+    _validate_frames(frames)
+
+
+def bouncing_text_frames(text: str, width: int = 30, frames: int = 60) -> Iterator[str]:
+    """
+    Yield a piece of text bouncing left and right.
+
+    Args:
+        text: Text to move.
+        width: Total line width.
+        frames: Number of frames.
+    """
+    _validate_bouncing_text(text, width, frames)
+
+    def generate() -> Iterator[str]:
+        pos = 0
+        direction = 1
+        max_pos = width - len(text)
+        for _ in range(frames):
+            yield " " * pos + text + " " * (max_pos - pos)
+            pos += direction
+            if pos <= 0 or pos >= max_pos:
+                direction *= -1
+
+    return generate()
+
+
+def _validate_pulse_text(min_spaces: int, max_spaces: int, cycles: int) -> None:
+    if min_spaces < 0 or max_spaces < min_spaces:
+        raise ValueError("spaces must be non-negative and max >= min")
+    if cycles <= 0:
+        raise ValueError("cycles must be positive")
+
+
+def pulse_text_frames(text: str, min_spaces: int = 0, max_spaces: int = 6, cycles: int = 6) -> Iterator[str]:
+    """
+    Yield text pulsing in and out by indentation.
+
+    Args:
+        text: Text to pulse.
+        min_spaces: Minimum indentation.
+        max_spaces: Maximum indentation.
+        cycles: Number of expand/contract cycles.
+    """
+    _validate_pulse_text(min_spaces, max_spaces, cycles)
+    offsets = list(range(min_spaces, max_spaces + 1)) + list(range(max_spaces - 1, min_spaces, -1))
+    return (" " * offset + text for _ in range(cycles) for offset in offsets)
+
+
+def _validate_snake_line(width: int, length: int, head: str, body: str) -> None:
+    if width <= length:
+        raise ValueError("width must be greater than length")
+    if len(head) != 1 or len(body) != 1:
+        raise ValueError("head and body must be single characters")
+
+
+def snake_line_frames(
+    width: int = 30,
+    length: int = 8,
+    frames: int = 100,
+    head: str = "O",
+    body: str = "o",
+) -> Iterator[str]:
+    """
+    Yield a one-line snake slithering horizontally.
+
+    Args:
+        width: Total line width.
+        length: Snake length.
+        frames: Number of frames.
+        head: Head character.
+        body: Body character.
+    """
+    _validate_snake_line(width, length, head, body)
+
+    def generate() -> Iterator[str]:
+        snake = body * (length - 1) + head
+        start = 0
+        direction = 1
+        for _ in range(frames):
+            end = start + length
+            yield " " * start + snake + " " * (width - end)
+            if end - 1 >= width - 1:
+                direction = -1
+            elif start <= 0:
+                direction = 1
+            start += direction
+
+    return generate()
+
+
+def progress_dots_frames(text: str = "Loading", dots: int = 3, cycles: int = 5) -> Iterator[str]:
+    """Yield a message with growing trailing dots."""
+    if dots <= 0 or cycles <= 0:
+        raise ValueError("dots and cycles must be positive")
+    return (text + "." * i + " " * (dots - i) for _ in range(cycles) for i in range(dots + 1))
+
+
+def countdown_frames(seconds: int = 5) -> Iterator[str]:
+    """Yield one countdown line per remaining second."""
+    if seconds < 0:
+        raise ValueError("seconds must be non-negative")
+    return (f"{remaining:2d} seconds" for remaining in range(seconds, -1, -1))
+
+
+def ripple_line_frames(width: int = 40, frames: int = 80, char: str = "*") -> Iterator[str]:
+    """
+    Yield a horizontal ripple following a sine wave.
+
+    Args:
+        width: Line width.
+        frames: Number of frames.
+        char: Character used for the wave.
+    """
+    if width <= 0 or frames <= 0:
+        raise ValueError("width and frames must be positive")
+    return (" " * int((math.sin(i / 4.0) + 1) * (width / 4)) + char for i in range(frames))
+
+
+def bar_wave_frames(width: int = 30, frames: int = 80, char: str = "|", backend: str = "auto") -> Iterator[str]:
+    """
+    Yield multiple bars moving like an equalizer on one line.
+
+    Bar ``x`` of frame ``i`` only depends on ``i + x``, so the sine is
+    evaluated once per phase instead of once per bar per frame.
+
+    Args:
+        width: Number of bars.
+        frames: Number of frames.
+        char: Character used for the bars.
+        backend: ``"auto"``, ``"python"`` or ``"numpy"`` for the sine table.
+    """
+    if width <= 0 or frames <= 0:
+        raise ValueError("width and frames must be positive")
+    phases = frames + width - 1
+    if use_numpy(backend, phases):
+        heights = _numpy.sine_levels(phases, 6.0, 3, 1)
+    else:
+        heights = [int((math.sin(k / 6.0) + 1) * 3) + 1 for k in range(phases)]
+    bars = [char * height for height in heights]
+    return (" ".join(bars[i : i + width]) for i in range(frames))
+
+
+def matrix_rain_frames(
+    width: int = 40,
+    height: int = 12,
+    frames: int = 80,
+    seed: Optional[Union[int, random.Random]] = None,
+    trail: Tuple[int, int] = (4, 16),
+    speed: Tuple[float, float] = (0.35, 1.0),
+) -> Iterator[List[str]]:
+    """
+    Yield canvases of a matrix rain effect.
+
+    The rain is a persistent :class:`~starpatterns.patterns.rain.MatrixRain`;
+    each frame only updates the cells of the drops that moved.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        frames: Number of frames.
+        seed: Seed or ``random.Random`` instance, for reproducible runs.
+        trail: Inclusive ``(min, max)`` trail length of each drop.
+        speed: ``(min, max)`` rows per frame of each drop.
+    """
+    if width <= 0 or height <= 0 or frames <= 0:
+        raise ValueError("width, height, and frames must be positive")
+    rain = _rain.MatrixRain(width, height, trail, speed, seed=seed)
+
+    def generate() -> Iterator[List[str]]:
+        for _ in range(frames):
+            rain.step()
+            yield rain.rows()
+
+    return generate()
+
+
+def equalizer_frames(
+    bars: int = 16,
+    height: int = 8,
+    frames: int = 80,
+    char: str = "#",
+    seed: Optional[Union[int, random.Random]] = None,
+) -> Iterator[List[str]]:
+    """
+    Yield canvases of a random bar equalizer.
+
+    Args:
+        bars: Number of bars.
+        height: Maximum bar height.
+        frames: Number of frames.
+        char: Character used for bars.
+        seed: Seed or ``random.Random`` instance, for reproducible runs.
+    """
+    if bars <= 0 or height <= 0 or frames <= 0:
+        raise ValueError("bars, height, and frames must be positive")
+
+    def generate() -> Iterator[List[str]]:
+        rng = _make_rng(seed)
+        levels = range(1, height + 1)
+        # Column of cells, top to bottom, for a bar of each height.
+        columns = [(" ",) * (height - level) + (char,) * level for level in range(height + 1)]
+        for _ in range(frames):
+            bar_heights = rng.choices(levels, k=bars)
+            yield [" ".join(row) for row in zip(*[columns[h] for h in bar_heights])]
+
+    return generate()
+
+
+def _validate_fireworks(bursts: int, size: int, char: str) -> None:
+    if bursts <= 0 or size <= 2:
+        raise ValueError("bursts must be positive and size > 2")
+    if len(char) != 1:
+        raise ValueError("char must be a single character")
+
+
+def fireworks_frames(bursts: int = 4, size: int = 12, char: str = "*", backend: str = "auto") -> Iterator[List[str]]:
+    """
+    Yield canvases of radial fireworks bursts.
+
+    Args:
+        bursts: Number of bursts.
+        size: Canvas size (square).
+        char: Character used for sparkles.
+        backend: ``"auto"``, ``"python"`` or ``"numpy"`` for the distance field.
+    """
+    _validate_fireworks(bursts, size, char)
+    if use_numpy(backend, size * size):
+        return _numpy.fireworks_frames(bursts, size, char)
+
+    def generate() -> Iterator[List[str]]:
+        distances = _fireworks_distances(size)
+        for _ in range(bursts):
+            for radius in range(1, size // 2 + 1):
+                yield _fireworks_canvas(distances, radius, char)
+
+    return generate()
+
+
+def fireworks_frame(index: int, size: int = 12, char: str = "*") -> List[str]:
+    """
+    Return canvas ``index`` of :func:`fireworks_frames` directly.
+
+    Bursts repeat every ``size // 2`` frames, so any non-negative index is
+    valid. Module level and picklable, for use with
+    :class:`~starpatterns.render.IndexedScene`.
+    """
+    _validate_fireworks(1, size, char)
+    if index < 0:
+        raise ValueError("index must be non-negative")
+    return _fireworks_canvas(_fireworks_distances(size), index % (size // 2) + 1, char)
+
+
+def _fireworks_distances(size: int) -> List[List[int]]:
+    center = size // 2
+    return [[abs(row - center) + abs(col - center) for col in range(size)] for row in range(size)]
+
+
+def _fireworks_canvas(distances: List[List[int]], radius: int, char: str) -> List[str]:
+    lines = []
+    for row_dist in distances:
+        line_chars = []
+        for dist in row_dist:
+            if dist == radius:
+                line_chars.append(char)
+            elif dist == radius - 1:
+                line_chars.append(".")
+            else:
+                line_chars.append(" ")
+        lines.append("".join(line_chars))
+    return lines
+
+
+def twinkle_stars_frames(
+    width: int = 40,
+    height: int = 8,
+    frames: int = 80,
+    density: float = 0.15,
+    seed: Optional[Union[int, random.Random]] = None,
+    backend: str = "auto",
+) -> Iterator[List[str]]:
+    """
+    Yield canvases of a twinkling starfield.
+
+    Each frame draws one random byte per cell in a single call and maps it
+    through a 256-entry table: bytes below ``density * 256`` become a star
+    glyph, the rest stay blank. Both backends consume the same bytes, so a
+    given ``seed`` produces identical frames either way.
+
+    Args:
+        width: Field width.
+        height: Field height.
+        frames: Number of frames.
+        density: Fraction of cells lit per frame.
+        seed: Seed or ``random.Random`` instance, for reproducible runs.
+        backend: ``"auto"``, ``"python"`` or ``"numpy"`` for the lookup.
+    """
+    if width <= 0 or height <= 0 or frames <= 0:
+        raise ValueError("width, height, and frames must be positive")
+    if not (0 <= density <= 1):
+        raise ValueError("density must be between 0 and 1")
+    cells = width * height
+    # bytes.translate already runs the lookup in C, so "auto" stays on it.
+    vectorized = backend != "auto" and use_numpy(backend, cells)
+    threshold = round(density * 256)
+    table = bytes(b".*+"[value % 3] if value < threshold else 32 for value in range(256))
+
+    def generate() -> Iterator[List[str]]:
+        rng = _make_rng(seed)
+        for _ in range(frames):
+            raw = rng.getrandbits(8 * cells).to_bytes(cells, "little")
+            if vectorized:
+                yield _numpy.lookup_rows(raw, table, width, height)
+            else:
+                data = raw.translate(table).decode("ascii")
+                yield [data[row * width : (row + 1) * width] for row in range(height)]
+
+    return generate()
+
+
+def dna_helix_frames(frames: int = 80) -> Iterator[List[str]]:
+    """Yield two-row canvases of a simple ASCII DNA helix."""
+    _validate_frames(frames)
+    return (list(_DNA_PATTERN[i % len(_DNA_PATTERN)]) for i in range(frames))
+
+
+def shooting_star_frames(width: int = 40, height: int = 10, frames: int = 60, char: str = "*") -> Iterator[List[str]]:
+    """Yield canvases of a diagonal shooting star with a tail."""
+    if width <= 0 or height <= 0 or frames <= 0:
+        raise ValueError("width, height, and frames must be positive")
+
+    def generate() -> Iterator[List[str]]:
+        blank = [" "] * width
+        for i in range(frames):
+            x = min(width - 1, i)
+            y = min(height - 1, i // 2)
+            lines = []
+            for row in range(height):
+                line_chars = blank[:]
+                for offset in (1, 2):
+                    if row == y - offset and 0 <= x - offset:
+                        line_chars[x - offset] = "."
+                if row == y:
+                    line_chars[x] = char
+                lines.append("".join(line_chars))
+            yield lines
+
+    return generate()
+
+
+def rising_bar_frames(
+    width: int = 20,
+    height: int = 8,
+    frames: int = 60,
+    char: str = "#",
+    backend: str = "auto",
+) -> Iterator[List[str]]:
+    """
+    Yield canvases of a bar that rises and falls inside a frame.
+
+    Args:
+        width: Bar width.
+        height: Field height.
+        frames: Number of frames.
+        char: Fill character for the bar.
+        backend: ``"auto"``, ``"python"`` or ``"numpy"`` for the level table.
+    """
+    if width <= 0 or height <= 0 or frames <= 0:
+        raise ValueError("width, height, and frames must be positive")
+    if use_numpy(backend, frames):
+        levels = _numpy.sine_levels(frames, 6.0, height / 2)
+    else:
+        levels = [int((math.sin(i / 6.0) + 1) * (height / 2)) for i in range(frames)]
+    full = char * width
+    empty = " " * width
+    return ([empty] * max(height - level, 0) + [full] * min(level, height) for level in levels)
+
+
+def _validate_orbit(radius: int, frames: int) -> None:
+    if radius < 0 or frames <= 0:
+        raise ValueError("radius must be non-negative and frames positive")
+
+
+def orbit_frames(radius: int = 6, frames: int = 100) -> Iterator[List[str]]:
+    """Yield canvases of a dot orbiting a center point."""
+    _validate_orbit(radius, frames)
+
+    def generate() -> Iterator[List[str]]:
+        for i in range(frames):
+            yield _orbit_canvas(i, radius, frames)
+
+    return generate()
+
+
+def orbit_frame(index: int, radius: int = 6, frames: int = 100) -> List[str]:
+    """
+    Return canvas ``index`` of :func:`orbit_frames` directly.
+
+    The orbit repeats every ``frames`` frames, so any non-negative index is
+    valid. Module level and picklable, for use with
+    :class:`~starpatterns.render.IndexedScene`.
+    """
+    _validate_orbit(radius, frames)
+    if index < 0:
+        raise ValueError("index must be non-negative")
+    return _orbit_canvas(index % frames, radius, frames)
+
+
+def _orbit_canvas(index: int, radius: int, frames: int) -> List[str]:
+    angle = (index / frames) * 2 * math.pi
+    x = int(radius + radius * math.cos(angle))
+    y = int(radius + radius * math.sin(angle))
+    blank = [" "] * (radius * 2 + 1)
+    lines = []
+    for row in range(radius * 2 + 1):
+        line_chars = blank[:]
+        if row == radius:
+            line_chars[radius] = "+"
+        if row == y:
+            line_chars[x] = "o"
+        lines.append("".join(line_chars))
+    return lines
+
+
+def falling_sand_frames(
+    width: int = 30,
+    height: int = 10,
+    frames: int = 80,
+    density: float = 0.2,
+    seed: Optional[Union[int, random.Random]] = None,
+    materials: Sequence[str] = ("sand",),
+) -> Iterator[List[str]]:
+    """
+    Yield canvases of a falling sand simulation.
+
+    Runs on :class:`~starpatterns.patterns.sand.SandBox`, which only
+    updates particles that can still move. Grains slide diagonally into
+    sloped piles, and the field empties once it has filled to the top.
+
+    Args:
+        width: Field width.
+        height: Field height.
+        frames: Number of frames.
+        density: Chance that a top-row cell spawns a particle each frame.
+        seed: Seed or ``random.Random`` instance, for reproducible runs.
+        materials: Names from :data:`~starpatterns.patterns.sand.MATERIALS`
+            to spawn, picked uniformly.
+    """
+    if not (0 <= density <= 1):
+        raise ValueError("density must be between 0 and 1")
+    if width <= 0 or height <= 0 or frames <= 0:
+        raise ValueError("width, height, and frames must be positive")
+    box = _sand.SandBox(width, height, materials, seed)
+    if not all(material.falls for material in box.materials):
+        raise ValueError("materials must all be able to fall")
+
+    def generate() -> Iterator[List[str]]:
+        for _ in range(frames):
+            if box.is_full():
+                box.clear()
+            box.spawn(density)
+            box.step()
+            yield box.rows()
+
+    return generate()
+
+
+def carousel_frames(text: str = "Loading", frames: int = 80) -> Iterator[str]:
+    """Yield a rotating line character beside text."""
+    _validate_frames(frames)
+    spokes = cycle(["-", "\\", "|", "/"])
+    return (next(spokes) + " " + text for _ in range(frames))
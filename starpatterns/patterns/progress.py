@@ -0,0 +1,172 @@
+"""Work-driven progress indicators redrawn from a background thread."""
+
+from __future__ import annotations
+
+import threading
+from itertools import cycle
+from typing import Generic, Iterable, Iterator, Optional, TypeVar
+
+from ..utils.sink import Sink, StreamSink
+
+T = TypeVar("T")
+
+
+class _Indicator:
+    """
+    Base for indicators whose state is redrawn at most ``max_fps`` times per second.
+
+    Callers only bump counters on the hot path; a daemon thread samples the
+    state, renders a line, and writes it when it changed since the last draw.
+    """
+
+    def __init__(self, max_fps: float, sink: Optional[Sink] = None) -> None:
+        if max_fps <= 0:
+            raise ValueError("max_fps must be positive")
+        self.max_fps = max_fps
+        self.sink = sink if sink is not None else StreamSink()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_line: Optional[str] = None
+        self._closed = False
+
+    def _line(self) -> str:
+        raise NotImplementedError
+
+    def _end(self) -> str:
+        return "\n"
+
+    def _frame(self) -> str:
+        line = self._line()
+        if line == self._last_line:
+            return ""
+        self._last_line = line
+        return "\r" + line
+
+    def _draw(self) -> None:
+        frame = self._frame()
+        if frame:
+            self.sink.write(frame)
+
+    def _run(self) -> None:
+        period = 1.0 / self.max_fps
+        while not self._stop.wait(period):
+            self._draw()
+
+    def start(self) -> None:
+        """Draw the first frame and start the redraw thread."""
+        if self._thread is not None or self._closed:
+            return
+        self._draw()
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the redraw thread, draw the final state, and end the line."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.sink.write(self._frame() + self._end())
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class ProgressBar(_Indicator, Generic[T]):
+    """
+    Progress bar driven by real work instead of a fixed duration.
+
+    Wrap an iterable (``for item in ProgressBar(items)``) or call
+    :meth:`update` inside a ``with`` block. ``update`` only adds to a
+    counter; redraws happen on a background thread at most ``max_fps``
+    times per second.
+
+    Args:
+        iterable: Items to yield while advancing the bar.
+        total: Expected number of steps; taken from ``len(iterable)`` when omitted.
+        width: Number of bar cells.
+        char: Fill character for the bar.
+        max_fps: Maximum redraws per second.
+        sink: Output destination; each redraw is one write and flush.
+    """
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[T]] = None,
+        total: Optional[int] = None,
+        width: int = 30,
+        char: str = "#",
+        max_fps: float = 10.0,
+        sink: Optional[Sink] = None,
+    ) -> None:
+        if width <= 0:
+            raise ValueError("width must be positive")
+        if len(char) != 1:
+            raise ValueError("char must be a single character")
+        if total is None and iterable is not None and hasattr(iterable, "__len__"):
+            total = len(iterable)  # type: ignore[arg-type]
+        if total is not None and total < 0:
+            raise ValueError("total must be non-negative")
+        super().__init__(max_fps, sink)
+        self.iterable = iterable
+        self.total = total
+        self.width = width
+        self.char = char
+        self.n = 0
+        self._spin = cycle("|/-\\")
+
+    def update(self, n: int = 1) -> None:
+        """Advance the bar by ``n`` steps."""
+        self.n += n
+
+    def __iter__(self) -> Iterator[T]:
+        if self.iterable is None:
+            raise TypeError("ProgressBar was created without an iterable")
+        self.start()
+        try:
+            for item in self.iterable:
+                yield item
+                self.n += 1
+        finally:
+            self.close()
+
+    def _line(self) -> str:
+        n, total = self.n, self.total
+        if not total:
+            return f"[{next(self._spin)}] {n}"
+        done = min(n, total)
+        filled = self.width * done // total
+        percent = 100 * done // total
+        return f"[{self.char * filled}{' ' * (self.width - filled)}] {percent:3d}%"
+
+
+class Spinner(_Indicator):
+    """
+    Spinner that animates on a background thread while work runs.
+
+    Args:
+        text: Text to render beside the spinner.
+        interval: Delay between frames in seconds.
+        sink: Output destination; each redraw is one write and flush.
+    """
+
+    def __init__(self, text: str = "Loading", interval: float = 0.1, sink: Optional[Sink] = None) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        super().__init__(1.0 / interval, sink)
+        self.text = text
+        self._frames = cycle("|/-\\")
+
+    def _line(self) -> str:
+        if self._closed:
+            return self._last_line or ""
+        return f"{next(self._frames)} {self.text}"
+
+    def _end(self) -> str:
+        return "\r[done] " + self.text + " " * 3 + "\n"
@@ -0,0 +1,294 @@
+"""
+Persistent matrix-rain engine.
+
+Every column carries at most one drop, described by a handful of
+per-column integers: head position (fixed point, 1/256 row), speed and
+trail length. The screen itself is three ``bytearray`` buffers (glyph,
+fade level and displayed character per cell) that live for the whole run.
+
+When a head moves down one row, only the cells whose fade level changes
+are touched: the new head, one cell at each level boundary of the trail
+and the cell the tail leaves behind. Those cells are recorded as dirty,
+so :meth:`MatrixRain.diff` emits cursor moves and glyphs for exactly them.
+A frame therefore costs time proportional to the number of falling drops,
+not to ``width * height``. Idle columns wait in a schedule keyed by the
+frame they restart on and are not visited at all.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..utils.colors import RESET, Color, Style, sgr_transition, style
+
+DEFAULT_GLYPHS = "0123456789ABCDEF"
+
+# Head first, then the trail from bright to dim.
+DEFAULT_PALETTE: Tuple[Color, ...] = (
+    (220, 255, 220),
+    (0, 255, 70),
+    (0, 190, 50),
+    (0, 125, 35),
+    (0, 70, 20),
+)
+
+# Without color the dimmest trail level is drawn with this character.
+_FADE_CHAR = ord(".")
+_SPACE = ord(" ")
+_CHARS = [chr(code) for code in range(128)]
+
+
+class MatrixRain:
+    """
+    Matrix rain whose state persists between frames.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        trail: Inclusive ``(min, max)`` trail length in cells, head included;
+            each drop picks its own.
+        speed: ``(min, max)`` rows per frame; each drop picks its own.
+        glyphs: ASCII characters drawn at the head.
+        color: Fade the trail through ``palette`` with ANSI colors. Without
+            color the dimmest level is drawn as ``.``.
+        palette: Colors from head to tail end; its length sets the number
+            of fade levels.
+        seed: Seed or ``random.Random`` instance, for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        width: int = 40,
+        height: int = 12,
+        trail: Tuple[int, int] = (4, 16),
+        speed: Tuple[float, float] = (0.35, 1.0),
+        glyphs: str = DEFAULT_GLYPHS,
+        color: bool = False,
+        palette: Sequence[Color] = DEFAULT_PALETTE,
+        seed: Optional[Union[int, random.Random]] = None,
+    ) -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be positive")
+        if not 1 <= trail[0] <= trail[1]:
+            raise ValueError("trail must be a (min, max) range with 1 <= min <= max")
+        if not 0 < speed[0] <= speed[1]:
+            raise ValueError("speed must be a (min, max) range with 0 < min <= max")
+        if not glyphs or not glyphs.isascii() or not glyphs.isprintable() or " " in glyphs:
+            raise ValueError("glyphs must be printable ASCII characters other than space")
+        if len(palette) < 2:
+            raise ValueError("palette needs at least two colors")
+        self.width = width
+        self.height = height
+        self.trail = (int(trail[0]), int(trail[1]))
+        self.speed = speed
+        self.color = color
+        self.rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+        self.frame = 0
+
+        size = width * height
+        self.glyphs = bytearray(size)
+        self.levels = bytearray(size)  # 0 is empty, otherwise fade level + 1
+        self.screen = bytearray(b" " * size)
+        self._dirty: set = set()
+
+        self._glyph_table = bytes(ord(glyphs[value % len(glyphs)]) for value in range(256))
+        self._speed_range = (max(1, round(speed[0] * 256)), max(1, round(speed[1] * 256)))
+        self._max_steps = (self._speed_range[1] >> 8) + 1
+        self._level_count = len(palette)
+        colors = [value if isinstance(value, str) else tuple(value) for value in palette]
+        self._styles: List[Style] = [style(colors[0], bold=True)] + [style(value) for value in colors[1:]]
+        # SGR switch from level a (0 for no style) to level b, as _transitions[a][b].
+        shown: List[Optional[Style]] = [None, *self._styles]
+        self._transitions = [[sgr_transition(old, new) for new in shown] for old in shown]
+        # Cursor moves are assembled from a row prefix and a column suffix.
+        self._row_moves = [f"\033[{row + 1};" for row in range(height)]
+        self._col_moves = [f"{col + 1}H" for col in range(width)]
+        # Displayed character per level; 0 means the cell's own glyph.
+        self._fade = [0] * self._level_count
+        if not color:
+            self._fade[-1] = _FADE_CHAR
+        self._marks: Dict[int, Tuple[Tuple[Tuple[int, int, int], ...], int]] = {}
+
+        self._pos = [0] * width
+        self._step = [0] * width
+        self._trail: List[Tuple[Tuple[Tuple[int, int, int], ...], int]] = [((), 0)] * width
+        self._active: List[int] = []
+        self._waiting: Dict[int, List[int]] = {}
+        for col in range(width):
+            self._schedule(col, self.rng.randint(1, height))
+
+    @property
+    def active(self) -> int:
+        """Number of drops currently falling."""
+        return len(self._active)
+
+    def _schedule(self, col: int, wait: int) -> None:
+        self._waiting.setdefault(self.frame + wait, []).append(col)
+
+    def _start(self, col: int) -> None:
+        rng = self.rng
+        self._pos[col] = -256  # head one row above the screen
+        self._step[col] = rng.randint(*self._speed_range)
+        self._trail[col] = self._trail_marks(rng.randint(*self.trail))
+
+    def _trail_marks(self, length: int) -> Tuple[Tuple[Tuple[int, int, int], ...], int]:
+        """
+        Cells a drop of ``length`` repaints when its head enters a row.
+
+        Returns ``(offset, level + 1, fade character)`` for the head and
+        every trail cell whose level differs from the cell above it, with
+        offsets counted back from the head's index, and the offset of the
+        cell the tail leaves behind.
+        """
+        marks = self._marks.get(length)
+        if marks is None:
+            width = self.width
+            levels = self._level_count
+            bounds = [(0, 1, self._fade[0])]
+            previous = 0
+            for distance in range(1, length):
+                level = 1 + (distance - 1) * (levels - 1) // max(1, length - 1)
+                if level != previous:
+                    bounds.append((distance * width, level + 1, self._fade[level]))
+                    previous = level
+            marks = self._marks[length] = (tuple(bounds), length * width)
+        return marks
+
+    def step(self) -> int:
+        """
+        Advance every falling drop and start the ones whose wait is over.
+
+        Returns:
+            Number of cells marked dirty so far.
+        """
+        self.frame += 1
+        starting = self._waiting.pop(self.frame, None)
+        if starting:
+            for col in starting:
+                self._start(col)
+            self._active.extend(starting)
+        if self._active:
+            self._active = self._fall(self._active)
+        return len(self._dirty)
+
+    def _fall(self, active: List[int]) -> List[int]:
+        """Move the drops in ``active`` down and return the ones still on screen."""
+        width = self.width
+        size = width * self.height
+        last_row = size - width
+        glyphs = self.glyphs
+        levels = self.levels
+        screen = self.screen
+        dirty = self._dirty
+        color = self.color
+        positions = self._pos
+        steps = self._step
+        trails = self._trail
+        count = len(active) * self._max_steps
+        # Head glyphs for the whole frame in one draw.
+        pool = self.rng.getrandbits(8 * count).to_bytes(count, "little").translate(self._glyph_table)
+        drawn = 0
+        falling: List[int] = []
+        for col in active:
+            position = positions[col]
+            moved = positions[col] = position + steps[col]
+            if moved >> 8 == position >> 8:
+                falling.append(col)
+                continue
+            marks, tail = trails[col]
+            # Cell index of each row the head enters; offsets count back from it.
+            for index in range(((position >> 8) + 1) * width + col, ((moved >> 8) + 1) * width + col, width):
+                if 0 <= index < size:
+                    glyphs[index] = pool[drawn]
+                    drawn += 1
+                for offset, level, fixed in marks:
+                    cell = index - offset
+                    if 0 <= cell < size:
+                        shown = fixed or glyphs[cell]
+                        if color or shown != screen[cell]:
+                            dirty.add(cell)
+                        levels[cell] = level
+                        screen[cell] = shown
+                cell = index - tail
+                if cell >= 0:
+                    levels[cell] = 0
+                    screen[cell] = _SPACE
+                    dirty.add(cell)
+                    if cell >= last_row:
+                        self._schedule(col, self.rng.randint(1, self.height))
+                        break
+            else:
+                falling.append(col)
+        return falling
+
+    def rows(self) -> List[str]:
+        """Return the plain characters on screen, one string per row."""
+        text = self.screen.decode("ascii")
+        width = self.width
+        return [text[start : start + width] for start in range(0, len(text), width)]
+
+    def paint(self) -> str:
+        """Return a full repaint from the top-left corner and clear the dirty cells."""
+        self._dirty.clear()
+        if not self.color:
+            return "\033[H" + "\n".join(self.rows())
+        width = self.width
+        screen = self.screen
+        levels = self.levels
+        styles = self._styles
+        lines = []
+        for start in range(0, len(screen), width):
+            parts: List[str] = []
+            current: Optional[Style] = None
+            for index in range(start, start + width):
+                level = levels[index]
+                if level and styles[level - 1] is not current:
+                    parts.append(sgr_transition(current, styles[level - 1]))
+                    current = styles[level - 1]
+                parts.append(chr(screen[index]))
+            if current is not None:
+                parts.append(RESET)
+            lines.append("".join(parts))
+        return "\033[H" + "\n".join(lines)
+
+    def diff(self) -> str:
+        """Return cursor moves and glyphs for the cells changed since the last paint or diff."""
+        dirty = self._dirty
+        if not dirty:
+            return ""
+        width = self.width
+        screen = self.screen
+        levels = self.levels
+        row_moves = self._row_moves
+        col_moves = self._col_moves
+        transitions = self._transitions if self.color else None
+        parts: List[str] = []
+        append = parts.append
+        current = 0
+        previous = -2
+        for index in sorted(dirty):
+            # Consecutive cells on one row need no cursor move in between.
+            if index != previous + 1 or not index % width:
+                row, col = divmod(index, width)
+                append(row_moves[row] + col_moves[col])
+            level = levels[index]
+            if transitions is not None and level and level != current:
+                append(transitions[current][level])
+                current = level
+            append(_CHARS[screen[index]])
+            previous = index
+        if current:
+            append(RESET)
+        dirty.clear()
+        return "".join(parts)
+
+    def finish(self) -> str:
+        """Return the sequence that parks the cursor after the last row."""
+        return f"\033[{self.height};{self.width + 1}H"
+
+    def payloads(self, frames: int) -> Iterator[str]:
+        """Yield ``frames`` screen updates: a full paint, then diffs."""
+        for frame in range(frames):
+            self.step()
+            yield self.diff() if frame else self.paint()
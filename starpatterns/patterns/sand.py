@@ -0,0 +1,264 @@
+"""
+Sparse falling-sand engine.
+
+The field is a single ``bytearray`` holding a material id per cell (``0``
+is empty), and only particles that may still move are kept in an active
+set. Each step visits the active particles bottom row first; a particle
+that cannot move settles and leaves the set, and is woken again only when
+a neighbour below or beside it frees up. Settled piles therefore cost
+nothing, and a frame's work is proportional to what is actually falling.
+
+Grains fall straight down when they can, otherwise slide diagonally, so
+sand forms sloped piles; liquids also flow sideways and level out.
+Rendering maps the whole field through a 256-entry glyph table in one
+``bytes.translate`` call.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+
+class Material(NamedTuple):
+    """
+    Behaviour and glyph of one kind of particle.
+
+    Attributes:
+        name: Registry key.
+        glyph: Single ASCII character drawn for the particle.
+        falls: Whether gravity applies; ``False`` makes a fixed obstacle.
+        slides: Slide diagonally down when the cell below is taken.
+        flows: Move sideways when it can neither fall nor slide.
+    """
+
+    name: str
+    glyph: str
+    falls: bool = True
+    slides: bool = True
+    flows: bool = False
+
+
+MATERIALS: Dict[str, Material] = {
+    "sand": Material("sand", "."),
+    "gravel": Material("gravel", "o", slides=False),
+    "water": Material("water", "~", flows=True),
+    "stone": Material("stone", "#", falls=False, slides=False),
+}
+
+
+class SandBox:
+    """
+    A falling-sand field that only simulates moving particles.
+
+    Args:
+        width: Field width in cells.
+        height: Field height in cells.
+        materials: Names from :data:`MATERIALS` (or :class:`Material`
+            objects) that can appear in the field; ids are assigned in
+            this order starting at 1.
+        seed: Seed or ``random.Random`` instance, for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        materials: Sequence[Union[str, Material]] = ("sand",),
+        seed: Optional[Union[int, random.Random]] = None,
+    ) -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be positive")
+        if not materials:
+            raise ValueError("materials must not be empty")
+        if len(materials) > 255:
+            raise ValueError("at most 255 materials are supported")
+        self.width = width
+        self.height = height
+        self.materials: List[Material] = [_material(item) for item in materials]
+        self.rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+        self.cells = bytearray(width * height)
+        self._active: set = set()
+        self._ids = {material.name: index for index, material in enumerate(self.materials, 1)}
+        # Per-id flags, indexed by material id (id 0 is empty space).
+        self._falls = [False] + [material.falls for material in self.materials]
+        self._slides = [False] + [material.slides for material in self.materials]
+        self._flows = [False] + [material.flows for material in self.materials]
+        glyphs = bytearray(b" " * 256)
+        for index, material in enumerate(self.materials, 1):
+            glyphs[index] = ord(material.glyph)
+        self._glyphs = bytes(glyphs)
+
+    @property
+    def active(self) -> int:
+        """Number of particles that may still move."""
+        return len(self._active)
+
+    def material_id(self, name: str) -> int:
+        """Return the cell value used for material ``name``."""
+        try:
+            return self._ids[name]
+        except KeyError:
+            raise ValueError(f"unknown material {name!r} for this field") from None
+
+    def place(self, x: int, y: int, material: str = "sand") -> bool:
+        """
+        Put a particle at ``(x, y)`` if the cell is empty.
+
+        Returns:
+            Whether the particle was placed.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError("position is outside the field")
+        index = y * self.width + x
+        if self.cells[index]:
+            return False
+        value = self.material_id(material)
+        self.cells[index] = value
+        if self._falls[value]:
+            self._active.add(index)
+        return True
+
+    def spawn(self, density: float, materials: Optional[Sequence[str]] = None) -> int:
+        """
+        Drop new particles into empty top-row cells.
+
+        Each column spawns with probability ``density`` (in steps of
+        1/256); all the randomness for the row is drawn in one call.
+
+        Args:
+            density: Chance per column, between 0 and 1.
+            materials: Names to pick from uniformly; defaults to every
+                falling material of the field.
+
+        Returns:
+            Number of particles added.
+        """
+        if not (0 <= density <= 1):
+            raise ValueError("density must be between 0 and 1")
+        ids = [self.material_id(name) for name in materials] if materials else [
+            value for value in range(1, len(self.materials) + 1) if self._falls[value]
+        ]
+        if not ids:
+            raise ValueError("no falling material to spawn")
+        threshold = round(density * 256)
+        width = self.width
+        cells = self.cells
+        raw = self.rng.getrandbits(8 * width).to_bytes(width, "little")
+        columns = [col for col in range(width) if raw[col] < threshold and not cells[col]]
+        if not columns:
+            return 0
+        picks = ids * len(columns) if len(ids) == 1 else self.rng.choices(ids, k=len(columns))
+        active = self._active
+        for col, value in zip(columns, picks):
+            cells[col] = value
+            active.add(col)
+        return len(columns)
+
+    def step(self) -> int:
+        """
+        Advance every active particle by at most one cell.
+
+        Returns:
+            Number of particles that moved.
+        """
+        if not self._active:
+            return 0
+        cells = self.cells
+        width = self.width
+        last_row = width * (self.height - 1)
+        order = sorted(self._active, reverse=True)
+        # One random byte per particle; its low bit picks which side to try first.
+        sides = self.rng.getrandbits(8 * len(order)).to_bytes(len(order), "little")
+        woken: set = set()
+        moved = 0
+        for index, side in zip(order, sides):
+            # Cells only empty out when their own particle is processed, and
+            # bottom-up order means nothing moves into a cell still pending.
+            value = cells[index]
+            if not value:
+                continue
+            x = index % width
+            if index < last_row and not cells[index + width]:
+                target = index + width
+            else:
+                target = self._target(index, x, value, side & 1)
+                if target < 0:
+                    continue
+            cells[target] = value
+            cells[index] = 0
+            woken.add(target)
+            moved += 1
+            self._wake(index, x, woken)
+        self._active = woken
+        return moved
+
+    def _target(self, index: int, x: int, value: int, right_first: int) -> int:
+        """Cell a particle that cannot fall straight down moves to, or -1 if it stays."""
+        cells = self.cells
+        width = self.width
+        target = -1
+        if index < width * (self.height - 1) and self._slides[value]:
+            target = _beside(cells, index + width, x, width, right_first)
+        if target < 0 and self._flows[value]:
+            target = _beside(cells, index, x, width, right_first)
+        return target
+
+    def _wake(self, index: int, x: int, woken: set) -> None:
+        """Add the particles that may move now that ``index`` is empty to ``woken``."""
+        cells = self.cells
+        width = self.width
+        falls = self._falls
+        flows = self._flows
+        # Whatever rested on, or beside, the vacated cell may move now.
+        above = index - width
+        if above >= 0:
+            if cells[above] and falls[cells[above]]:
+                woken.add(above)
+            if x and cells[above - 1] and falls[cells[above - 1]]:
+                woken.add(above - 1)
+            if x + 1 < width and cells[above + 1] and falls[cells[above + 1]]:
+                woken.add(above + 1)
+        if x and flows[cells[index - 1]]:
+            woken.add(index - 1)
+        if x + 1 < width and flows[cells[index + 1]]:
+            woken.add(index + 1)
+
+    def is_full(self) -> bool:
+        """Whether every top-row cell is occupied, so nothing more can spawn."""
+        return self.cells.find(0, 0, self.width) < 0
+
+    def clear(self) -> None:
+        """Empty the field."""
+        self.cells = bytearray(self.width * self.height)
+        self._active = set()
+
+    def rows(self) -> List[str]:
+        """Render the field as one string per row."""
+        text = self.cells.translate(self._glyphs).decode("ascii")
+        width = self.width
+        return [text[start : start + width] for start in range(0, len(text), width)]
+
+
+def _beside(cells: bytearray, origin: int, x: int, width: int, right_first: int) -> int:
+    """Empty cell left or right of ``origin`` (in column ``x``), or -1 if neither is free."""
+    left = x and not cells[origin - 1]
+    right = x + 1 < width and not cells[origin + 1]
+    if right and (right_first or not left):
+        return origin + 1
+    if left:
+        return origin - 1
+    return -1
+
+
+def _material(item: Union[str, Material]) -> Material:
+    if isinstance(item, Material):
+        material = item
+    else:
+        try:
+            material = MATERIALS[item]
+        except KeyError:
+            raise ValueError(f"unknown material {item!r}; choose from {', '.join(MATERIALS)}") from None
+    if len(material.glyph) != 1 or not material.glyph.isascii():
+        raise ValueError("material glyph must be a single ASCII character")
+    return material
@@ -0,0 +1,571 @@
+"""
+Span-based shape engine.
+
+A shape is a width, a height and a function giving the filled *spans* of
+each row: sorted, non-overlapping ``(start, end)`` column ranges. Rows are
+assembled from ``fill * gap + char * run`` slices, so building a row costs
+one step per span no matter how wide it is, and rows are produced lazily,
+so even huge shapes stream in constant memory.
+
+Shapes can be described four ways:
+
+* directly, with a ``spans(row)`` function;
+* analytically, like the ellipses and polygons below, which solve each
+  row's edges in closed form or with a scanline over the polygon edges;
+* as one run per row with :func:`from_runs` (triangles, diamonds), or as
+  bands of identical rows with :func:`from_bands` (squares, crosses). The
+  basic and advanced patterns are written this way: their rows come out
+  of ``map``/``repeat`` pipelines without a Python-level step per row;
+* by an implicit ``inside(row, col)`` test, compiled to bands once by
+  :func:`from_inside`.
+
+A cell belongs to a curved or polygonal shape when its center is inside.
+Terminal cells are roughly twice as tall as they are wide, so the round
+shapes take an ``aspect`` that stretches them horizontally.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from itertools import accumulate, chain, repeat
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+Span = Tuple[int, int]
+Point = Tuple[float, float]
+Band = Tuple[Sequence[Span], int]
+
+# Tolerance for cell centers lying exactly on an edge.
+_EPSILON = 1e-9
+_ALIGNS = ("left", "center")
+
+
+class Shape:
+    """
+    A shape on a ``width`` x ``height`` grid, described row by row.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        spans: Returns the sorted, non-overlapping ``(start, end)`` filled
+            column ranges of a row.
+    """
+
+    __slots__ = ("width", "height", "spans", "_render")
+
+    def __init__(self, width: int, height: int, spans: Callable[[int], Sequence[Span]]) -> None:
+        self.width = width
+        self.height = height
+        self.spans = spans
+        # Optional whole-shape renderer set by from_runs/from_bands; returns
+        # None for the options it does not cover.
+        self._render: Optional[Callable[[str, str, bool], Optional[Iterator[str]]]] = None
+
+    def __repr__(self) -> str:
+        return f"Shape(width={self.width}, height={self.height})"
+
+    def lines(self, char: str = "*", fill: str = " ", pad: bool = True) -> Iterator[str]:
+        """
+        Yield the rows as strings.
+
+        Args:
+            char: Character for filled cells.
+            fill: Character for empty cells.
+            pad: Fill each row out to ``width``; otherwise rows end at
+                their last filled cell.
+        """
+        if self._render is not None:
+            rows = self._render(char, fill, pad)
+            if rows is not None:
+                return rows
+        return self._scan(char, fill, pad)
+
+    def _scan(self, char: str, fill: str, pad: bool) -> Iterator[str]:
+        width, spans = self.width, self.spans
+        previous: Sequence[Span] = ()
+        line = ""
+        for row in range(self.height):
+            current = spans(row)
+            # Runs of identical rows reuse the string built for the first.
+            if current == previous and row:
+                yield line
+                continue
+            previous = current
+            if len(current) == 1:
+                # Most rows are a single run; skip the general join.
+                start, end = current[0]
+                if pad and end < width:
+                    line = fill * start + char * (end - start) + fill * (width - end)
+                else:
+                    line = fill * start + char * (end - start)
+            else:
+                line = build_row(current, width, char, fill, pad)
+            yield line
+
+    def text(self, char: str = "*", fill: str = " ", pad: bool = True) -> str:
+        """Return all rows joined with newlines."""
+        return "\n".join(self.lines(char, fill, pad))
+
+
+def build_row(spans: Sequence[Span], width: int, char: str = "*", fill: str = " ", pad: bool = True) -> str:
+    """
+    Assemble one row from its spans with one slice per run.
+
+    Args:
+        spans: Sorted, non-overlapping ``(start, end)`` filled ranges.
+        width: Row width, used when padding.
+        char: Character for filled cells.
+        fill: Character for empty cells.
+        pad: Fill the row out to ``width``.
+    """
+    if len(spans) == 1:
+        start, end = spans[0]
+        if pad and end < width:
+            return fill * start + char * (end - start) + fill * (width - end)
+        return fill * start + char * (end - start)
+    parts: List[str] = []
+    position = 0
+    for start, end in spans:
+        if start > position:
+            parts.append(fill * (start - position))
+        parts.append(char * (end - start))
+        position = end
+    if pad and position < width:
+        parts.append(fill * (width - position))
+    return "".join(parts)
+
+
+def from_runs(width: int, lengths: Sequence[int], align: str = "left") -> Shape:
+    """
+    Shape whose rows are each a single run of cells.
+
+    Rendering maps ``char * length`` and ``str.ljust``/``str.center`` over
+    ``lengths``, so no Python code runs per row.
+
+    Args:
+        width: Number of columns.
+        lengths: Run length of every row, between ``0`` and ``width``; a
+            ``range`` or list, so it can be indexed.
+        align: ``"left"`` starts every run at column 0; ``"center"``
+            centers it as :meth:`str.center` does.
+    """
+    if align not in _ALIGNS:
+        raise ValueError(f"align must be one of {', '.join(_ALIGNS)}")
+    _check_box(width, len(lengths))
+    if min(lengths) < 0 or max(lengths) > width:
+        raise ValueError("run lengths must be between 0 and width")
+    centered = align == "center"
+
+    def spans(row: int) -> Tuple[Span, ...]:
+        length = lengths[row]
+        if not length:
+            return ()
+        if not centered:
+            return ((0, length),)
+        margin = width - length
+        start = margin // 2 + (margin & width & 1)
+        return ((start, start + length),)
+
+    def render(char: str, fill: str, pad: bool) -> Optional[Iterator[str]]:
+        # Centered rows always carry their right margin; unpadded ones scan.
+        if centered and not pad:
+            return None
+        return _run_lines(width, lengths, char, fill=fill, centered=centered, pad=pad)
+
+    shape = Shape(width, len(lengths), spans)
+    shape._render = render
+    return shape
+
+
+def _run_lines(
+    width: int,
+    lengths: Sequence[int],
+    char: str,
+    *,
+    fill: str = " ",
+    centered: bool = False,
+    pad: bool = True,
+) -> Iterator[str]:
+    rows = map(char.__mul__, lengths)
+    if centered:
+        return map(str.center, rows, repeat(width), repeat(fill))
+    return map(str.ljust, rows, repeat(width), repeat(fill)) if pad else rows
+
+
+def from_bands(width: int, bands: Sequence[Band]) -> Shape:
+    """
+    Shape made of bands of identical rows.
+
+    Each band's row is built once and repeated, so rendering costs one
+    row build per band plus a ``repeat`` per row.
+
+    Args:
+        width: Number of columns.
+        bands: ``(spans, count)`` pairs from top to bottom; ``count`` may
+            be zero.
+    """
+    rows = [tuple((start, end) for start, end in spans) for spans, _ in bands]
+    counts = [count for _, count in bands]
+    if min(counts, default=0) < 0:
+        raise ValueError("band counts must be non-negative")
+    ends = list(accumulate(counts))
+    _check_box(width, ends[-1] if ends else 0)
+
+    def spans(row: int) -> Sequence[Span]:
+        if not 0 <= row < ends[-1]:
+            raise IndexError("row out of range")
+        return rows[bisect_right(ends, row)]
+
+    shape = Shape(width, ends[-1], spans)
+    shape._render = lambda char, fill, pad: _band_lines(width, rows, counts, char, fill=fill, pad=pad)
+    return shape
+
+
+def _band_lines(
+    width: int,
+    rows: Sequence[Sequence[Span]],
+    counts: Sequence[int],
+    char: str,
+    *,
+    fill: str = " ",
+    pad: bool = True,
+) -> Iterator[str]:
+    if len(rows) == 1:
+        return repeat(build_row(rows[0], width, char, fill, pad), counts[0])
+    # Bands often share a row (the top and bottom of a frame), built once.
+    built: Dict[Sequence[Span], str] = {}
+    for spans in rows:
+        if spans not in built:
+            built[spans] = build_row(spans, width, char, fill, pad)
+    return chain.from_iterable(map(repeat, map(built.__getitem__, rows), counts))
+
+
+def from_inside(inside: Callable[[int, int], bool], width: int, height: int) -> Shape:
+    """
+    Compile an implicit ``inside(row, col)`` test into bands of spans.
+
+    The test runs once per cell here; the resulting shape can then be
+    rendered any number of times at span cost.
+
+    Args:
+        inside: Whether the cell at ``(row, col)`` is filled.
+        width: Number of columns.
+        height: Number of rows.
+    """
+    _check_box(width, height)
+    bands: List[Band] = []
+    for row in range(height):
+        spans: List[Span] = []
+        start = -1
+        for col in range(width):
+            if inside(row, col):
+                if start < 0:
+                    start = col
+            elif start >= 0:
+                spans.append((start, col))
+                start = -1
+        if start >= 0:
+            spans.append((start, width))
+        current = tuple(spans)
+        if bands and bands[-1][0] == current:
+            bands[-1] = (current, bands[-1][1] + 1)
+        else:
+            bands.append((current, 1))
+    return from_bands(width, bands)
+
+
+def _check_box(width: int, height: int) -> None:
+    if not isinstance(width, int) or not isinstance(height, int):
+        raise TypeError("width and height must be integers")
+    if width <= 0 or height <= 0:
+        raise ValueError("width and height must be positive")
+
+
+def _check_char(char: str) -> None:
+    if len(char) != 1:
+        raise ValueError("char must be a single character")
+
+
+def _cells(left: float, right: float, width: int) -> Span:
+    """Columns whose centers lie in ``[left, right]``, clipped to the grid."""
+    return max(0, math.ceil(left - 0.5 - _EPSILON)), min(width, math.floor(right - 0.5 + _EPSILON) + 1)
+
+
+def ellipse_shape(width: int, height: int) -> Shape:
+    """
+    Filled ellipse inscribed in a ``width`` x ``height`` box.
+
+    Each row's edges come from the ellipse equation, so a row costs the
+    same at any width.
+    """
+    _check_box(width, height)
+    cx = rx = width / 2
+    cy = ry = height / 2
+
+    def spans(row: int) -> Tuple[Span, ...]:
+        half = _half_width(row + 0.5 - cy, rx, ry)
+        if half < 0:
+            return ()
+        start, end = _cells(cx - half, cx + half, width)
+        return ((start, end),) if start < end else ()
+
+    return Shape(width, height, spans)
+
+
+def _half_width(dy: float, rx: float, ry: float) -> float:
+    """Half the chord of an ellipse at vertical offset ``dy``; negative outside it."""
+    if ry <= 0:
+        return rx if abs(dy) <= _EPSILON else -1.0
+    t = 1 - (dy / ry) ** 2
+    if t < -_EPSILON:
+        return -1.0
+    return rx * math.sqrt(max(t, 0.0))
+
+
+def ring_shape(width: int, height: int, thickness: int = 1, aspect: float = 2.0) -> Shape:
+    """
+    Elliptical ring: the ellipse of :func:`ellipse_shape` minus a smaller one.
+
+    Args:
+        width: Outer width.
+        height: Outer height.
+        thickness: Ring thickness in rows; columns scale it by ``aspect``.
+        aspect: Width of one row of thickness, in columns.
+    """
+    _check_box(width, height)
+    if thickness <= 0:
+        raise ValueError("thickness must be positive")
+    cx = rx = width / 2
+    cy = ry = height / 2
+    inner_rx, inner_ry = rx - thickness * aspect, ry - thickness
+
+    def spans(row: int) -> Tuple[Span, ...]:
+        dy = row + 0.5 - cy
+        half = _half_width(dy, rx, ry)
+        if half < 0:
+            return ()
+        start, end = _cells(cx - half, cx + half, width)
+        hole = _half_width(dy, inner_rx, inner_ry) if inner_rx >= 0 and inner_ry >= 0 else -1.0
+        if hole < 0:
+            return ((start, end),) if start < end else ()
+        left, right = _cells(cx - hole, cx + hole, width)
+        return tuple(span for span in ((start, left), (right, end)) if span[0] < span[1])
+
+    return Shape(width, height, spans)
+
+
+def polygon_shape(vertices: Sequence[Point], width: int = 0, height: int = 0) -> Shape:
+    """
+    Filled polygon, convex or not, from its vertices in grid units.
+
+    Each row is a scanline through the row's center: its crossings with the
+    polygon's edges are paired up (even-odd rule), so a row costs one step
+    per edge regardless of width.
+
+    Args:
+        vertices: ``(x, y)`` corners in order, with ``x`` in columns and
+            ``y`` in rows; at least three.
+        width: Grid width; defaults to the last column whose center the
+            polygon can reach.
+        height: Grid height; defaults to the last such row.
+    """
+    points = [(float(x), float(y)) for x, y in vertices]
+    if len(points) < 3:
+        raise ValueError("a polygon needs at least three vertices")
+    if any(x < 0 or y < 0 for x, y in points):
+        raise ValueError("vertex coordinates must be non-negative")
+    width = width or _extent(max(x for x, _ in points))
+    height = height or _extent(max(y for _, y in points))
+    _check_box(width, height)
+    edges = [
+        (y0, y1, x0, (x1 - x0) / (y1 - y0))
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1])
+        if y0 != y1
+    ]
+
+    def spans(row: int) -> Tuple[Span, ...]:
+        y = row + 0.5
+        # Half-open in y so a vertex shared by two edges is counted once.
+        crossings = sorted(x0 + (y - y0) * slope for y0, y1, x0, slope in edges if min(y0, y1) <= y < max(y0, y1))
+        result: List[Span] = []
+        for left, right in zip(crossings[::2], crossings[1::2]):
+            start, end = _cells(left, right, width)
+            if start >= end:
+                continue
+            if result and start <= result[-1][1]:
+                result[-1] = (result[-1][0], max(end, result[-1][1]))
+            else:
+                result.append((start, end))
+        return tuple(result)
+
+    return Shape(width, height, spans)
+
+
+def _extent(limit: float) -> int:
+    """Number of cells whose centers lie at or before ``limit``."""
+    return max(1, math.floor(limit - 0.5 + _EPSILON) + 1)
+
+
+def star_shape(radius: int, points: int = 5, inner: float = 0.5, aspect: float = 2.0) -> Shape:
+    """
+    Star polygon with ``points`` tips, the first pointing up.
+
+    Args:
+        radius: Outer radius in rows.
+        points: Number of tips (at least 2).
+        inner: Radius of the notches as a fraction of ``radius``.
+        aspect: Horizontal stretch, in columns per row.
+    """
+    if points < 2:
+        raise ValueError("a star needs at least two points")
+    if not 0 < inner < 1:
+        raise ValueError("inner must be between 0 and 1")
+    width, height = _round_box(radius, aspect)
+    cx, cy = width / 2, height / 2
+    corners = []
+    for index in range(2 * points):
+        angle = -math.pi / 2 + index * math.pi / points
+        scale = radius if index % 2 == 0 else radius * inner
+        corners.append((cx + scale * aspect * math.cos(angle), cy + scale * math.sin(angle)))
+    # Odd point counts reach less far down than up; drop the empty rows.
+    return polygon_shape(corners, width, min(height, _extent(max(y for _, y in corners))))
+
+
+def iter_ellipse(width: int, char: str = "*", height: int = 0) -> Iterator[str]:
+    """
+    Yield the rows of a filled ellipse one at a time.
+
+    Args:
+        width: Width of the ellipse in columns.
+        char: Single character used to draw the ellipse.
+        height: Height in rows; defaults to half the width, made odd.
+    """
+    _check_char(char)
+    return ellipse_shape(width, height or (width // 2) | 1).lines(char)
+
+
+def ellipse(width: int, char: str = "*", height: int = 0) -> str:
+    """
+    Build a filled ellipse.
+
+    Args:
+        width: Width of the ellipse in columns.
+        char: Single character used to draw the ellipse.
+        height: Height in rows; defaults to half the width, made odd.
+    """
+    return "\n".join(iter_ellipse(width, char, height))
+
+
+def _round_box(radius: int, aspect: float) -> Tuple[int, int]:
+    if not isinstance(radius, int):
+        raise TypeError("radius must be an integer")
+    if radius < 0:
+        raise ValueError("radius must be non-negative")
+    if aspect <= 0:
+        raise ValueError("aspect must be positive")
+    return 2 * round(radius * aspect) + 1, 2 * radius + 1
+
+
+def iter_circle(radius: int, char: str = "*", aspect: float = 2.0) -> Iterator[str]:
+    """
+    Yield the rows of a filled circle one at a time.
+
+    Args:
+        radius: Radius in rows.
+        char: Single character used to draw the circle.
+        aspect: Horizontal stretch, in columns per row, so the circle looks
+            round in a terminal; ``1`` keeps it square on the grid.
+    """
+    _check_char(char)
+    return ellipse_shape(*_round_box(radius, aspect)).lines(char)
+
+
+def circle(radius: int, char: str = "*", aspect: float = 2.0) -> str:
+    """
+    Build a filled circle.
+
+    Args:
+        radius: Radius in rows.
+        char: Single character used to draw the circle.
+        aspect: Horizontal stretch, in columns per row.
+    """
+    return "\n".join(iter_circle(radius, char, aspect))
+
+
+def iter_ring(radius: int, char: str = "*", thickness: int = 1, aspect: float = 2.0) -> Iterator[str]:
+    """
+    Yield the rows of a ring one at a time.
+
+    Args:
+        radius: Outer radius in rows.
+        char: Single character used to draw the ring.
+        thickness: Ring thickness in rows.
+        aspect: Horizontal stretch, in columns per row.
+    """
+    _check_char(char)
+    return ring_shape(*_round_box(radius, aspect), thickness, aspect).lines(char)
+
+
+def ring(radius: int, char: str = "*", thickness: int = 1, aspect: float = 2.0) -> str:
+    """
+    Build a ring (a circle outline of the given thickness).
+
+    Args:
+        radius: Outer radius in rows.
+        char: Single character used to draw the ring.
+        thickness: Ring thickness in rows.
+        aspect: Horizontal stretch, in columns per row.
+    """
+    return "\n".join(iter_ring(radius, char, thickness, aspect))
+
+
+def iter_star(radius: int, char: str = "*", points: int = 5, inner: float = 0.5, aspect: float = 2.0) -> Iterator[str]:
+    """
+    Yield the rows of a star polygon one at a time.
+
+    Args:
+        radius: Outer radius in rows.
+        char: Single character used to draw the star.
+        points: Number of tips.
+        inner: Notch radius as a fraction of ``radius``.
+        aspect: Horizontal stretch, in columns per row.
+    """
+    _check_char(char)
+    return star_shape(radius, points, inner, aspect).lines(char)
+
+
+def star(radius: int, char: str = "*", points: int = 5, inner: float = 0.5, aspect: float = 2.0) -> str:
+    """
+    Build a star polygon.
+
+    Args:
+        radius: Outer radius in rows.
+        char: Single character used to draw the star.
+        points: Number of tips.
+        inner: Notch radius as a fraction of ``radius``.
+        aspect: Horizontal stretch, in columns per row.
+    """
+    return "\n".join(iter_star(radius, char, points, inner, aspect))
+
+
+def iter_polygon(vertices: Sequence[Point], char: str = "*") -> Iterator[str]:
+    """
+    Yield the rows of a filled polygon one at a time.
+
+    Args:
+        vertices: ``(x, y)`` corners in order, in columns and rows.
+        char: Single character used to draw the polygon.
+    """
+    _check_char(char)
+    return polygon_shape(vertices).lines(char)
+
+
+def polygon(vertices: Sequence[Point], char: str = "*") -> str:
+    """
+    Build a filled polygon, convex or not.
+
+    Args:
+        vertices: ``(x, y)`` corners in order, in columns and rows.
+        char: Single character used to draw the polygon.
+    """
+    return "\n".join(iter_polygon(vertices, char))
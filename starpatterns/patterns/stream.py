@@ -0,0 +1,108 @@
+"""
+Stream static patterns to files without building the joined string.
+
+Every builder in :mod:`~starpatterns.patterns.basic`,
+:mod:`~starpatterns.patterns.advanced` and
+:mod:`~starpatterns.patterns.fractal` has an ``iter_*`` twin that yields
+one row at a time. :func:`write_pattern` feeds those rows to a file object
+in batched ``writelines`` calls, so memory stays bounded by one batch no
+matter how large the pattern is::
+
+    import gzip
+    from starpatterns.patterns import square, write_pattern
+
+    with gzip.open("square.txt.gz", "wb") as fh:
+        write_pattern(square, 20000, fh)
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from typing import IO, Any, Callable, Iterable, List, Union
+
+RowBuilder = Callable[..., Union[str, Iterable[str]]]
+
+
+def write_rows(rows: Iterable[str], fileobj: IO, chunk_size: int = 1 << 16) -> int:
+    """
+    Write newline-separated ``rows`` in batches of roughly ``chunk_size`` characters.
+
+    The output matches ``"\\n".join(rows)`` (UTF-8 for binary files); no
+    trailing newline is written.
+
+    Args:
+        rows: Row strings to write.
+        fileobj: Text or binary destination with a ``writelines`` method.
+        chunk_size: Characters collected before each ``writelines`` call.
+
+    Returns:
+        Number of characters written.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    # Same test as StreamSink: only known byte streams get UTF-8, any other
+    # writer (SpooledTemporaryFile, custom objects) is handed str.
+    binary = isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase))
+    written = 0
+    batch: List[Union[str, bytes]] = []
+    pending = 0
+    separator = ""
+    for row in rows:
+        chunk = separator + row
+        separator = "\n"
+        batch.append(chunk.encode("utf-8") if binary else chunk)
+        pending += len(chunk)
+        if pending >= chunk_size:
+            fileobj.writelines(batch)
+            written += pending
+            batch = []
+            pending = 0
+    if batch:
+        fileobj.writelines(batch)
+        written += pending
+    return written
+
+
+def _row_iterator(builder: RowBuilder) -> RowBuilder:
+    """Return the ``iter_*`` twin of ``builder``, or ``builder`` itself."""
+    name = getattr(builder, "__name__", "")
+    if name.startswith("iter_"):
+        return builder
+    module = sys.modules.get(getattr(builder, "__module__", "") or "")
+    twin = getattr(module, "iter_" + name, None) if module is not None else None
+    return twin if callable(twin) else builder
+
+
+def write_pattern(
+    builder: RowBuilder,
+    size: int,
+    fileobj: IO,
+    char: str = "*",
+    chunk_size: int = 1 << 16,
+    **options: Any,
+) -> int:
+    """
+    Stream a static pattern to a text or binary file object.
+
+    ``builder`` may be a pattern function such as ``square`` or its
+    ``iter_square`` twin; either way the rows are generated lazily. The
+    bytes written match ``builder(size, char, **options)`` exactly. Other
+    callables are accepted too: a returned string is written as is, an
+    iterable is treated as rows.
+
+    Args:
+        builder: Pattern builder or row iterator.
+        size: Size (or order, for ``sierpinski``) passed to the builder.
+        fileobj: Destination; binary files receive UTF-8.
+        char: Drawing character passed as the builder's second argument.
+        chunk_size: Characters collected before each ``writelines`` call.
+        **options: Extra keyword arguments for the builder, e.g. ``fill``.
+
+    Returns:
+        Number of characters written.
+    """
+    rows = _row_iterator(builder)(size, char, **options)
+    if isinstance(rows, str):
+        rows = [rows]
+    return write_rows(rows, fileobj, chunk_size)
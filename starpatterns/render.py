@@ -0,0 +1,311 @@
+"""
+Render long animations offline across processes.
+
+A scene is split into chunks of consecutive frames. Each chunk is turned
+into terminal payloads in a :class:`concurrent.futures.ProcessPoolExecutor`
+worker, and the chunks are written back in order as they complete. At
+most a few chunks per worker are in flight, so memory stays bounded
+however long the run is.
+
+Two kinds of scene are supported:
+
+* :class:`IndexedScene` for deterministic animations whose frame ``i`` can
+  be computed directly. Every worker primes its diff renderer with frame
+  ``start - 1``, so the output is byte-for-byte the same as a serial run.
+* :class:`SeededScene` for stochastic frame generators that accept
+  ``frames=`` and ``seed=``. Each chunk runs its own generator seeded from
+  ``(seed, chunk index)``, optionally after some discarded warm-up frames,
+  and starts with a full repaint. Output is reproducible for a given seed
+  and chunk size.
+
+The result is a recording in any :mod:`starpatterns.record` format, or
+``"raw"``: the payloads back to back, ready to ``cat`` to a terminal.
+
+Example::
+
+    from starpatterns.patterns.frames import fireworks_frame, matrix_rain_frames
+    from starpatterns.render import IndexedScene, SeededScene, render
+
+    render(IndexedScene(fireworks_frame, 60_000, 61), "fireworks.cast.gz", delay=0.12)
+
+    scene = SeededScene(matrix_rain_frames, 50_000, width=300, height=80, warmup=80)
+    render(scene, "rain.cast.gz", delay=0.04, seed=1)
+
+:func:`~starpatterns.patterns.frames.fireworks_frame` and
+:func:`~starpatterns.patterns.frames.orbit_frame` are ready-made frame
+functions for indexed scenes.
+
+Scene functions must be importable by the workers (defined at module
+level, not in ``__main__`` when the start method is ``spawn``).
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .record import DELTA_FORMAT, PathOrFile, RecordingInfo, _EventWriter, _open
+from .utils.renderer import FrameRenderer
+from .utils.sink import _nbytes
+
+Frame = Union[str, List[str]]
+
+_FORMATS = ("asciicast", "delta", "raw")
+# Chunks queued per worker; one being rendered, one waiting.
+_IN_FLIGHT = 2
+
+
+class IndexedScene:
+    """
+    Deterministic scene rendered directly by frame index.
+
+    Args:
+        frame: Called as ``frame(index, *args, **kwargs)``; returns a
+            ``List[str]`` canvas or a single-line ``str``.
+        frames: Number of frames.
+        *args: Extra positional arguments for ``frame``.
+        **kwargs: Extra keyword arguments for ``frame``.
+    """
+
+    def __init__(self, frame: Callable[..., Frame], frames: int, *args: Any, **kwargs: Any) -> None:
+        if frames <= 0:
+            raise ValueError("frames must be positive")
+        self.frame = frame
+        self.frames = frames
+        self.args = args
+        self.kwargs = kwargs
+
+    def canvases(self, start: int, stop: int, seed: str) -> Iterator[Frame]:
+        """Yield frames ``start`` to ``stop - 1``."""
+        frame, args, kwargs = self.frame, self.args, self.kwargs
+        return (frame(index, *args, **kwargs) for index in range(start, stop))
+
+    def previous(self, start: int) -> Optional[Frame]:
+        """Frame shown before ``start``, used to prime the diff; ``None`` for the first chunk."""
+        return self.frame(start - 1, *self.args, **self.kwargs) if start else None
+
+
+class SeededScene:
+    """
+    Stochastic scene; every chunk runs a freshly seeded generator.
+
+    Args:
+        factory: Frame generator such as ``matrix_rain_frames``, called as
+            ``factory(*args, frames=n, seed=rng, **kwargs)``.
+        frames: Number of frames.
+        *args: Extra positional arguments for ``factory``.
+        warmup: Frames generated and discarded at the start of each chunk,
+            so a simulation that starts empty is in full swing when the
+            chunk begins.
+        **kwargs: Extra keyword arguments for ``factory``.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., Iterator[Frame]],
+        frames: int,
+        *args: Any,
+        warmup: int = 0,
+        **kwargs: Any,
+    ) -> None:
+        if frames <= 0:
+            raise ValueError("frames must be positive")
+        if warmup < 0:
+            raise ValueError("warmup must be non-negative")
+        self.factory = factory
+        self.frames = frames
+        self.args = args
+        self.warmup = warmup
+        self.kwargs = kwargs
+
+    def canvases(self, start: int, stop: int, seed: str) -> Iterator[Frame]:
+        """Yield ``stop - start`` frames from a generator seeded with ``seed``."""
+        source = self.factory(*self.args, frames=self.warmup + stop - start, seed=random.Random(seed), **self.kwargs)
+        return islice(source, self.warmup, None)
+
+    def previous(self, start: int) -> Optional[Frame]:
+        """Chunks are independent, so each one starts with a full repaint."""
+        return None
+
+
+Scene = Union[IndexedScene, SeededScene]
+
+
+class _Chunk(NamedTuple):
+    payloads: List[str]
+    height: int
+    finish: str
+
+
+def _render_chunk(scene: Scene, start: int, stop: int, seed: str) -> _Chunk:
+    """Turn frames ``start`` to ``stop - 1`` into the payloads a player would write."""
+    renderer = FrameRenderer()
+    previous = scene.previous(start)
+    if previous is not None and not isinstance(previous, str):
+        renderer.render(previous)
+    payloads: List[str] = []
+    height = 0
+    for canvas in scene.canvases(start, stop, seed):
+        if isinstance(canvas, str):
+            payloads.append("\r" + canvas)
+        else:
+            height = len(canvas)
+            payloads.append(renderer.render(canvas))
+    return _Chunk(payloads, height, renderer.finish())
+
+
+def _chunk_seed(seed: int, index: int) -> str:
+    # String seeds hash the same in every process, unlike str.__hash__.
+    return f"{seed}:{index}"
+
+
+def render(
+    scene: Scene,
+    dest: PathOrFile,
+    delay: float = 0.05,
+    chunk_size: int = 500,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    format: str = "asciicast",
+    compress: Optional[bool] = None,
+    columns: int = 80,
+    rows: int = 24,
+    title: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> RecordingInfo:
+    """
+    Render ``scene`` into ``dest`` using a pool of worker processes.
+
+    Frame ``i`` is stamped at ``i * delay`` and the closing write one
+    ``delay`` after the last frame, as a paced player under a virtual
+    clock would stamp them. Grid scenes are preceded by the blank
+    lines the players reserve and followed by their cursor park and
+    newline; single-line scenes end with a newline.
+
+    Args:
+        scene: :class:`IndexedScene` or :class:`SeededScene`.
+        dest: Path or file object; paths ending in ``.gz`` are compressed.
+        delay: Seconds between frames in the recording.
+        chunk_size: Frames per task. Larger chunks cost less overhead and
+            more memory; seeded scenes also restart once per chunk.
+        workers: Worker processes; defaults to ``os.cpu_count()``. ``1``
+            renders in this process without a pool.
+        seed: Base seed for seeded scenes; random when ``None``.
+        format: ``"asciicast"``, ``"delta"`` or ``"raw"``.
+        compress: Force gzip on or off; defaults to the ``.gz`` suffix.
+        columns: Terminal width stored in the recording header.
+        rows: Terminal height stored in the recording header.
+        title: Optional title stored in the recording header.
+        executor: Use this executor instead of creating a process pool.
+
+    Returns:
+        Number of events, recorded duration in seconds, and payload bytes.
+    """
+    if format not in _FORMATS:
+        raise ValueError(f"format must be one of {', '.join(_FORMATS)}")
+    if delay < 0:
+        raise ValueError("delay must be non-negative")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be positive")
+    if columns <= 0 or rows <= 0:
+        raise ValueError("columns and rows must be positive")
+    if seed is None:
+        seed = random.randrange(1 << 63)
+    workers = workers or os.cpu_count() or 1
+    bounds = [(start, min(start + chunk_size, scene.frames)) for start in range(0, scene.frames, chunk_size)]
+    seeds = [_chunk_seed(seed, index) for index in range(len(bounds))]
+
+    stream, release = _open(dest, "w", compress)
+    try:
+        output = _Output(stream, format, columns, rows, title, delay)
+        if executor is None and workers == 1:
+            chunks: Iterator[_Chunk] = (_render_chunk(scene, *bound, chunk_seed) for bound, chunk_seed in zip(bounds, seeds))
+            output.write_all(chunks)
+        elif executor is not None:
+            output.write_all(_ordered(executor, scene, bounds, seeds, workers))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                output.write_all(_ordered(pool, scene, bounds, seeds, workers))
+    finally:
+        release()
+    return output.info()
+
+
+def _ordered(
+    executor: Executor,
+    scene: Scene,
+    bounds: Sequence[Tuple[int, int]],
+    seeds: Sequence[str],
+    workers: int,
+) -> Iterator[_Chunk]:
+    """Yield chunk results in order, keeping at most ``_IN_FLIGHT`` per worker queued."""
+    pending: Deque[Future] = deque()
+    tasks = iter(zip(bounds, seeds))
+    try:
+        for (start, stop), chunk_seed in islice(tasks, workers * _IN_FLIGHT):
+            pending.append(executor.submit(_render_chunk, scene, start, stop, chunk_seed))
+        while pending:
+            chunk = pending.popleft().result()
+            for (start, stop), chunk_seed in islice(tasks, 1):
+                pending.append(executor.submit(_render_chunk, scene, start, stop, chunk_seed))
+            yield chunk
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class _Output:
+    """Write reassembled chunks as a recording or a raw stream."""
+
+    def __init__(self, stream: Any, format: str, columns: int, rows: int, title: Optional[str], delay: float) -> None:
+        self.stream = stream
+        self.delay = delay
+        self.raw = format == "raw"
+        self.frames = 0
+        self.events = 0
+        self.last_time = 0.0
+        self.bytes_written = 0
+        self.writer: Optional[_EventWriter] = None
+        if not self.raw:
+            self.writer = _EventWriter(stream, delta=format == "delta")
+            header: Dict[str, Any] = {"version": 2, "width": columns, "height": rows}
+            if format == "delta":
+                header = {"format": DELTA_FORMAT, "version": 1, "width": columns, "height": rows}
+            if title is not None:
+                header["title"] = title
+            self.writer.header(header)
+
+    def _emit(self, when: float, data: str) -> None:
+        self.events += 1
+        self.last_time = when
+        self.bytes_written += _nbytes(data)
+        if self.writer is None:
+            self.stream.write(data)
+        else:
+            self.writer.event(when, data)
+
+    def write_all(self, chunks: Iterator[_Chunk]) -> None:
+        last: Optional[_Chunk] = None
+        delay = self.delay
+        for chunk in chunks:
+            if last is None and chunk.height:
+                self._emit(0.0, "\n" * chunk.height)
+            for payload in chunk.payloads:
+                self._emit(self.frames * delay, payload)
+                self.frames += 1
+            last = chunk
+        # The last frame keeps its slot before the closing write, as in a paced run.
+        end = self.frames * delay
+        if last is not None:
+            self._emit(end, last.finish + "\n" if last.height else "\n")
+        if self.writer is not None:
+            self.writer.flush()
+
+    def info(self) -> RecordingInfo:
+        return RecordingInfo(self.events, self.last_time, self.bytes_written)
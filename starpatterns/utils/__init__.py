@@ -1,6 +1,85 @@
-"""Utility helpers for terminal control and ANSI colors."""
+"""Utility helpers for terminal control and ANSI colors; exports load lazily."""
 
-from .terminal import clear_terminal, move_cursor_home
-from .colors import colorize, rgb
+from __future__ import annotations
 
-__all__ = ["clear_terminal", "move_cursor_home", "colorize", "rgb"]
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .terminal import Terminal, clear_terminal, move_cursor_home, supports_synchronized_output
+    from .colors import (
+        Style,
+        colorize,
+        detect_color_depth,
+        get_color_depth,
+        rgb,
+        rgb_to_16,
+        rgb_to_256,
+        set_color_depth,
+        sgr_transition,
+        style,
+        styled_line,
+        styled_lines,
+    )
+    from .renderer import FrameRenderer
+    from .instrument import FrameEvent, FrameStats, add_frame_hook, frame_hooks, remove_frame_hook
+    from .scheduler import Clock, FrameScheduler, VirtualClock
+    from .sink import FdSink, MemorySink, NullSink, Sink, StreamSink
+
+_EXPORTS = {
+    ".terminal": ("Terminal", "clear_terminal", "move_cursor_home", "supports_synchronized_output"),
+    ".colors": (
+        "Style",
+        "colorize",
+        "detect_color_depth",
+        "get_color_depth",
+        "rgb",
+        "rgb_to_16",
+        "rgb_to_256",
+        "set_color_depth",
+        "sgr_transition",
+        "style",
+        "styled_line",
+        "styled_lines",
+    ),
+    ".renderer": ("FrameRenderer",),
+    ".instrument": ("FrameEvent", "FrameStats", "add_frame_hook", "frame_hooks", "remove_frame_hook"),
+    ".scheduler": ("Clock", "FrameScheduler", "VirtualClock"),
+    ".sink": ("FdSink", "MemorySink", "NullSink", "Sink", "StreamSink"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+__all__ = [
+    "clear_terminal",
+    "move_cursor_home",
+    "Terminal",
+    "supports_synchronized_output",
+    "colorize",
+    "rgb",
+    "Style",
+    "style",
+    "styled_line",
+    "styled_lines",
+    "sgr_transition",
+    "detect_color_depth",
+    "get_color_depth",
+    "set_color_depth",
+    "rgb_to_256",
+    "rgb_to_16",
+    "FrameRenderer",
+    "Clock",
+    "FrameScheduler",
+    "VirtualClock",
+    "FrameEvent",
+    "FrameStats",
+    "add_frame_hook",
+    "remove_frame_hook",
+    "frame_hooks",
+    "Sink",
+    "StreamSink",
+    "MemorySink",
+    "FdSink",
+    "NullSink",
+]
@@ -1,6 +1,13 @@
 """ANSI color formatting helpers."""
 
-from typing import Optional
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+RGB = Tuple[int, int, int]
+Color = Union[str, RGB]
 
 # Basic ANSI color codes
 _COLOR_MAP = {
@@ -14,6 +21,276 @@ _COLOR_MAP = {
     "white": 37,
 }
 
+RESET = "\033[0m"
+
+TRUECOLOR = "truecolor"
+COLOR256 = "256"
+COLOR16 = "16"
+NO_COLOR = "none"
+_DEPTHS = (TRUECOLOR, COLOR256, COLOR16, NO_COLOR)
+
+_depth: Optional[str] = None
+
+# xterm palette: 6x6x6 cube levels, 24 grays, and the 16 system colors.
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_CUBE_INDEX = bytes(min(range(6), key=lambda i: abs(_CUBE_LEVELS[i] - v)) for v in range(256))
+_GRAY_INDEX = bytes(min(range(24), key=lambda i: abs(8 + 10 * i - v)) for v in range(256))
+_ANSI16 = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+
+def detect_color_depth(environ: Optional[Mapping[str, str]] = None) -> str:
+    """
+    Guess the terminal's color depth from environment variables.
+
+    ``NO_COLOR`` (non-empty) and ``TERM=dumb`` disable color,
+    ``COLORTERM=truecolor``/``24bit`` or a ``*-direct`` terminal enable
+    24-bit color, a ``*256color*`` ``TERM`` gives 256 colors, and any other
+    ``TERM`` falls back to 16. Without ``TERM`` (Windows consoles, pipes)
+    the previous 24-bit behaviour is kept.
+
+    Args:
+        environ: Mapping to inspect; defaults to ``os.environ``.
+
+    Returns:
+        One of ``"truecolor"``, ``"256"``, ``"16"`` or ``"none"``.
+    """
+    env = os.environ if environ is None else environ
+    if env.get("NO_COLOR"):
+        return NO_COLOR
+    if env.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return TRUECOLOR
+    term = env.get("TERM", "").lower()
+    if term == "dumb":
+        return NO_COLOR
+    if term.endswith("-direct") or "truecolor" in term:
+        return TRUECOLOR
+    if "256color" in term:
+        return COLOR256
+    if term and not env.get("WT_SESSION"):
+        return COLOR16
+    return TRUECOLOR
+
+
+def get_color_depth() -> str:
+    """Return the active color depth, detecting it on first use."""
+    global _depth
+    if _depth is None:
+        _depth = detect_color_depth()
+    return _depth
+
+
+def set_color_depth(depth: Optional[str]) -> None:
+    """
+    Override the color depth used by new styles, ``colorize`` and ``rgb``.
+
+    Args:
+        depth: ``"truecolor"``, ``"256"``, ``"16"``, ``"none"``, or ``None``
+            to detect it again from the environment.
+    """
+    global _depth
+    if depth is not None and depth not in _DEPTHS:
+        raise ValueError(f"depth must be one of {', '.join(_DEPTHS)}")
+    _depth = depth
+    style.cache_clear()
+    _rgb_style.cache_clear()
+
+
+def _check_rgb(r: int, g: int, b: int) -> None:
+    for channel, name in zip((r, g, b), "rgb"):
+        if not (0 <= channel <= 255):
+            raise ValueError(f"{name} must be between 0 and 255")
+
+
+def _distance(a: RGB, b: RGB) -> int:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+@lru_cache(maxsize=4096)
+def rgb_to_256(r: int, g: int, b: int) -> int:
+    """
+    Return the nearest xterm-256 palette index (16-255) for an RGB color.
+
+    Each channel is snapped to the color cube through a 256-entry table and
+    compared with the nearest gray ramp entry; results are memoized.
+    """
+    _check_rgb(r, g, b)
+    ri, gi, bi = _CUBE_INDEX[r], _CUBE_INDEX[g], _CUBE_INDEX[b]
+    cube = (_CUBE_LEVELS[ri], _CUBE_LEVELS[gi], _CUBE_LEVELS[bi])
+    mean = (r + g + b) // 3
+    gray_index = min(
+        {_GRAY_INDEX[mean], _GRAY_INDEX[min(mean + 1, 255)]},
+        key=lambda i: _distance((8 + 10 * i,) * 3, (r, g, b)),
+    )
+    level = 8 + 10 * gray_index
+    if _distance((level, level, level), (r, g, b)) < _distance(cube, (r, g, b)):
+        return 232 + gray_index
+    return 16 + 36 * ri + 6 * gi + bi
+
+
+@lru_cache(maxsize=4096)
+def rgb_to_16(r: int, g: int, b: int) -> int:
+    """Return the nearest of the 16 system colors (0-7 normal, 8-15 bright); memoized."""
+    _check_rgb(r, g, b)
+    return min(range(16), key=lambda index: _distance(_ANSI16[index], (r, g, b)))
+
+
+def _color_code(color: Color, layer: str, depth: str) -> Optional[str]:
+    background = layer == "background"
+    if isinstance(color, str):
+        if color not in _COLOR_MAP:
+            raise ValueError(f"Unsupported {layer} color: {color}")
+        code = _COLOR_MAP[color] + (10 if background else 0)
+        return None if depth == NO_COLOR else str(code)
+    if len(color) != 3:
+        raise ValueError(f"{layer} color must be a name or an (r, g, b) tuple")
+    r, g, b = color
+    _check_rgb(r, g, b)
+    if depth == TRUECOLOR:
+        return f"{48 if background else 38};2;{r};{g};{b}"
+    if depth == COLOR256:
+        return f"{48 if background else 38};5;{rgb_to_256(r, g, b)}"
+    if depth == COLOR16:
+        index = rgb_to_16(r, g, b)
+        return str((40 if background else 30) + index % 8 + (60 if index >= 8 else 0))
+    return None
+
+
+class Style:
+    """
+    Validated, reusable ANSI text style.
+
+    All checks run once in the constructor and the SGR prefix and reset
+    suffix are cached as both ``str`` and ``bytes``, so applying a style is
+    a single concatenation. RGB colors are rendered for the style's color
+    depth (24-bit, quantized to 256 or 16 colors, or dropped). Styles
+    compare and hash by value.
+
+    Args:
+        fg: Foreground color name or ``(r, g, b)`` tuple.
+        bg: Background color name or ``(r, g, b)`` tuple.
+        bold: Enable bold style.
+        underline: Enable underline style.
+        depth: Color depth to render for; defaults to :func:`get_color_depth`.
+    """
+
+    __slots__ = (
+        "fg",
+        "bg",
+        "bold",
+        "underline",
+        "depth",
+        "codes",
+        "prefix",
+        "suffix",
+        "prefix_bytes",
+        "suffix_bytes",
+        "_fg_code",
+        "_bg_code",
+        "_hash",
+    )
+
+    def __init__(
+        self,
+        fg: Optional[Color] = None,
+        bg: Optional[Color] = None,
+        bold: bool = False,
+        underline: bool = False,
+        depth: Optional[str] = None,
+    ) -> None:
+        if depth is None:
+            depth = get_color_depth()
+        elif depth not in _DEPTHS:
+            raise ValueError(f"depth must be one of {', '.join(_DEPTHS)}")
+        self._fg_code = _color_code(fg, "foreground", depth) if fg else None
+        self._bg_code = _color_code(bg, "background", depth) if bg else None
+        codes = [code for code in (self._fg_code, self._bg_code) if code]
+        if bold:
+            codes.append("1")
+        if underline:
+            codes.append("4")
+        self.fg = tuple(fg) if fg and not isinstance(fg, str) else (fg or None)
+        self.bg = tuple(bg) if bg and not isinstance(bg, str) else (bg or None)
+        self.bold = bool(bold)
+        self.underline = bool(underline)
+        self.depth = depth
+        self.codes: Tuple[str, ...] = tuple(codes)
+        self.prefix = "\033[" + ";".join(codes) + "m" if codes else ""
+        self.suffix = RESET if codes else ""
+        self.prefix_bytes = self.prefix.encode("ascii")
+        self.suffix_bytes = self.suffix.encode("ascii")
+        self._hash = hash(self._key())
+
+    def __call__(self, text: str) -> str:
+        """Return ``text`` wrapped in this style."""
+        return f"{self.prefix}{text}{self.suffix}"
+
+    def apply_many(self, lines: Iterable[str]) -> List[str]:
+        """Return every line wrapped in this style."""
+        prefix, suffix = self.prefix, self.suffix
+        if not prefix:
+            return list(lines)
+        return [f"{prefix}{line}{suffix}" for line in lines]
+
+    def _key(self) -> tuple:
+        return (self.fg, self.bg, self.bold, self.underline, self.depth)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Style):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __bool__(self) -> bool:
+        return bool(self.codes)
+
+    def __repr__(self) -> str:
+        names = ("fg", "bg", "bold", "underline")
+        args = [f"{name}={value!r}" for name, value in zip(names, self._key()) if value]
+        return f"Style({', '.join(args)})"
+
+
+@lru_cache(maxsize=1024, typed=True)
+def style(
+    fg: Optional[Color] = None,
+    bg: Optional[Color] = None,
+    bold: bool = False,
+    underline: bool = False,
+) -> Style:
+    """
+    Return an interned :class:`Style`; equal arguments share one instance.
+
+    Args:
+        fg: Foreground color name or ``(r, g, b)`` tuple.
+        bg: Background color name or ``(r, g, b)`` tuple.
+        bold: Enable bold style.
+        underline: Enable underline style.
+    """
+    return Style(fg, bg, bold, underline)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _rgb_style(r: int, g: int, b: int) -> Style:
+    return Style(fg=(r, g, b))
+
 
 def colorize(
     text: str,
@@ -32,29 +309,15 @@ def colorize(
         bold: Enable bold style.
         underline: Enable underline style.
     """
-    codes = []
-    if fg:
-        if fg not in _COLOR_MAP:
-            raise ValueError(f"Unsupported foreground color: {fg}")
-        codes.append(str(_COLOR_MAP[fg]))
-    if bg:
-        if bg not in _COLOR_MAP:
-            raise ValueError(f"Unsupported background color: {bg}")
-        codes.append(str(_COLOR_MAP[bg] + 10))  # Background codes offset by 10
-    if bold:
-        codes.append("1")
-    if underline:
-        codes.append("4")
-    if not codes:
-        return text
-    prefix = "\033[" + ";".join(codes) + "m"
-    suffix = "\033[0m"
-    return f"{prefix}{text}{suffix}"
+    return style(fg, bg, bold, underline)(text)
 
 
 def rgb(text: str, r: int, g: int, b: int) -> str:
     """
-    Apply true-color (24-bit) ANSI foreground to text.
+    Apply an RGB foreground color to text.
+
+    The color is emitted as 24-bit, or quantized to the xterm-256 or
+    16-color palette, according to :func:`get_color_depth`.
 
     Args:
         text: String to format.
@@ -62,9 +325,88 @@ def rgb(text: str, r: int, g: int, b: int) -> str:
         g: Green channel (0-255).
         b: Blue channel (0-255).
     """
-    for channel, name in zip((r, g, b), "rgb"):
-        if not (0 <= channel <= 255):
-            raise ValueError(f"{name} must be between 0 and 255")
-    prefix = f"\033[38;2;{r};{g};{b}m"
-    suffix = "\033[0m"
-    return f"{prefix}{text}{suffix}"
+    return _rgb_style(r, g, b)(text)
+
+
+@lru_cache(maxsize=4096)
+def sgr_transition(previous: Optional[Style], current: Optional[Style]) -> str:
+    """
+    Return the shortest SGR sequence that switches from ``previous`` to ``current``.
+
+    Either side may be ``None`` for the terminal's default rendition. Only
+    attributes that differ are emitted, with targeted resets (``39``,
+    ``49``, ``22``, ``24``) for attributes ``current`` drops, unless a full
+    ``0`` reset followed by ``current`` is shorter.
+
+    Args:
+        previous: Style in effect before the transition.
+        current: Style wanted after it.
+    """
+    previous = previous or None
+    current = current or None
+    if previous == current:
+        return ""
+    if current is None:
+        return RESET
+    if previous is None:
+        return current.prefix
+    if previous.codes == current.codes:
+        return ""
+    old_fg, old_bg, old_bold, old_underline = previous._fg_code, previous._bg_code, previous.bold, previous.underline
+    fg, bg, bold, underline = current._fg_code, current._bg_code, current.bold, current.underline
+    codes = []
+    if fg != old_fg:
+        codes.append(fg or "39")
+    if bg != old_bg:
+        codes.append(bg or "49")
+    if bold != old_bold:
+        codes.append("1" if bold else "22")
+    if underline != old_underline:
+        codes.append("4" if underline else "24")
+    delta = "\033[" + ";".join(codes) + "m"
+    full = "\033[0;" + ";".join(current.codes) + "m"
+    return delta if len(delta) <= len(full) else full
+
+
+def _blank_key(current: Optional[Style]) -> Tuple[Optional[Color], bool]:
+    return (current.bg, current.underline) if current is not None else (None, False)
+
+
+def styled_line(cells: Iterable[Tuple[str, Optional[Style]]]) -> str:
+    """
+    Join ``(text, style)`` cells, emitting SGR codes only where the style changes.
+
+    Runs of cells sharing a style get a single prefix, transitions between
+    styles use :func:`sgr_transition` instead of a reset plus a new prefix,
+    whitespace keeps the current style when it would look the same (only
+    background and underline show on blanks), and one reset closes the
+    line if it ends styled. The result starts and
+    ends in the default rendition, so lines can be drawn independently.
+
+    Args:
+        cells: Text fragments (usually single characters) with their style;
+            ``None`` means unstyled.
+    """
+    parts: List[str] = []
+    append = parts.append
+    current: Optional[Style] = None
+    for text, cell_style in cells:
+        if cell_style is not current:
+            if not cell_style:
+                cell_style = None
+            if text.isspace() and _blank_key(cell_style) == _blank_key(current):
+                append(text)
+                continue
+            append(sgr_transition(current, cell_style))
+            current = cell_style
+        append(text)
+    if current is not None:
+        append(RESET)
+    return "".join(parts)
+
+
+def styled_lines(
+    rows: Iterable[Sequence[Tuple[str, Optional[Style]]]],
+) -> List[str]:
+    """Apply :func:`styled_line` to each row of cells."""
+    return [styled_line(row) for row in rows]
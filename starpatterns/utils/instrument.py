@@ -0,0 +1,252 @@
+"""
+Per-frame timing hooks for paced animations.
+
+:class:`~starpatterns.utils.scheduler.FrameScheduler` is the single point
+every paced animation goes through, so it is where frames are measured.
+When at least one hook is registered (globally with :func:`add_frame_hook`
+or on a scheduler with ``hooks=``), each presented frame produces a
+:class:`FrameEvent` that is passed to every hook. With no hooks the
+scheduler takes no extra timestamps.
+
+:class:`FrameStats` is a ready-made hook that aggregates events into
+percentiles and can forward a summary to :mod:`logging`::
+
+    from starpatterns.utils.instrument import FrameStats, frame_hooks
+
+    stats = FrameStats()
+    with frame_hooks(stats):
+        matrix_rain(frames=200)
+    print(stats.report())
+"""
+
+from __future__ import annotations
+
+import math
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+if TYPE_CHECKING:
+    import logging
+
+# logging is imported only when a report is actually logged; it costs more
+# to import than the rest of the animation stack.
+LOGGER_NAME = "starpatterns.frames"
+_INFO = 20
+_DEBUG = 10
+
+
+class FrameEvent(NamedTuple):
+    """
+    Timing of one presented frame.
+
+    ``build`` and ``write`` are wall-clock seconds measured with
+    ``time.perf_counter``; the sleep and lateness fields use the
+    scheduler's clock, so they stay exact under a virtual clock.
+
+    Attributes:
+        index: Position of the frame among the frames presented this run.
+        build: Seconds spent producing the frame (advancing the frame source).
+        write: Seconds the player spent outputting it (diffing and sink write).
+        bytes: Bytes the sink received for the frame, or ``None`` when the
+            scheduler was not given the sink.
+        sleep_scheduled: Seconds the scheduler asked to sleep before the frame.
+        sleep_actual: Seconds the sleep really took.
+        lateness: Seconds between the frame's deadline and its presentation.
+        dropped: Frames skipped immediately before this one.
+    """
+
+    index: int
+    build: float
+    write: float
+    bytes: Optional[int]
+    sleep_scheduled: float
+    sleep_actual: float
+    lateness: float
+    dropped: int
+
+    @property
+    def frame_time(self) -> float:
+        """Work done for the frame: ``build + write``."""
+        return self.build + self.write
+
+    @property
+    def oversleep(self) -> float:
+        """How much longer the sleep took than requested."""
+        return self.sleep_actual - self.sleep_scheduled
+
+
+FrameHook = Callable[[FrameEvent], None]
+
+_hooks: List[FrameHook] = []
+
+
+def add_frame_hook(hook: FrameHook) -> FrameHook:
+    """
+    Register ``hook`` to receive a :class:`FrameEvent` for every paced frame.
+
+    Runs that are already in progress keep the hooks they started with.
+    Returns ``hook`` so it can be used as a decorator.
+    """
+    if not callable(hook):
+        raise TypeError("hook must be callable")
+    _hooks.append(hook)
+    return hook
+
+
+def remove_frame_hook(hook: FrameHook) -> None:
+    """Unregister a hook added with :func:`add_frame_hook`."""
+    try:
+        _hooks.remove(hook)
+    except ValueError:
+        raise ValueError("hook is not registered") from None
+
+
+def clear_frame_hooks() -> None:
+    """Unregister every global hook."""
+    _hooks.clear()
+
+
+@contextmanager
+def frame_hooks(*hooks: FrameHook) -> Iterator[None]:
+    """Register ``hooks`` for the duration of a ``with`` block."""
+    for hook in hooks:
+        add_frame_hook(hook)
+    try:
+        yield
+    finally:
+        for hook in hooks:
+            if hook in _hooks:
+                _hooks.remove(hook)
+
+
+def _percentile(ordered: Sequence[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class FrameStats:
+    """
+    Hook that aggregates frame events.
+
+    Keeps every frame's build, write and total time plus its oversleep, so
+    percentiles are exact; memory grows by a few floats per frame.
+    """
+
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self.frames = 0
+        self.dropped = 0
+        self.bytes = 0
+        self.max_lateness = 0.0
+        self._build: List[float] = []
+        self._write: List[float] = []
+        self._frame: List[float] = []
+        self._oversleep: List[float] = []
+
+    def __call__(self, event: FrameEvent) -> None:
+        self.frames += 1
+        self.dropped += event.dropped
+        if event.bytes is not None:
+            self.bytes += event.bytes
+        if event.lateness > self.max_lateness:
+            self.max_lateness = event.lateness
+        self._build.append(event.build)
+        self._write.append(event.write)
+        self._frame.append(event.build + event.write)
+        self._oversleep.append(event.sleep_actual - event.sleep_scheduled)
+
+    def percentiles(self, field: str = "frame") -> Dict[str, float]:
+        """
+        Return ``{"p50": ..., "p90": ..., "p99": ...}`` in seconds.
+
+        Args:
+            field: ``"frame"`` (build + write), ``"build"``, ``"write"`` or
+                ``"oversleep"``.
+        """
+        values = {"frame": self._frame, "build": self._build, "write": self._write, "oversleep": self._oversleep}
+        if field not in values:
+            raise ValueError("field must be one of frame, build, write, oversleep")
+        ordered = sorted(values[field])
+        return {f"p{percent}": _percentile(ordered, percent) for percent in self.PERCENTILES}
+
+    def summary(self) -> Dict[str, object]:
+        """Return the aggregates as a JSON-serializable dict."""
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "bytes": self.bytes,
+            "bytes_per_frame": self.bytes / self.frames if self.frames else 0.0,
+            "max_lateness": self.max_lateness,
+            "frame": self.percentiles("frame"),
+            "build": self.percentiles("build"),
+            "write": self.percentiles("write"),
+            "oversleep": self.percentiles("oversleep"),
+        }
+
+    def report(self) -> str:
+        """Return a short human-readable summary."""
+        if not self.frames:
+            return "no frames recorded"
+        lines = [
+            f"{self.frames} frames, {self.dropped} dropped, {self.bytes / self.frames:.1f} bytes/frame, "
+            f"max lateness {self.max_lateness * 1000:.2f} ms"
+        ]
+        for field in ("frame", "build", "write", "oversleep"):
+            values = self.percentiles(field)
+            lines.append(f"{field:<9} " + "  ".join(f"{key} {value * 1000:8.3f} ms" for key, value in values.items()))
+        return "\n".join(lines)
+
+    def log(self, log: Optional[logging.Logger] = None, level: int = _INFO) -> None:
+        """
+        Send :meth:`report` to a logger, one record per line.
+
+        Args:
+            log: Logger to use; defaults to the ``starpatterns.frames`` logger.
+            level: Logging level; defaults to ``logging.INFO``.
+        """
+        if log is None:
+            import logging
+
+            log = logging.getLogger(LOGGER_NAME)
+        if log.isEnabledFor(level):
+            for line in self.report().splitlines():
+                log.log(level, "%s", line)
+
+
+def log_frames(log: Optional[logging.Logger] = None, level: int = _DEBUG) -> FrameHook:
+    """
+    Build a hook that logs one line per frame.
+
+    Args:
+        log: Destination logger; defaults to ``starpatterns.frames``.
+        level: Logging level of each record; ``logging.DEBUG`` by default.
+    """
+    if log is None:
+        import logging
+
+        log = logging.getLogger(LOGGER_NAME)
+
+    def hook(event: FrameEvent) -> None:
+        if log.isEnabledFor(level):
+            log.log(
+                level,
+                "frame %d build=%.3fms write=%.3fms bytes=%s sleep=%.3f/%.3fms late=%.3fms dropped=%d",
+                event.index,
+                event.build * 1000,
+                event.write * 1000,
+                event.bytes,
+                event.sleep_actual * 1000,
+                event.sleep_scheduled * 1000,
+                event.lateness * 1000,
+                event.dropped,
+            )
+
+    return hook
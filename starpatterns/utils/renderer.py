@@ -0,0 +1,133 @@
+"""Diff-based frame rendering for multi-line terminal animations."""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Pattern, Sequence, Tuple
+
+
+class FrameRenderer:
+    """
+    Turn successive frames into minimal ANSI update sequences.
+
+    The first frame is painted in full after moving the cursor home. Every
+    later frame is compared row by row with the previous one and only the
+    changed runs of cells are emitted, each preceded by a cursor move. When
+    a diff would cost more than a full repaint, the full repaint is used.
+
+    Args:
+        merge_gap: Unchanged cells between two changed runs that are cheaper
+            to rewrite than to skip with another cursor move.
+    """
+
+    def __init__(self, merge_gap: int = 6) -> None:
+        if merge_gap < 0:
+            raise ValueError("merge_gap must be non-negative")
+        self.merge_gap = merge_gap
+        self.frames = 0
+        self.bytes_written = 0
+        self.bytes_full = 0
+        self.last_bytes = 0
+        self.last_saved = 0
+        self._previous: Optional[List[str]] = None
+
+    @property
+    def bytes_saved(self) -> int:
+        """Total bytes saved compared with repainting every frame in full."""
+        return self.bytes_full - self.bytes_written
+
+    @property
+    def saved_per_frame(self) -> float:
+        """Average bytes saved per rendered frame."""
+        return self.bytes_saved / self.frames if self.frames else 0.0
+
+    def reset(self) -> None:
+        """Forget the previous frame so the next one is painted in full."""
+        self._previous = None
+
+    def render(self, lines: Sequence[str]) -> str:
+        """
+        Return the escape sequence that updates the screen to ``lines``.
+
+        Args:
+            lines: Rows of the new frame, top to bottom.
+        """
+        full = "\033[H" + "\n".join(lines)
+        if self._previous is None:
+            payload = full
+        else:
+            payload = self._diff(self._previous, lines)
+            if len(payload) >= len(full) and _covers(lines, self._previous):
+                payload = full
+        self._previous = list(lines)
+
+        full_bytes = len(full.encode("utf-8"))
+        payload_bytes = len(payload.encode("utf-8"))
+        self.frames += 1
+        self.bytes_full += full_bytes
+        self.bytes_written += payload_bytes
+        self.last_bytes = payload_bytes
+        self.last_saved = full_bytes - payload_bytes
+        return payload
+
+    def finish(self) -> str:
+        """Return the sequence that parks the cursor after the last row."""
+        if not self._previous:
+            return ""
+        row = len(self._previous)
+        col = len(self._previous[-1]) + 1
+        return f"\033[{row};{col}H"
+
+    def _diff(self, previous: Sequence[str], lines: Sequence[str]) -> str:
+        parts: List[str] = []
+        for row in range(max(len(previous), len(lines))):
+            old = previous[row] if row < len(previous) else ""
+            new = lines[row] if row < len(lines) else ""
+            if old == new:
+                continue
+            for start, end in _changed_runs(old, new, self.merge_gap):
+                parts.append(f"\033[{row + 1};{start + 1}H")
+                parts.append(new[start:end])
+            if len(new) < len(old):
+                parts.append(f"\033[{row + 1};{len(new) + 1}H\033[K")
+        return "".join(parts)
+
+
+def _covers(lines: Sequence[str], previous: Sequence[str]) -> bool:
+    """Return True when painting ``lines`` in full overwrites every old cell."""
+    if len(lines) < len(previous):
+        return False
+    return all(len(new) >= len(old) for new, old in zip(lines, previous))
+
+
+_SAME, _DIFF = b".", b"x"
+# Maps each byte of ``old ^ new`` to a same/different marker.
+_MARK = _SAME + _DIFF * 255
+
+
+@lru_cache(maxsize=None)
+def _run_pattern(merge_gap: int) -> Pattern[bytes]:
+    return re.compile(rb"x+(?:\.{0,%d}x+)*" % merge_gap)
+
+
+def _changed_runs(old: str, new: str, merge_gap: int) -> List[Tuple[int, int]]:
+    """Return ``(start, end)`` slices of ``new`` that differ from ``old``."""
+    if old.isascii() and new.isascii():
+        # XOR the rows as big integers and scan the marked bytes with a regex,
+        # keeping the per-cell work in C.
+        common = min(len(old), len(new))
+        xor = int.from_bytes(old[:common].encode(), "big") ^ int.from_bytes(new[:common].encode(), "big")
+        mask = xor.to_bytes(common, "big").translate(_MARK) + _DIFF * (len(new) - common)
+        return [match.span() for match in _run_pattern(merge_gap).finditer(mask)]
+    changed = [col for col, (a, b) in enumerate(zip(old, new)) if a != b]
+    changed.extend(range(len(old), len(new)))
+    runs: List[Tuple[int, int]] = []
+    if not changed:
+        return runs
+    start = last = changed[0]
+    for col in changed[1:]:
+        if col - last - 1 > merge_gap:
+            runs.append((start, last + 1))
+            start = col
+        last = col
+    runs.append((start, last + 1))
+    return runs
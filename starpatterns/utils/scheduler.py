@@ -0,0 +1,252 @@
+"""Drift-free frame pacing with injectable clocks."""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, Sequence, Tuple, TypeVar
+
+from . import instrument as _instrument
+from .instrument import FrameEvent, FrameHook
+from .sink import Sink
+
+T = TypeVar("T")
+
+_END = object()
+_SLEEP = object()
+_FRAME = object()
+
+
+class Clock:
+    """Monotonic wall clock backed by ``time.perf_counter`` and ``time.sleep``."""
+
+    def now(self) -> float:
+        """Return the current time in seconds."""
+        return time.perf_counter()
+
+    def sleep(self, seconds: float) -> None:
+        """Block for ``seconds``."""
+        if seconds > 0:
+            time.sleep(seconds)
+
+    async def asleep(self, seconds: float) -> None:
+        """Suspend the current asyncio task for ``seconds``."""
+        import asyncio
+
+        await asyncio.sleep(max(seconds, 0))
+
+
+class VirtualClock(Clock):
+    """
+    Clock whose ``sleep`` advances time instantly.
+
+    Useful for tests, benchmarks and offline renders: a paced animation runs
+    at full speed while still observing the same deadlines.
+
+    Args:
+        start: Initial time in seconds.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.time = start
+
+    def now(self) -> float:
+        return self.time
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.time += seconds
+
+    async def asleep(self, seconds: float) -> None:
+        import asyncio
+
+        self.sleep(seconds)
+        await asyncio.sleep(0)
+
+    def advance(self, seconds: float) -> None:
+        """Move time forward without sleeping, e.g. to simulate slow work."""
+        if seconds < 0:
+            raise ValueError("seconds must be non-negative")
+        self.time += seconds
+
+
+class FrameScheduler:
+    """
+    Present frames on absolute deadlines ``start + index * interval``.
+
+    Frame production and output time are absorbed by the deadline instead of
+    being added on top of the delay, so the frame rate does not drift. When
+    ``drop_frames`` is enabled, frames whose slot has already passed are
+    skipped (never the final one) so a slow terminal catches up instead of
+    falling further behind.
+
+    Each presented frame is reported as a
+    :class:`~starpatterns.utils.instrument.FrameEvent` to the hooks given
+    here and to those registered globally; without hooks nothing extra is
+    measured.
+
+    Args:
+        clock: Time source; defaults to a monotonic :class:`Clock`.
+        drop_frames: Skip frames that would be presented a full interval late.
+        hooks: Per-frame callbacks for this scheduler only.
+    """
+
+    def __init__(self, clock: Optional[Clock] = None, drop_frames: bool = False, hooks: Sequence[FrameHook] = ()) -> None:
+        self.clock = clock if clock is not None else Clock()
+        self.drop_frames = drop_frames
+        self.hooks = tuple(hooks)
+        self._reset(0.0)
+
+    def _reset(self, interval: float) -> None:
+        self.interval = interval
+        self.frames = 0
+        self.dropped = 0
+        self.elapsed = 0.0
+        self.max_lateness = 0.0
+        self._start = 0.0
+        self._last_present: Optional[float] = None
+        self._periods = 0
+        self._period_mean = 0.0
+        self._period_m2 = 0.0
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frames presented per second of the last (or current) run."""
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def jitter(self) -> float:
+        """Standard deviation of the time between presented frames, in seconds."""
+        if self._periods < 2:
+            return 0.0
+        return math.sqrt(self._period_m2 / self._periods)
+
+    def pace(
+        self,
+        frames: Iterable[T],
+        interval: float,
+        duration: Optional[float] = None,
+        sink: Optional[Sink] = None,
+    ) -> Iterator[T]:
+        """
+        Yield ``frames`` one per ``interval`` seconds, holding the last one.
+
+        Args:
+            frames: Frames to present.
+            interval: Target seconds between frames.
+            duration: Stop once a frame's deadline reaches this many seconds.
+            sink: Sink the caller writes frames to; only read to report
+                bytes per frame to hooks.
+        """
+        sleep = self.clock.sleep
+        for kind, value in self._steps(frames, interval, duration, sink):
+            if kind is _SLEEP:
+                sleep(value)
+            else:
+                yield value
+
+    async def apace(
+        self,
+        frames: Iterable[T],
+        interval: float,
+        duration: Optional[float] = None,
+        sink: Optional[Sink] = None,
+    ) -> AsyncIterator[T]:
+        """Asynchronous :meth:`pace` that waits with the clock's ``asleep``."""
+        asleep = self.clock.asleep
+        for kind, value in self._steps(frames, interval, duration, sink):
+            if kind is _SLEEP:
+                await asleep(value)
+            else:
+                yield value
+
+    def _steps(
+        self,
+        frames: Iterable[T],
+        interval: float,
+        duration: Optional[float],
+        sink: Optional[Sink] = None,
+    ) -> Iterator[Tuple[object, Any]]:
+        """Plan the run as ``(_SLEEP, seconds)`` and ``(_FRAME, frame)`` steps."""
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        clock = self.clock
+        self._reset(interval)
+        # Hooks are fixed for the run; an empty tuple keeps the loop free of
+        # extra timestamps.
+        hooks = tuple(_instrument._hooks) + self.hooks
+        timer = time.perf_counter
+        start = self._start = clock.now()
+        it = iter(frames)
+        mark = timer() if hooks else 0.0
+        frame = next(it, _END)
+        build = timer() - mark if hooks else 0.0
+        skipped = 0
+        index = 0
+        while frame is not _END:
+            deadline = start + index * interval
+            if duration is not None and deadline - start >= duration:
+                break
+            now = clock.now()
+            if self.drop_frames and now - deadline >= interval:
+                mark = timer() if hooks else 0.0
+                upcoming = next(it, _END)
+                if upcoming is not _END:
+                    self.dropped += 1
+                    skipped += 1
+                    index += 1
+                    frame = upcoming
+                    if hooks:
+                        build += timer() - mark
+                    continue
+            scheduled = slept = 0.0
+            if deadline > now:
+                scheduled = deadline - now
+                yield _SLEEP, scheduled
+                presented = clock.now()
+                slept, now = presented - now, presented
+            self._record(now, now - deadline)
+            if not hooks:
+                yield _FRAME, frame
+                index += 1
+                frame = next(it, _END)
+                continue
+            written = sink.bytes_written if sink is not None else 0
+            mark = timer()
+            yield _FRAME, frame
+            wrote = timer() - mark
+            event = FrameEvent(
+                self.frames - 1,
+                build,
+                wrote,
+                sink.bytes_written - written if sink is not None else None,
+                scheduled,
+                slept,
+                now - deadline,
+                skipped,
+            )
+            for hook in hooks:
+                hook(event)
+            skipped = 0
+            index += 1
+            mark = timer()
+            frame = next(it, _END)
+            build = timer() - mark
+        hold = start + index * interval - clock.now()
+        if hold > 0:
+            yield _SLEEP, hold
+        self.elapsed = clock.now() - start
+
+    def _record(self, present: float, lateness: float) -> None:
+        self.frames += 1
+        self.elapsed = present - self._start
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+        if self._last_present is not None:
+            # Welford's running variance keeps memory constant per run.
+            period = present - self._last_present
+            self._periods += 1
+            delta = period - self._period_mean
+            self._period_mean += delta / self._periods
+            self._period_m2 += delta * (period - self._period_mean)
+        self._last_present = present
@@ -0,0 +1,192 @@
+"""
+Output sinks that receive one fully assembled frame per write.
+
+Animations build each frame (cursor movement, clears and text) into a
+single string and hand it to a sink, which issues exactly one write and,
+for buffered streams, one flush. Every sink counts its writes, flushes and
+bytes so callers can see what a run cost on the wire.
+"""
+
+from __future__ import annotations
+
+import codecs
+import io
+import os
+import sys
+from typing import IO, List, Optional
+
+
+def _nbytes(data: str) -> int:
+    return len(data) if data.isascii() else len(data.encode("utf-8"))
+
+
+class Sink:
+    """
+    Base class for frame destinations.
+
+    Subclasses implement :meth:`write`, which must deliver ``data`` in a
+    single write call and update :attr:`writes`, :attr:`flushes` and
+    :attr:`bytes_written`.
+    """
+
+    # True when frames start on a cleared screen of the sink's own (see
+    # ``Terminal``), so players need not scroll down to reserve rows.
+    fullscreen = False
+
+    def __init__(self) -> None:
+        self.writes = 0
+        self.flushes = 0
+        self.bytes_written = 0
+
+    def write(self, data: str) -> None:
+        """Deliver one frame."""
+        raise NotImplementedError
+
+    def write_bytes(self, payload: bytes) -> None:
+        """Deliver one frame already encoded as UTF-8."""
+        self.write(payload.decode("utf-8"))
+
+    def close(self) -> None:
+        """Release anything the sink owns; the default does nothing."""
+
+    @property
+    def bytes_per_write(self) -> float:
+        """Average payload size in bytes."""
+        return self.bytes_written / self.writes if self.writes else 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class StreamSink(Sink):
+    """
+    Write frames to a file object, flushing after each one.
+
+    Binary streams receive UTF-8 bytes; text streams receive ``str``.
+
+    Args:
+        stream: Destination file object; ``None`` writes to whatever
+            ``sys.stdout`` is at the time of each write.
+        encoding: Encoding used for binary streams.
+    """
+
+    def __init__(self, stream: Optional[IO] = None, encoding: str = "utf-8") -> None:
+        super().__init__()
+        self.stream = stream
+        self.encoding = encoding
+        self.binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+        self._utf8 = codecs.lookup(encoding).name == "utf-8"
+
+    def write(self, data: str) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        if self.binary:
+            payload = data.encode(self.encoding)
+            stream.write(payload)
+            self.bytes_written += len(payload)
+        else:
+            stream.write(data)
+            self.bytes_written += _nbytes(data)
+        stream.flush()
+        self.writes += 1
+        self.flushes += 1
+
+    def write_bytes(self, payload: bytes) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        if self.binary:
+            if not self._utf8:
+                self.write(payload.decode("utf-8"))
+                return
+            target = stream
+        else:
+            # Text streams are flushed after every frame, so writing straight
+            # to their binary buffer keeps the output in order.
+            target = getattr(stream, "buffer", None)
+            encoding = getattr(stream, "encoding", None) or ""
+            if target is None or not (payload.isascii() or codecs.lookup(encoding).name == "utf-8"):
+                self.write(payload.decode("utf-8"))
+                return
+            stream.flush()
+        target.write(payload)
+        target.flush()
+        self.writes += 1
+        self.flushes += 1
+        self.bytes_written += len(payload)
+
+
+class MemorySink(Sink):
+    """Keep every frame in memory; handy for tests, snapshots and recording."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks: List[str] = []
+
+    def write(self, data: str) -> None:
+        self.chunks.append(data)
+        self.writes += 1
+        self.bytes_written += _nbytes(data)
+
+    def getvalue(self) -> str:
+        """Return everything written so far."""
+        return "".join(self.chunks)
+
+    def clear(self) -> None:
+        """Drop the stored frames and reset the counters."""
+        self.chunks.clear()
+        self.writes = self.flushes = self.bytes_written = 0
+
+
+class FdSink(Sink):
+    """
+    Write frames straight to a file descriptor with ``os.write``.
+
+    There is no user-space buffer to flush, so each frame is one system
+    call (retried only for partial writes).
+
+    Args:
+        fd: File descriptor; defaults to standard output.
+        encoding: Encoding of the written bytes.
+        closefd: Close ``fd`` in :meth:`close`.
+    """
+
+    def __init__(self, fd: Optional[int] = None, encoding: str = "utf-8", closefd: bool = False) -> None:
+        super().__init__()
+        if fd is None:
+            sys.stdout.flush()
+            fd = sys.stdout.fileno()
+        self.fd = fd
+        self.encoding = encoding
+        self.closefd = closefd
+        self._utf8 = codecs.lookup(encoding).name == "utf-8"
+
+    def write(self, data: str) -> None:
+        self._send(data.encode(self.encoding))
+
+    def write_bytes(self, payload: bytes) -> None:
+        self._send(payload if self._utf8 else payload.decode("utf-8").encode(self.encoding))
+
+    def _send(self, payload: bytes) -> None:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(self.fd, view) :]
+        self.writes += 1
+        self.bytes_written += len(payload)
+
+    def close(self) -> None:
+        if self.closefd and self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class NullSink(Sink):
+    """Discard frames but keep the counters; used for benchmarks and dry runs."""
+
+    def write(self, data: str) -> None:
+        self.writes += 1
+        self.bytes_written += _nbytes(data)
+
+    def write_bytes(self, payload: bytes) -> None:
+        self.writes += 1
+        self.bytes_written += len(payload)
@@ -1,19 +1,230 @@
-"""Terminal helpers for clearing and cursor control."""
+"""
+Terminal control with plain ANSI sequences.
+
+Clearing and cursor movement are single escape-sequence writes; no shell
+command is spawned. :class:`Terminal` is a sink that owns the screen for a
+``with`` block: it switches to the alternate screen, hides the cursor and
+wraps every frame in a synchronized update (DEC private mode 2026) so the
+terminal presents it at once, without tearing. Everything is restored on
+exit, including when the block raises::
+
+    from starpatterns.utils.terminal import Terminal
+
+    with Terminal() as term:
+        columns, lines = term.size
+        matrix_rain(columns, lines - 1, frames=500, sink=term)
+"""
+
+from __future__ import annotations
 
 import os
+import shutil
 import sys
+from functools import lru_cache
+from typing import Mapping, Optional, Tuple
+
+from .sink import Sink, StreamSink
+
+CURSOR_HOME = "\033[H"
+CLEAR_SCREEN = "\033[2J"
+CLEAR_SCROLLBACK = "\033[3J"
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+ALT_SCREEN_ON = "\033[?1049h"
+ALT_SCREEN_OFF = "\033[?1049l"
+SYNC_BEGIN = "\033[?2026h"
+SYNC_END = "\033[?2026l"
+_RESET = "\033[0m"
+
+_SYNC_BEGIN_BYTES = SYNC_BEGIN.encode("ascii")
+_SYNC_END_BYTES = SYNC_END.encode("ascii")
+
+# TERM_PROGRAM values and TERM fragments of terminals known to honour mode 2026.
+_SYNC_PROGRAMS = ("iterm.app", "wezterm", "vscode", "ghostty", "contour", "tmux")
+_SYNC_TERMS = ("kitty", "foot", "alacritty", "wezterm", "contour", "ghostty")
+
+
+@lru_cache(maxsize=None)
+def _enable_vt() -> bool:
+    """Turn on ANSI processing for the Windows console once; a no-op elsewhere."""
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
 
 
-def clear_terminal() -> None:
-    """Clear the terminal screen on Windows and Unix-like systems."""
-    command = "cls" if os.name == "nt" else "clear"
-    os.system(command)
+def _emit(data: str, sink: Optional[Sink]) -> None:
+    if sink is not None:
+        sink.write(data)
+    else:
+        sys.stdout.write(data)
+        sys.stdout.flush()
 
 
-def move_cursor_home() -> None:
+def clear_terminal(sink: Optional[Sink] = None) -> None:
+    """
+    Clear the screen and scrollback and move the cursor home.
+
+    Args:
+        sink: Destination; ``sys.stdout`` by default.
+    """
+    _enable_vt()
+    _emit(CURSOR_HOME + CLEAR_SCREEN + CLEAR_SCROLLBACK, sink)
+
+
+def move_cursor_home(sink: Optional[Sink] = None) -> None:
     """
     Move the cursor to the top-left corner without clearing the screen.
     Useful for redrawing animations without flicker.
+
+    Args:
+        sink: Destination; ``sys.stdout`` by default.
     """
-    sys.stdout.write("\033[H")
-    sys.stdout.flush()
+    _emit(CURSOR_HOME, sink)
+
+
+def supports_synchronized_output(environ: Optional[Mapping[str, str]] = None) -> bool:
+    """
+    Guess from environment variables whether the terminal honours mode 2026.
+
+    Terminals that do not know the mode ignore it, so a wrong guess only
+    loses the tear-free presentation; the check keeps the extra bytes off
+    terminals where they are known to do nothing.
+
+    Args:
+        environ: Mapping to inspect; defaults to ``os.environ``.
+    """
+    env = os.environ if environ is None else environ
+    term = env.get("TERM", "").lower()
+    if term == "dumb":
+        return False
+    if env.get("TERM_PROGRAM", "").lower() in _SYNC_PROGRAMS or env.get("WT_SESSION"):
+        return True
+    return any(name in term for name in _SYNC_TERMS)
+
+
+def _isatty(sink: Sink) -> bool:
+    fd = getattr(sink, "fd", None)
+    if fd is not None:
+        return os.isatty(fd)
+    stream = getattr(sink, "stream", None) or sys.stdout
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
+
+
+class Terminal(Sink):
+    """
+    Sink that owns the terminal screen while it is open.
+
+    Opening (or entering the ``with`` block) writes one setup sequence:
+    alternate screen, hidden cursor and a clear. Each frame written
+    through it is then wrapped in ``SYNC_BEGIN``/``SYNC_END`` when
+    synchronized output is enabled, still as a single write. Closing
+    resets text attributes, shows the cursor and leaves the alternate
+    screen, so the user's shell and scrollback come back untouched.
+
+    Args:
+        sink: Sink that receives the bytes; a ``StreamSink`` on stdout by default.
+        alt_screen: Draw on the alternate screen buffer.
+        hide_cursor: Hide the cursor while open.
+        sync: Wrap frames in synchronized updates; ``None`` enables them
+            when the output is a terminal and
+            :func:`supports_synchronized_output` says so.
+        clear: Clear the screen when opening.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[Sink] = None,
+        alt_screen: bool = True,
+        hide_cursor: bool = True,
+        sync: Optional[bool] = None,
+        clear: bool = True,
+    ) -> None:
+        super().__init__()
+        self.sink = sink if sink is not None else StreamSink()
+        self.alt_screen = alt_screen
+        self.hide_cursor = hide_cursor
+        self.clear = clear
+        if sync is None:
+            sync = _isatty(self.sink) and supports_synchronized_output()
+        self.sync = sync
+        self.active = False
+
+    @property
+    def fullscreen(self) -> bool:
+        """Whether frames start on a cleared screen of their own, so players need not reserve rows."""
+        return self.active and self.alt_screen
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Current ``(columns, lines)`` of the terminal."""
+        columns, lines = shutil.get_terminal_size()
+        return columns, lines
+
+    def open(self) -> None:
+        """Take over the screen; does nothing when already open."""
+        if self.active:
+            return
+        _enable_vt()
+        setup = ""
+        if self.alt_screen:
+            setup += ALT_SCREEN_ON
+        if self.hide_cursor:
+            setup += HIDE_CURSOR
+        if self.clear:
+            setup += CURSOR_HOME + CLEAR_SCREEN
+        if setup:
+            self._forward(setup)
+        self.active = True
+
+    def close(self) -> None:
+        """Restore the screen; safe to call more than once."""
+        if not self.active:
+            return
+        self.active = False
+        restore = _RESET
+        if self.hide_cursor:
+            restore += SHOW_CURSOR
+        if self.alt_screen:
+            restore += ALT_SCREEN_OFF
+        self._forward(restore)
+
+    def write(self, data: str) -> None:
+        if self.sync and self.active:
+            data = SYNC_BEGIN + data + SYNC_END
+        self._forward(data)
+
+    def write_bytes(self, payload: bytes) -> None:
+        if self.sync and self.active:
+            payload = _SYNC_BEGIN_BYTES + payload + _SYNC_END_BYTES
+        sink = self.sink
+        writes, flushes, sent = sink.writes, sink.flushes, sink.bytes_written
+        sink.write_bytes(payload)
+        self._count(writes, flushes, sent)
+
+    def _forward(self, data: str) -> None:
+        sink = self.sink
+        writes, flushes, sent = sink.writes, sink.flushes, sink.bytes_written
+        sink.write(data)
+        self._count(writes, flushes, sent)
+
+    def _count(self, writes: int, flushes: int, sent: int) -> None:
+        sink = self.sink
+        self.writes += sink.writes - writes
+        self.flushes += sink.flushes - flushes
+        self.bytes_written += sink.bytes_written - sent
+
+    def __enter__(self) -> Terminal:
+        self.open()
+        return self
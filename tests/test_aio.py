@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+from starpatterns import aio
+from starpatterns.patterns import animation
+from starpatterns.utils.scheduler import FrameScheduler, VirtualClock
+from starpatterns.utils.sink import MemorySink
+
+
+class ThreadSink(MemorySink):
+    """Memory sink that records which thread made each write."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads = []
+
+    def write(self, data: str) -> None:
+        self.threads.append(threading.get_ident())
+        super().write(data)
+
+
+def test_dna_helix_matches_sync_output():
+    expected = MemorySink()
+    animation.dna_helix(13, scheduler=FrameScheduler(clock=VirtualClock()), sink=expected)
+    sink = MemorySink()
+    asyncio.run(aio.dna_helix(13, scheduler=FrameScheduler(clock=VirtualClock()), sink=sink))
+    assert sink.getvalue() == expected.getvalue()
+
+
+def test_closing_line_is_written_off_the_event_loop_thread():
+    sink = ThreadSink()
+    asyncio.run(aio.countdown(2, scheduler=FrameScheduler(clock=VirtualClock()), sink=sink))
+    assert sink.getvalue().endswith("\rGo!        \n")
+    assert threading.get_ident() not in sink.threads
+
+
+def test_cancelled_spinner_still_prints_done_line():
+    sink = MemorySink()
+
+    async def main():
+        task = asyncio.ensure_future(aio.spinner("Load", interval=0.01, sink=sink))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+    assert sink.getvalue().endswith("\r[done] Load   \n")
@@ -0,0 +1,19 @@
+from starpatterns.patterns.animation import spinner
+from starpatterns.patterns.progress import Spinner
+from starpatterns.utils.scheduler import FrameScheduler, VirtualClock
+from starpatterns.utils.sink import MemorySink
+
+
+def test_spinner_animates_for_two_seconds_by_default():
+    clock = VirtualClock()
+    sink = MemorySink()
+    assert spinner("Load", interval=0.5, scheduler=FrameScheduler(clock=clock), sink=sink) is None
+    assert clock.now() >= 2.0
+    assert sink.getvalue().endswith("\r[done] Load   \n")
+
+
+def test_spinner_without_duration_returns_unstarted_spinner():
+    sink = MemorySink()
+    result = spinner("Load", duration=None, sink=sink)
+    assert isinstance(result, Spinner)
+    assert sink.writes == 0
@@ -0,0 +1,27 @@
+import pytest
+
+from starpatterns.patterns.frames import bar_wave_frames, fireworks_frames, twinkle_stars_frames
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("width", [1, 30, 500])
+def test_bar_wave_backends_match(width):
+    assert list(bar_wave_frames(width, 120, backend="numpy")) == list(bar_wave_frames(width, 120, backend="python"))
+
+
+@pytest.mark.parametrize("size", [3, 12, 61])
+def test_fireworks_backends_match(size):
+    assert list(fireworks_frames(2, size, "@", backend="numpy")) == list(fireworks_frames(2, size, "@", backend="python"))
+
+
+@pytest.mark.parametrize("width, height", [(1, 1), (40, 8), (200, 60)])
+def test_twinkle_stars_backends_match(width, height):
+    numpy_frames = twinkle_stars_frames(width, height, 20, 0.3, seed=7, backend="numpy")
+    python_frames = twinkle_stars_frames(width, height, 20, 0.3, seed=7, backend="python")
+    assert list(numpy_frames) == list(python_frames)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        bar_wave_frames(backend="fortran")
@@ -0,0 +1,29 @@
+import pytest
+
+from starpatterns.patterns import basic
+from starpatterns.patterns.cache import PatternCache
+
+
+def test_equivalent_calls_share_one_entry():
+    cache = PatternCache()
+    triangle = cache.wrap(basic.triangle)
+    results = {triangle(5), triangle(5, "*"), triangle(height=5), triangle(char="*", height=5)}
+    assert results == {basic.triangle(5)}
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+
+
+def test_different_arguments_get_their_own_entry():
+    cache = PatternCache()
+    triangle = cache.wrap(basic.triangle)
+    assert triangle(5, "#") == basic.triangle(5, "#")
+    assert triangle(5) == basic.triangle(5)
+    assert cache.cache_info().currsize == 2
+
+
+def test_bad_arguments_raise_type_error():
+    triangle = PatternCache().wrap(basic.triangle)
+    with pytest.raises(TypeError):
+        triangle()
+    with pytest.raises(TypeError):
+        triangle(5, bogus=1)
@@ -0,0 +1,55 @@
+import pytest
+
+from starpatterns.compositor import Compositor, Region
+
+
+def test_regions_are_blitted_side_by_side():
+    comp = Compositor(width=6, height=2, fill=".")
+    comp.add(["ab", "cd"], 0, 0, 2, 1)
+    comp.add([["x", "y"]], 3, 0, 2, 2)
+    assert list(comp.frames()) == [["ab.x .", "...y ."], ["cd.x .", "...y ."]]
+
+
+def test_short_source_keeps_its_last_frame():
+    comp = Compositor(width=4, height=1)
+    comp.add(["aaaa", "bbbb", "cccc"], 0, 0, 4, 1)
+    comp.add(["X"], 0, 0, 1, 1)
+    assert list(comp.frames()) == [["Xaaa"], ["Xbbb"], ["Xccc"]]
+
+
+def test_overlay_survives_changes_underneath():
+    comp = Compositor(width=6, height=1)
+    comp.add(["aaaaaa", "bbbbbb", "cccccc"], 0, 0, 6, 1)
+    comp.add(["XX", "XX", "XX"], 2, 0, 2, 1)
+    assert list(comp.frames()) == [["aaXXaa"], ["bbXXbb"], ["ccXXcc"]]
+
+
+def test_overlap_redraws_only_the_rows_it_covers():
+    comp = Compositor(width=6, height=2)
+    comp.add([["aaaaaa", "111111"], ["bbbbbb", "111111"], ["cccccc", "222222"]], 0, 0, 6, 2)
+    comp.add(["XX", "YY"], 2, 0, 2, 1)
+    comp.add([["Z"], ["Q"]], 4, 1, 1, 1)
+    assert list(comp.frames()) == [
+        ["aaXXaa", "1111Z1"],
+        ["bbYYbb", "1111Q1"],
+        ["ccYYcc", "2222Q2"],
+    ]
+
+
+def test_empty_source_draws_nothing_over_lower_regions():
+    comp = Compositor(width=3, height=1)
+    comp.add(["abc", "def"], 0, 0, 3, 1)
+    comp.add([], 0, 0, 3, 1)
+    assert list(comp.frames()) == [["abc"], ["def"]]
+
+
+def test_region_overlap():
+    assert Region(0, 0, 4, 2).overlaps(Region(3, 1, 2, 2))
+    assert not Region(0, 0, 4, 2).overlaps(Region(4, 0, 2, 2))
+    assert not Region(0, 0, 4, 2).overlaps(Region(0, 2, 4, 1))
+
+
+def test_region_must_fit_the_screen():
+    comp = Compositor(width=4, height=2)
+    with pytest.raises(ValueError):
+        comp.add(["x"], 3, 0, 2, 1)
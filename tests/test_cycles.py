@@ -0,0 +1,76 @@
+from itertools import islice
+
+import pytest
+
+from starpatterns.patterns import animation, cycles
+from starpatterns.patterns import frames as gen
+from starpatterns.utils.renderer import FrameRenderer
+from starpatterns.utils.scheduler import FrameScheduler, VirtualClock
+from starpatterns.utils.sink import MemorySink
+from starpatterns.utils.terminal import CURSOR_HOME
+
+
+def played(cycle, count):
+    return b"".join(cycle.payloads(count))
+
+
+def lines(frames):
+    return "".join("\r" + frame for frame in frames).encode()
+
+
+@pytest.mark.parametrize("count", [0, 1, 43, 44, 45, 200])
+def test_snake_line_cycle_matches_generator(count):
+    cycle = cycles.snake_line_cycle(30, 8, "O", "o")
+    assert played(cycle, count) == lines(gen.snake_line_frames(30, 8, count, "O", "o"))
+
+
+@pytest.mark.parametrize("count", [1, 35, 36, 37, 100])
+def test_bouncing_text_cycle_matches_generator(count):
+    assert played(cycles.bouncing_text_cycle("hi", 20), count) == lines(gen.bouncing_text_frames("hi", 20, count))
+
+
+@pytest.mark.parametrize("repeats", [1, 3])
+def test_marquee_and_pulse_cycles_match_generators(repeats):
+    cycle = cycles.marquee_cycle("hello", 12)
+    assert played(cycle, len(cycle.period) * repeats) == lines(gen.marquee_frames("hello", 12, repeats))
+    cycle = cycles.pulse_text_cycle("hi", 1, 5)
+    assert played(cycle, len(cycle.period) * repeats) == lines(gen.pulse_text_frames("hi", 1, 5, repeats))
+
+
+def test_spinner_and_carousel_cycles_match_generators():
+    assert played(cycles.spinner_cycle("Load"), 10) == lines(islice(gen.spinner_frames("Load"), 10))
+    assert played(cycles.carousel_cycle("Load"), 10) == lines(gen.carousel_frames("Load", 10))
+
+
+def test_dna_helix_cycle_matches_generator():
+    expected = "".join("\r" + top + "\n" + bottom + CURSOR_HOME for top, bottom in gen.dna_helix_frames(30))
+    assert played(cycles.dna_helix_cycle(), 30) == expected.encode()
+
+
+@pytest.mark.parametrize("bursts", [1, 2, 5])
+def test_fireworks_cycle_matches_rendered_generator(bursts):
+    cycle = cycles.fireworks_cycle(12, "*")
+    renderer = FrameRenderer()
+    expected = "\n" * 12 + "".join(map(renderer.render, gen.fireworks_frames(bursts, 12, "*"))) + renderer.finish() + "\n"
+    assert cycle.start + played(cycle, bursts * 6) + cycle.end == expected.encode()
+
+
+@pytest.mark.parametrize(
+    "play",
+    [
+        lambda **kw: animation.wave_text("wave", 3, **kw),
+        lambda **kw: animation.marquee("hello", 12, 2, **kw),
+        lambda **kw: animation.bouncing_text("hi", 20, 50, **kw),
+        lambda **kw: animation.pulse_text("hi", 1, 5, 2, **kw),
+        lambda **kw: animation.snake_line(30, 8, 70, **kw),
+    ],
+)
+def test_streamed_fallback_matches_cached_cycle(play, monkeypatch):
+    def output():
+        sink = MemorySink()
+        play(scheduler=FrameScheduler(clock=VirtualClock()), sink=sink)
+        return sink.getvalue()
+
+    cached = output()
+    monkeypatch.setattr(cycles, "MAX_CYCLE_BYTES", 0)
+    assert output() == cached
@@ -0,0 +1,55 @@
+from starpatterns.utils.renderer import FrameRenderer
+
+ROW = "." * 30
+
+
+def diff(new, old=ROW, merge_gap=6):
+    renderer = FrameRenderer(merge_gap)
+    renderer.render([old])
+    return renderer.render([new])
+
+
+def test_first_frame_is_painted_in_full():
+    assert FrameRenderer().render(["abcd", "efgh"]) == "\033[Habcd\nefgh"
+
+
+def test_unchanged_frame_writes_nothing():
+    renderer = FrameRenderer()
+    renderer.render([ROW, ROW])
+    assert renderer.render([ROW, ROW]) == ""
+
+
+def test_changed_cell_is_addressed_by_row_and_column():
+    renderer = FrameRenderer()
+    renderer.render([ROW, ROW])
+    assert renderer.render([ROW, ROW[:4] + "X" + ROW[5:]]) == "\033[2;5HX"
+
+
+def test_nearby_changes_merge_within_gap():
+    assert diff("..X..X" + "." * 24) == "\033[1;3HX..X"
+    assert diff("..X..X" + "." * 24, merge_gap=1) == "\033[1;3HX\033[1;6HX"
+
+
+def test_non_ascii_rows_diff_by_character():
+    old = "é" * 30
+    assert diff("é" * 3 + "X" + "é" * 16 + "Y" + "é" * 9, old, merge_gap=0) == "\033[1;4HX\033[1;21HY"
+
+
+def test_shorter_row_is_erased_to_end_of_line():
+    renderer = FrameRenderer()
+    renderer.render([ROW, ROW])
+    assert renderer.render([ROW, ROW[:10]]) == "\033[2;11H\033[K"
+    assert renderer.bytes_saved == renderer.bytes_full - renderer.bytes_written > 0
+
+
+def test_full_repaint_when_cheaper_than_diff():
+    renderer = FrameRenderer()
+    renderer.render(["ab"])
+    assert renderer.render(["XY"]) == "\033[HXY"
+
+
+def test_finish_parks_cursor_after_last_row():
+    renderer = FrameRenderer()
+    assert renderer.finish() == ""
+    renderer.render(["abcd", "ef"])
+    assert renderer.finish() == "\033[2;3H"
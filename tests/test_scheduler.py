@@ -0,0 +1,53 @@
+import pytest
+
+from starpatterns.utils.scheduler import FrameScheduler, VirtualClock
+
+
+def test_frames_are_presented_on_absolute_deadlines():
+    clock = VirtualClock()
+    scheduler = FrameScheduler(clock=clock)
+    presented = [(frame, clock.now()) for frame in scheduler.pace("abcd", 0.5)]
+    assert presented == [("a", 0.0), ("b", 0.5), ("c", 1.0), ("d", 1.5)]
+    # The last frame is held for a full interval.
+    assert clock.now() == 2.0
+    assert scheduler.frames == 4
+    assert scheduler.achieved_fps == 2.0
+    assert scheduler.jitter == 0.0
+
+
+def test_duration_stops_the_run():
+    clock = VirtualClock()
+    assert list(FrameScheduler(clock=clock).pace(range(100), 0.1, duration=0.35)) == [0, 1, 2, 3]
+    assert clock.now() == pytest.approx(0.4)
+
+
+def test_slow_frames_are_dropped_but_the_last_is_kept():
+    clock = VirtualClock()
+    scheduler = FrameScheduler(clock=clock, drop_frames=True)
+    presented = []
+    for frame in scheduler.pace(range(10), 0.1):
+        presented.append(frame)
+        clock.advance(0.25)
+    assert presented[-1] == 9
+    assert scheduler.frames == len(presented) < 10
+    assert scheduler.dropped == 10 - len(presented)
+
+
+def test_work_is_absorbed_by_the_deadline():
+    clock = VirtualClock()
+    for _ in FrameScheduler(clock=clock).pace(range(5), 0.1):
+        clock.advance(0.05)
+    assert clock.now() == pytest.approx(0.5)
+
+
+def test_hooks_receive_one_event_per_frame():
+    events = []
+    scheduler = FrameScheduler(clock=VirtualClock(), hooks=[events.append])
+    list(scheduler.pace("ab", 1.0))
+    assert [event.index for event in events] == [0, 1]
+    assert [event.sleep_scheduled for event in events] == [0.0, 1.0]
+
+
+def test_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        list(FrameScheduler(clock=VirtualClock()).pace("ab", 0))